@@ -33,3 +33,9 @@ def modify_attrs(doc: str, attributes: str = "") -> str:
         flags=re.MULTILINE,
     )
     return result
+
+
+def summarize(doc: str) -> str:
+    """First paragraph of the docstring in a single line."""
+    first = doc.strip().split("\n\n", 1)[0]
+    return " ".join(first.split())
@@ -0,0 +1,48 @@
+"""
+Find changed modules with git.
+"""
+
+import pathlib
+import subprocess
+from collections.abc import Collection
+from types import ModuleType
+
+
+def _git(*args: str) -> list[str]:
+    completed = subprocess.run(
+        ["git", *args], check=True, capture_output=True, text=True
+    )
+    return completed.stdout.splitlines()
+
+
+def changed_files(ref: str) -> set[pathlib.Path]:
+    """
+    Python files changed since `ref` , including deleted and untracked files. Renamed
+    files are listed with both paths, so dependents of the old module are rebuilt.
+    """
+    top = pathlib.Path(_git("rev-parse", "--show-toplevel")[0])
+    names = _git("diff", "--name-only", "--no-renames", ref, "--")
+    names += _git("ls-files", "--others", "--exclude-standard")
+    return {(top / n).resolve() for n in names if n.endswith(".py")}
+
+
+def to_module_names(root: ModuleType, files: Collection[pathlib.Path]) -> set[str]:
+    """
+    Map files to public module names under `root` . Other files are ignored.
+    """
+    root_file = pathlib.Path(root.__file__ or "").resolve()
+    if root_file.name != "__init__.py":
+        return {root.__name__} if root_file in files else set()
+
+    names = set()
+    for file in files:
+        try:
+            parts = file.relative_to(root_file.parent).with_suffix("").parts
+        except ValueError:
+            continue
+        if parts[-1] == "__init__":
+            parts = parts[:-1]
+        if any(p.startswith("_") for p in parts):
+            continue
+        names.add(".".join([root.__name__, *parts]))
+    return names
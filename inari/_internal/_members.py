@@ -0,0 +1,102 @@
+"""
+Member index of classes, built from `__dict__` instead of `inspect.getmembers` .
+"""
+
+import inspect
+from typing import Any, NamedTuple
+from weakref import WeakKeyDictionary
+
+
+class ClassMembers(NamedTuple):
+    """Public properties including inherited ones, and methods defined in the class.
+    Both are sorted by names."""
+
+    properties: list[tuple[str, property]]
+    methods: list[tuple[str, Any]]
+
+
+_indexes: "WeakKeyDictionary[type, ClassMembers]" = WeakKeyDictionary()
+_own: "WeakKeyDictionary[type, tuple[frozenset[str], dict[str, property]]]" = (
+    WeakKeyDictionary()
+)
+_properties: "WeakKeyDictionary[type, dict[str, property]]" = WeakKeyDictionary()
+
+
+def _own_properties(cls: type) -> tuple[frozenset[str], dict[str, property]]:
+    """Names in `cls.__dict__` , and properties among them. Classified once."""
+    try:
+        return _own[cls]
+    except (KeyError, TypeError):
+        pass
+    namespace = vars(cls)
+    own = (
+        frozenset(namespace),
+        {k: v for k, v in namespace.items() if v.__class__ is property},
+    )
+    try:
+        _own[cls] = own
+    except TypeError:
+        pass
+    return own
+
+
+def _resolved_properties(cls: type) -> dict[str, property]:
+    """
+    Properties visible from `cls` . Each name is resolved from the first class in
+    the MRO defining it, so other attributes hide properties of later classes.
+    """
+    try:
+        return _properties[cls]
+    except (KeyError, TypeError):
+        pass
+    resolved: dict[str, property] = {}
+    seen: set[str] = set()
+    for klass in cls.__mro__:
+        names, properties = _own_properties(klass)
+        for name in names - seen:
+            if name in properties:
+                resolved[name] = properties[name]
+        seen.update(names)
+    try:
+        _properties[cls] = resolved
+    except TypeError:
+        pass
+    return resolved
+
+
+def class_members(cls: type) -> ClassMembers:
+    """
+    Classify members of the class in one pass over its own `__dict__` . Properties
+    of base classes are taken from their indexes.
+    """
+    try:
+        return _indexes[cls]
+    except (KeyError, TypeError):
+        pass
+    properties = sorted(
+        (name, p)
+        for name, p in _resolved_properties(cls).items()
+        if not name.startswith("_")
+    )
+    methods = []
+    for name, value in vars(cls).items():
+        if name.startswith("_") or value.__class__ is property:
+            continue
+        try:
+            # bound form, same as `getattr` .
+            member = getattr(cls, name)
+        except AttributeError:
+            continue
+        if (
+            inspect.isroutine(member)
+            and getattr(member, "__qualname__", "").startswith(cls.__qualname__)
+            and not inspect.isbuiltin(member)
+        ):
+            methods.append((name, member))
+    methods.sort(key=lambda x: x[0])
+    members = ClassMembers(properties, methods)
+    try:
+        _indexes[cls] = members
+    except TypeError:
+        pass
+    return members
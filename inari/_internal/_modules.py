@@ -0,0 +1,51 @@
+"""
+Find modules from the file system without importing them.
+"""
+
+import importlib.util
+import pathlib
+from collections.abc import Iterator
+
+
+def _walk(name: str, path: pathlib.Path) -> Iterator[tuple[str, bool]]:
+    """Yield public submodules in the package directory without importing them."""
+    for entry in sorted(path.iterdir()):
+        if entry.name.startswith("_"):
+            continue
+        if entry.is_dir() and (entry / "__init__.py").is_file():
+            yield f"{name}.{entry.name}", True
+            yield from _walk(f"{name}.{entry.name}", entry)
+        elif entry.suffix == ".py":
+            yield f"{name}.{entry.stem}", False
+
+
+def find_modules(root_name: str) -> dict[str, str]:
+    """
+    Find modules under the root without importing them.
+
+    **Args**
+
+    * root_name (`str`): Root module.
+
+    **Returns**
+
+    * `dict[str, str]`: Same form as `inari.collectors.BaseCollector.name_to_path` ,
+        only with modules.
+
+    """
+    spec = importlib.util.find_spec(root_name)
+    if not spec:
+        raise ModuleNotFoundError(f"No module named {root_name!r}")
+
+    def to_path(name: str, is_package: bool) -> str:
+        path = "/" + name.replace(".", "/")
+        return path if is_package else path + "-py"
+
+    locations = spec.submodule_search_locations
+    if not locations:
+        return {root_name: to_path(root_name, False)}
+    modules = {root_name: to_path(root_name, True)}
+    for location in locations:
+        for name, is_package in _walk(root_name, pathlib.Path(location)):
+            modules[name] = to_path(name, is_package)
+    return modules
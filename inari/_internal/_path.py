@@ -2,13 +2,74 @@
 
 
 import os
+import posixpath
 from pathlib import PurePosixPath
 
 
 def get_relative_path(current_page: str, link_to: str) -> str:
     current_path = PurePosixPath(current_page)
     current_dir = current_path.parent
-    relpath = os.path.relpath(link_to, current_dir)
+    link_path = PurePosixPath(link_to)
+    # resolve the parent first, `link_to` may be a parent of `current_dir` .
+    relpath = posixpath.normpath(
+        posixpath.join(os.path.relpath(link_path.parent, current_dir), link_path.name)
+    )
     if relpath == current_path.name:
         return ""
     return relpath
+
+
+PAGE_SUFFIXES = ("-py", "-cls")
+"""Paths ending with these are pages, others are directories with `index` ."""
+
+
+def to_page(abs_path: str) -> str:
+    """`/module/name` -> `/module/name/index` , `/module/name-py` is kept."""
+    if abs_path.endswith(PAGE_SUFFIXES):
+        return abs_path
+    return f"{abs_path}/index".replace("//", "/")
+
+
+def path_to_name(abs_path: str) -> str:
+    """`/module/name-py#Class.method` -> `module.name.Class.method`"""
+    page, _, hash_ = abs_path.partition("#")
+    module_name = ".".join(
+        [n.removesuffix("-py") for n in page.split("/") if n and not n.endswith("-cls")]
+    )
+    if hash_:
+        return f"{module_name}.{hash_}"
+    return module_name
+
+
+def make_relpaths(
+    name_to_path: dict[str, str], current_page: str, suffix: str = ".md"
+) -> dict[str, tuple[str, str]]:
+    """Relative paths and hashes of names, seen from `current_page` ."""
+    relpaths: dict[str, tuple[str, str]] = {}
+    for name, path in name_to_path.items():
+        if "#" in path:
+            relpath, hash_ = path.split("#")
+            hash_ = "#" + hash_
+        else:
+            relpath, hash_ = path, ""
+
+        relpath = get_relative_path(current_page, to_page(relpath))
+
+        if relpath:
+            relpath = relpath + suffix
+
+        relpaths[name] = (relpath, hash_)
+    return relpaths
+
+
+def link_names(doc: str, relpaths: dict[str, tuple[str, str]]) -> str:
+    """Replace back-quoted names with links. Linked names are not replaced again."""
+    for long_name, rel_hash in relpaths.items():
+        _, hash_id = rel_hash
+        if hash_id:
+            short_name = hash_id.removeprefix("#")
+        else:
+            short_name = long_name.rsplit(".", 1)[-1]
+        # append a space after short_name because of avoiding unexpected replacing.
+        doc = doc.replace(f"`{long_name}`", f"[`{short_name} `]({''.join(rel_hash)})")
+    return doc
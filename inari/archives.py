@@ -0,0 +1,645 @@
+"""
+archives - Document wheels and source distributions without installing them.
+
+Python files are read from the archive into memory, and nothing is extracted. Each
+module is imported as a stub made from its syntax tree: bodies of functions are
+dropped, other decorators than `property` , `staticmethod` and `classmethod` are
+dropped, and variables keep only literal values, names of other stubs and a few
+calls like `enum.auto()` . Imports of modules outside the archive and the standard
+library are replaced by placeholders, so dependencies are not needed and no code in
+the archive is run.
+
+Stubs keep names, signatures, docstrings and sources of the original, so pages are
+the same as installed modules, except for members created at runtime.
+"""
+
+import ast
+import builtins
+import enum
+import functools
+import importlib
+import importlib.abc
+import importlib.machinery
+import io
+import linecache
+import operator
+import os
+import pathlib
+import sys
+import sysconfig
+import tarfile
+import time
+import typing
+import zipfile
+from collections import ChainMap
+from collections.abc import Collection, Iterator, Mapping, MutableMapping, Sequence
+from types import ModuleType, TracebackType
+from typing import Any, Callable, NamedTuple, Optional, Union
+
+ARCHIVE_SUFFIXES = (".whl", ".tar.gz", ".tgz")
+"""(`tuple[str, ...]`): Wheels and gzipped source distributions."""
+
+_SDIST_IGNORED = {
+    "benchmarks",
+    "conftest",
+    "docs",
+    "examples",
+    "noxfile",
+    "setup",
+    "test",
+    "tests",
+}
+_DECORATORS = {"property", "staticmethod", "classmethod"}
+_ACCESSORS = {"getter", "setter", "deleter"}
+_COMPARISONS: dict[type[ast.cmpop], Callable[[Any, Any], Any]] = {
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+}
+_CALLS = {
+    x
+    for x in [
+        enum.auto,
+        typing.NewType,
+        # Python 3.10 or later.
+        getattr(typing, "ParamSpec", None),
+        typing.TypeVar,
+    ]
+    if x is not None
+}
+
+
+def is_archive(name: str) -> bool:
+    """`True` if the name is a path to an existing wheel or source distribution."""
+    return name.endswith(ARCHIVE_SUFFIXES) and os.path.isfile(name)
+
+
+class _Source(NamedTuple):
+    filename: str
+    text: str
+    mtime: float
+    is_package: bool
+
+
+class Placeholder:
+    """
+    Stands for a value which is not evaluated, like an object imported from a
+    dependency. Used as a base class, it is replaced by an empty class of the same
+    name.
+
+    **Attributes**
+
+    * module (`str`): Module of the original object. Blank for expressions.
+    * name (`str`): Qualified name or source of the original object.
+
+    """
+
+    module: str
+    name: str
+
+    def __init__(self, module: str, name: str) -> None:
+        self.module = module
+        self.name = name
+
+    def __repr__(self) -> str:
+        return f"{self.module}.{self.name}" if self.module else self.name
+
+    def as_class(self) -> type:
+        """Empty class with the same module and name."""
+        cls = type(self.name.rsplit(".", 1)[-1], (), {})
+        cls.__module__ = self.module or "builtins"
+        cls.__qualname__ = self.name
+        return cls
+
+
+def _is_type_checking(test: ast.expr) -> bool:
+    if isinstance(test, ast.Name):
+        return test.id == "TYPE_CHECKING"
+    return isinstance(test, ast.Attribute) and test.attr == "TYPE_CHECKING"
+
+
+def _is_stdlib(name: str) -> bool:
+    top = name.split(".", 1)[0]
+    names: Optional[frozenset[str]] = getattr(sys, "stdlib_module_names", None)
+    if names is not None:
+        return top in names
+    return _in_stdlib_dir(top)
+
+
+@functools.lru_cache(maxsize=None)
+def _in_stdlib_dir(top: str) -> bool:
+    """For Python 3.9, find the module in directories of the standard library."""
+    if top in sys.builtin_module_names:
+        return True
+    # not found by importers of archives.
+    spec = importlib.machinery.PathFinder.find_spec(top)
+    if spec is None:
+        return False
+    if spec.origin in ("built-in", "frozen"):
+        return True
+    locations = [spec.origin, *(spec.submodule_search_locations or [])]
+    paths = sysconfig.get_paths()
+    stdlib_dirs = {os.path.realpath(paths[x]) for x in ["stdlib", "platstdlib"]}
+    for location in locations:
+        if not location:
+            continue
+        parent = os.path.dirname(os.path.realpath(location))
+        if parent in stdlib_dirs or (
+            os.path.basename(parent) == "lib-dynload"
+            and os.path.dirname(parent) in stdlib_dirs
+        ):
+            return True
+    return False
+
+
+def _decorator_name(decorator: ast.expr) -> str:
+    if isinstance(decorator, ast.Name):
+        return decorator.id
+    if isinstance(decorator, ast.Attribute):
+        return decorator.attr
+    return ""
+
+
+class ArchiveImporter(importlib.abc.MetaPathFinder, importlib.abc.Loader):
+    """
+    Import modules of a wheel or a source distribution as stubs. Use it as a
+    context manager: stubs replace modules of the same names while it is active.
+
+    **Attributes**
+
+    * path (`pathlib.Path`): Archive file.
+    * sources (`dict[str, _Source]`): Sources keyed by module names.
+
+    """
+
+    path: pathlib.Path
+    sources: dict[str, _Source]
+
+    _saved: dict[str, ModuleType]
+    _dirs: dict[str, "_PackageDir"]
+
+    def __init__(self, path: Union[str, os.PathLike[str]]) -> None:
+        """
+        **Args**
+
+        * path (`Union[str, Path]`): Wheel (`.whl`) or source distribution
+            (`.tar.gz`).
+
+        """
+        self.path = pathlib.Path(path).resolve()
+        self.sources = {}
+        self._saved = {}
+        self._dirs = {}
+        files = dict(self._read_files())
+        if self.path.name.endswith(".whl"):
+            self._add_modules(files, "")
+        else:
+            top = {name.split("/", 1)[0] for name in files}
+            for root in sorted(top):
+                src = f"{root}/src/"
+                if any(x.startswith(src) for x in files):
+                    self._add_modules(files, src)
+                else:
+                    self._add_modules(files, f"{root}/", _SDIST_IGNORED)
+
+    def _read_files(self) -> Iterator[tuple[str, tuple[str, float]]]:
+        """Python files and modified time in the archive."""
+        if self.path.name.endswith(".whl"):
+            with zipfile.ZipFile(self.path) as wheel:
+                for info in wheel.infolist():
+                    if info.filename.endswith(".py"):
+                        text = wheel.read(info).decode("utf-8")
+                        mtime = time.mktime((*info.date_time, 0, 0, -1))
+                        yield info.filename, (text, mtime)
+            return
+        with tarfile.open(self.path, mode="r:*") as sdist:
+            for member in sdist.getmembers():
+                if not member.isfile() or not member.name.endswith(".py"):
+                    continue
+                f = sdist.extractfile(member)
+                if f:
+                    with io.TextIOWrapper(f, encoding="utf-8") as reader:
+                        yield member.name, (reader.read(), float(member.mtime))
+
+    def _add_modules(
+        self,
+        files: dict[str, tuple[str, float]],
+        prefix: str,
+        ignored: Collection[str] = (),
+    ) -> None:
+        for name, (text, mtime) in files.items():
+            if not name.startswith(prefix):
+                continue
+            parts = name.removeprefix(prefix).removesuffix(".py").split("/")
+            if not all(x.isidentifier() for x in parts) or parts[0] in ignored:
+                continue
+            is_package = parts[-1] == "__init__"
+            if is_package:
+                parts.pop()
+            # namespace packages are not supported.
+            if any(
+                prefix + "/".join([*parts[:i], "__init__.py"]) not in files
+                for i in range(1, len(parts))
+            ):
+                continue
+            filename = os.fspath(self.path / name)
+            self.sources[".".join(parts)] = _Source(filename, text, mtime, is_package)
+
+    def top_level(self) -> list[str]:
+        """Public modules and packages at the top level, sorted by names."""
+        return sorted(x for x in self.sources if "." not in x and not x.startswith("_"))
+
+    def __enter__(self) -> "ArchiveImporter":
+        for name in self.sources:
+            if name in sys.modules:
+                self._saved[name] = sys.modules.pop(name)
+        for name, source in self.sources.items():
+            if source.is_package:
+                location = os.path.dirname(source.filename)
+                self._dirs[location] = _PackageDir(self, name)
+        sys.path_importer_cache.update(self._dirs)
+        sys.meta_path.insert(0, self)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        sys.meta_path.remove(self)
+        for location in self._dirs:
+            sys.path_importer_cache.pop(location, None)
+        self._dirs.clear()
+        for name, source in self.sources.items():
+            sys.modules.pop(name, None)
+            linecache.cache.pop(source.filename, None)
+        sys.modules.update(self._saved)
+        self._saved.clear()
+
+    def find_spec(
+        self, fullname: str, path: Any = None, target: Any = None
+    ) -> Optional[importlib.machinery.ModuleSpec]:
+        """Meta path finder of modules in the archive."""
+        source = self.sources.get(fullname)
+        if source is None:
+            return None
+        spec = importlib.machinery.ModuleSpec(
+            fullname, self, origin=source.filename, is_package=source.is_package
+        )
+        spec.has_location = True
+        if source.is_package:
+            spec.submodule_search_locations = [os.path.dirname(source.filename)]
+        return spec
+
+    def create_module(self, spec: importlib.machinery.ModuleSpec) -> None:
+        return None
+
+    def exec_module(self, module: ModuleType) -> None:
+        """Define stubs of the module."""
+        source = self.sources[module.__name__]
+        tree = ast.parse(source.text, source.filename)
+        module.__doc__ = ast.get_docstring(tree, clean=False)
+        _Stubs(self, module).define(tree.body, source.filename)
+
+    def get_source(self, fullname: str) -> str:
+        return self.sources[fullname].text
+
+    def is_package(self, fullname: str) -> bool:
+        return self.sources[fullname].is_package
+
+    def get_filename(self, fullname: str) -> str:
+        return self.sources[fullname].filename
+
+    def _by_filename(self, path: str) -> _Source:
+        for source in self.sources.values():
+            if source.filename == path:
+                return source
+        raise OSError(f"Not in {self.path}: {path}")
+
+    def path_stats(self, path: str) -> dict[str, Any]:
+        """Same as `importlib.abc.SourceLoader.path_stats` , from the archive."""
+        source = self._by_filename(path)
+        return {"mtime": source.mtime, "size": len(source.text.encode("utf-8"))}
+
+    def get_data(self, path: str) -> bytes:
+        """Same as `importlib.abc.ResourceLoader.get_data` , for Python files."""
+        return self._by_filename(path).text.encode("utf-8")
+
+    def import_stub(self, name: str, attribute: str = "") -> Any:
+        """
+        **Args**
+
+        * name (`str`): Module name.
+        * attribute (`str`): Name in the module.
+
+        **Returns**
+
+        * `Any`: Stub of the module or its member, the standard library, or
+            `Placeholder` if it is in neither.
+
+        """
+        if name in self.sources or _is_stdlib(name):
+            try:
+                value = importlib.import_module(name)
+                return getattr(value, attribute) if attribute else value
+            except (ImportError, AttributeError):
+                # partially defined by circular imports.
+                pass
+        return Placeholder(name, attribute) if attribute else Placeholder("", name)
+
+
+class _Stubs:
+    """Define stubs in the namespace of a module, statement by statement."""
+
+    def __init__(self, importer: ArchiveImporter, module: ModuleType) -> None:
+        self.importer = importer
+        self.name = module.__name__
+        self.namespace = vars(module)
+        self.held: list[str] = []
+        self.postponed = False
+
+    def define(self, body: Sequence[ast.stmt], filename: str) -> None:
+        self.postponed = any(
+            isinstance(x, ast.ImportFrom)
+            and x.module == "__future__"
+            and any(alias.name == "annotations" for alias in x.names)
+            for x in body
+        )
+        for node in self.stub_body(body, self.namespace):
+            code = compile(ast.Module([node], []), filename, "exec")
+            try:
+                exec(code, self.namespace)
+            except Exception:
+                # like names bound by skipped statements.
+                pass
+        for key in self.held:
+            self.namespace.pop(key, None)
+
+    def hold(self, value: Any) -> ast.Name:
+        """Pass the value to stubs by a temporary global name."""
+        key = f"__inari_{len(self.held)}__"
+        self.held.append(key)
+        self.namespace[key] = value
+        return ast.Name(key, ast.Load())
+
+    def stub_body(
+        self, body: Sequence[ast.stmt], scope: MutableMapping[str, Any]
+    ) -> Iterator[ast.stmt]:
+        """
+        Statements defining stubs. Values are resolved from `scope` , which is
+        updated with bound names.
+        """
+        for node in body:
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                if scope is self.namespace and node.name.startswith("__"):
+                    # module `__getattr__` returning `None` breaks `inspect` .
+                    continue
+                stub = self.stub_function(node, scope)
+                if stub:
+                    yield stub
+            elif isinstance(node, ast.ClassDef):
+                yield self.stub_class(node, scope)
+            elif isinstance(node, (ast.Import, ast.ImportFrom)):
+                yield from self.bind(node, self.imports(node), scope)
+            elif isinstance(node, (ast.Assign, ast.AnnAssign)) and node.value:
+                targets = (
+                    node.targets if isinstance(node, ast.Assign) else [node.target]
+                )
+                names = [x.id for x in targets if isinstance(x, ast.Name)]
+                value = self.evaluate(node.value, scope)
+                yield from self.bind(node, {x: value for x in names}, scope)
+            elif isinstance(node, ast.If):
+                yield from self.stub_body(self.branch(node, scope), scope)
+            elif isinstance(node, ast.Try):
+                yield from self.stub_body(node.body, scope)
+
+    def branch(self, node: ast.If, scope: Mapping[str, Any]) -> list[ast.stmt]:
+        """
+        Statements run on this Python, if the test compares `sys.version_info` or
+        `sys.platform` . The `else` branch of `TYPE_CHECKING` , otherwise the first.
+        """
+        test = node.test
+        if _is_type_checking(test):
+            return node.orelse
+        if isinstance(test, ast.Compare) and len(test.ops) == 1:
+            left = self.resolve(test.left, scope)
+            right = self.evaluate(test.comparators[0], scope)
+            compare = _COMPARISONS.get(type(test.ops[0]))
+            if compare and left in (sys.version_info, sys.platform):
+                return node.body if compare(left, right) else node.orelse
+        return node.body
+
+    def stub_function(
+        self,
+        node: Union[ast.FunctionDef, ast.AsyncFunctionDef],
+        scope: Mapping[str, Any],
+    ) -> Optional[ast.stmt]:
+        """Keep the name, parameters and docstring."""
+        if any(
+            isinstance(x, ast.Attribute) and x.attr in _ACCESSORS
+            for x in node.decorator_list
+        ):
+            # accessors of properties are documented with the getter.
+            return None
+        args = node.args
+        for arg in [*args.posonlyargs, *args.args, *args.kwonlyargs]:
+            arg.annotation = self.annotation(arg.annotation, scope)
+        for var_arg in [args.vararg, args.kwarg]:
+            if var_arg:
+                var_arg.annotation = self.annotation(var_arg.annotation, scope)
+        args.defaults = [self.hold(self.evaluate(x, scope)) for x in args.defaults]
+        args.kw_defaults = [
+            x and self.hold(self.evaluate(x, scope)) for x in args.kw_defaults
+        ]
+        names = [_decorator_name(x) for x in node.decorator_list]
+        docstring = node.body[0] if ast.get_docstring(node, clean=False) else None
+        stub = ast.FunctionDef(
+            name=node.name,
+            args=args,
+            body=[docstring] if docstring else [ast.Pass()],
+            decorator_list=[
+                ast.Name(name, ast.Load()) for name in names if name in _DECORATORS
+            ],
+            returns=self.annotation(node.returns, scope),
+            type_comment=None,
+        )
+        return ast.fix_missing_locations(ast.copy_location(stub, node))
+
+    def annotation(
+        self, node: Optional[ast.expr], scope: Mapping[str, Any]
+    ) -> Optional[ast.expr]:
+        """Strings if evaluation is postponed, or resolved values."""
+        if node is None:
+            return None
+        if self.postponed:
+            return ast.Constant(ast.unparse(node))
+        return self.hold(self.evaluate(node, scope))
+
+    def evaluate(self, node: ast.expr, scope: Mapping[str, Any]) -> Any:
+        """Literals, calls of the standard library like `enum.auto()` , or values of
+        `resolve` ."""
+        try:
+            return ast.literal_eval(node)
+        except (ValueError, TypeError, SyntaxError, RecursionError):
+            pass
+        if isinstance(node, ast.Call) and self.resolve(node.func, scope) in _CALLS:
+            func = self.resolve(node.func, scope)
+            try:
+                return func(
+                    *[self.evaluate(x, scope) for x in node.args],
+                    **{
+                        x.arg: self.evaluate(x.value, scope)
+                        for x in node.keywords
+                        if x.arg
+                    },
+                )
+            except Exception:
+                # like unsupported arguments.
+                pass
+        return self.resolve(node, scope)
+
+    def subscript(self, node: ast.Subscript, scope: Mapping[str, Any]) -> Any:
+        """Subscripted generic classes like `Base[T]` , or `Base` without types."""
+        origin = self.resolve(node.value, scope)
+        if isinstance(origin, Placeholder):
+            return origin
+        elts = node.slice.elts if isinstance(node.slice, ast.Tuple) else [node.slice]
+        try:
+            value = origin[tuple(self.evaluate(x, scope) for x in elts)]
+        except Exception:
+            value = None
+        if hasattr(value, "__mro_entries__"):
+            return value
+        # stubs of `__class_getitem__` return `None` , and plain `Generic` is not a
+        # base class.
+        return None if origin is typing.Generic else origin
+
+    def bind(
+        self, node: ast.stmt, values: dict[str, Any], scope: MutableMapping[str, Any]
+    ) -> Iterator[ast.stmt]:
+        scope.update(values)
+        for name, value in values.items():
+            assign = ast.Assign([ast.Name(name, ast.Store())], self.hold(value))
+            yield ast.fix_missing_locations(ast.copy_location(assign, node))
+
+    def stub_class(
+        self, node: ast.ClassDef, scope: MutableMapping[str, Any]
+    ) -> ast.stmt:
+        """Keep the name, docstring, resolved bases and stubs of members."""
+        bases: list[ast.expr] = []
+        for base in node.bases:
+            if isinstance(base, ast.Subscript):
+                value = self.subscript(base, scope)
+            else:
+                value = self.resolve(base, scope)
+            if isinstance(value, Placeholder):
+                value = value.as_class()
+            if isinstance(value, type) or hasattr(value, "__mro_entries__"):
+                # like `Generic[T]` and `TypedDict` .
+                bases.append(self.hold(value))
+        docstring = node.body[0] if ast.get_docstring(node, clean=False) else None
+        body = list(self.stub_body(node.body, ChainMap({}, scope)))
+        stub = ast.ClassDef(
+            name=node.name,
+            bases=bases,
+            keywords=[],
+            body=[*([docstring] if docstring else []), *body] or [ast.Pass()],
+            decorator_list=[],
+        )
+        return ast.fix_missing_locations(ast.copy_location(stub, node))
+
+    def imports(self, node: Union[ast.Import, ast.ImportFrom]) -> dict[str, Any]:
+        """Names bound by the import statement."""
+        values = {}
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                top = alias.name.split(".", 1)[0]
+                value = self.importer.import_stub(alias.name)
+                if not alias.asname:
+                    # submodules are bound as attributes of the package.
+                    value = self.importer.import_stub(top)
+                values[alias.asname or top] = value
+            return values
+        base = node.module or ""
+        if node.level:
+            parts = self.name.split(".")
+            if not self.importer.sources[self.name].is_package:
+                parts.pop()
+            parts = parts[: len(parts) - node.level + 1]
+            base = ".".join([*parts, *([node.module] if node.module else [])])
+        for alias in node.names:
+            if alias.name == "*":
+                continue
+            if f"{base}.{alias.name}" in self.importer.sources:
+                value = self.importer.import_stub(f"{base}.{alias.name}")
+            else:
+                value = self.importer.import_stub(base, alias.name)
+            values[alias.asname or alias.name] = value
+        return values
+
+    def resolve(self, node: ast.expr, scope: Mapping[str, Any]) -> Any:
+        """Look up names and attributes. Other expressions are placeholders."""
+        if isinstance(node, ast.Name):
+            if node.id in scope:
+                return scope[node.id]
+            if hasattr(builtins, node.id):
+                return getattr(builtins, node.id)
+        elif isinstance(node, ast.Attribute):
+            value = self.resolve(node.value, scope)
+            if isinstance(value, Placeholder):
+                return Placeholder(repr(value), node.attr)
+            if isinstance(value, ModuleType) and hasattr(value, node.attr):
+                return getattr(value, node.attr)
+            if isinstance(value, type) and node.attr in vars(value):
+                return getattr(value, node.attr)
+        return Placeholder("", ast.unparse(node))
+
+
+class _PackageDir:
+    """Path entry of a package in the archive, to list its submodules."""
+
+    def __init__(self, importer: ArchiveImporter, package: str) -> None:
+        self.importer = importer
+        self.package = package
+
+    def find_spec(
+        self, fullname: str, target: Any = None
+    ) -> Optional[importlib.machinery.ModuleSpec]:
+        return self.importer.find_spec(fullname)
+
+    def iter_modules(self, prefix: str = "") -> Iterator[tuple[str, bool]]:
+        """Same as `pkgutil.iter_modules` for directories."""
+        for name, source in sorted(self.importer.sources.items()):
+            parent, _, short = name.rpartition(".")
+            if parent == self.package:
+                yield prefix + short, source.is_package
+
+
+def expand_roots(names: Sequence[str]) -> tuple[list[str], list[ArchiveImporter]]:
+    """
+    Replace paths to archives by their top-level modules.
+
+    **Args**
+
+    * names (`Sequence[str]`): Module names or paths to archives.
+
+    **Returns**
+
+    * `tuple[list[str], list[ArchiveImporter]]`: Module names, and importers to
+        enter before importing them.
+
+    """
+    roots: list[str] = []
+    importers = []
+    for name in names:
+        if not is_archive(name):
+            roots.append(name)
+            continue
+        importer = ArchiveImporter(name)
+        importers.append(importer)
+        roots.extend(importer.top_level())
+    return roots, importers
@@ -0,0 +1,200 @@
+"""
+build - Build documents of one or more root modules in one run.
+
+All roots share `name_to_path` , so links between roots are resolved.
+
+Pages may be rendered in threads after all modules are collected. Rendering only
+reads collectors, so threads share one import of documented modules. Threads run
+in parallel on free-threaded Python, and take turns holding the GIL otherwise.
+"""
+
+import os
+import pathlib
+import sys
+import time
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import Executor, ThreadPoolExecutor
+from types import ModuleType
+from typing import Any, Optional, Union
+
+from .collectors import ModuleCollector
+from .hooks import hooks
+from .index import SymbolIndex, index_path
+from .memory import MemoryProfiler
+
+
+def make_roots(
+    modules: Sequence[ModuleType],
+    out_dir: Union[str, os.PathLike[str]],
+    out_name: Optional[str] = None,
+    name_to_path: Optional[dict[str, str]] = None,
+    **options: Any,
+) -> list[ModuleCollector]:
+    """
+    Wrap root modules by collectors sharing `name_to_path` .
+
+    **Args**
+
+    * modules (`Sequence[ModuleType]`): Root modules.
+    * out_dir (`Union[str, Path]`): Output directory.
+    * out_name (`Optional[str]`): With one root, the name of its directory/file.
+        With several roots, a directory to put them in, like `{out_dir}/{out_name}/
+        {root}` . Dotted roots like `pkg.sub` are put in `{root}/{sub}` so that
+        relative links between roots work.
+    * name_to_path (`Optional[dict[str, str]]`): Shared mapping. Created if omitted.
+    * options (`Any`): Passed to `inari.collectors.ModuleCollector` .
+
+    **Returns**
+
+    * `list[ModuleCollector]`: Collectors in the same order as `modules` .
+
+    """
+    if name_to_path is None:
+        name_to_path = {}
+    if len(modules) == 1:
+        return [
+            ModuleCollector(
+                modules[0], out_dir, name_to_path, out_name=out_name, **options
+            )
+        ]
+    parent = pathlib.Path(out_dir, out_name or "")
+    return [
+        ModuleCollector(
+            m, parent.joinpath(*m.__name__.split(".")[:-1]), name_to_path, **options
+        )
+        for m in modules
+    ]
+
+
+def free_threaded() -> bool:
+    """`True` if the GIL is disabled, so rendering threads run in parallel."""
+    is_gil_enabled: Optional[Callable[[], bool]] = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+def default_jobs() -> int:
+    """Number of CPUs on free-threaded Python, or `1` ."""
+    if free_threaded():
+        return os.cpu_count() or 1
+    return 1
+
+
+def _iter_written(root: ModuleCollector) -> Iterator[ModuleCollector]:
+    """Modules written by `root` , in the same order. Submodules are listed lazily."""
+    if root.folded:
+        # written in the page of the parent package.
+        return
+    yield root
+    if not root.recursive:
+        return
+    for submodule in root.submodules.values():
+        yield from _iter_written(submodule)
+
+
+def _timed_render(render: Callable[[], str]) -> tuple[str, float]:
+    start = time.perf_counter()
+    content = render()
+    return content, time.perf_counter() - start
+
+
+def write_pages(
+    roots: Sequence[ModuleCollector],
+    jobs: int,
+    pool: Optional[Executor] = None,
+) -> None:
+    """
+    Write pages of prepared roots, rendering them in threads. Outdated pages are
+    removed and links are resolved first, in the calling thread. Pages are written
+    by the calling thread in the same order as `ModuleCollector.write` .
+
+    `symbol_rendered` hooks are called from rendering threads.
+
+    **Args**
+
+    * roots (`Sequence[ModuleCollector]`): Prepared collectors sharing
+        `name_to_path` .
+    * jobs (`int`): Number of threads.
+    * pool (`Optional[Executor]`): Shared by several calls. Created with `jobs`
+        threads if omitted.
+
+    """
+    pages = [
+        (collector, path, render)
+        for root in roots
+        for collector in _iter_written(root)
+        for path, render in collector._pages()
+    ]
+    if pool is None:
+        with ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="inari") as pool:
+            _write_rendered(pages, pool)
+    else:
+        _write_rendered(pages, pool)
+
+
+def _write_rendered(
+    pages: Sequence[tuple[ModuleCollector, pathlib.Path, Callable[[], str]]],
+    pool: Executor,
+) -> None:
+    rendered = pool.map(_timed_render, [render for _, _, render in pages])
+    for (collector, path, _), (content, seconds) in zip(pages, rendered):
+        collector.sink.write(path, content)
+        if hooks.wants("page_written"):
+            hooks.emit("page_written", collector, seconds, content, path)
+
+
+def write_roots(
+    roots: Sequence[ModuleCollector],
+    profiler: Optional[MemoryProfiler] = None,
+    jobs: int = 1,
+) -> None:
+    """
+    Collect all roots first, then write documents. Links to any root are available
+    in every page.
+
+    **Args**
+
+    * roots (`Sequence[ModuleCollector]`): Collectors sharing `name_to_path` .
+    * profiler (`Optional[MemoryProfiler]`): Snapshots are taken after collecting
+        and writing.
+    * jobs (`int`): Render pages in this number of threads if larger than `1` .
+        See `inari.build.write_pages` .
+
+    """
+    start = time.perf_counter()
+    for root in roots:
+        root._prepare_docs()
+    if profiler:
+        profiler.phase("collect")
+    if jobs > 1:
+        write_pages(roots, jobs)
+    else:
+        for root in roots:
+            root._write()
+    if profiler:
+        profiler.phase("write")
+    if hooks.wants("build_finished"):
+        hooks.emit("build_finished", list(roots), time.perf_counter() - start)
+
+
+def update_index(
+    roots: Sequence[ModuleCollector], out_dir: Union[str, os.PathLike[str]]
+) -> SymbolIndex:
+    """
+    Update the symbol index shared by roots.
+
+    **Args**
+
+    * roots (`Sequence[ModuleCollector]`): Written collectors.
+    * out_dir (`Union[str, Path]`): Output directory.
+
+    **Returns**
+
+    * `SymbolIndex`: Updated index, also written to `inari.index.index_path` .
+
+    """
+    path = index_path(out_dir)
+    index = SymbolIndex.load(path)
+    for root in roots:
+        index.update(root, out_dir)
+    index.dump(path)
+    return index
@@ -0,0 +1,179 @@
+"""
+buildcache - Relocatable cache of rendered pages, saved and restored between runs.
+
+Pages are cached before links are resolved, keyed by digests of their inputs: the
+module name, sources of the module, the page file and options of the collector.
+Links are resolved again on every build, so adding or moving other modules does not
+invalidate entries. Keys and entries are free of absolute paths and output
+directories, so the directory can be stored and restored by CI like a pip cache.
+
+Entries are kept in a subdirectory named by versions of inari and Python, with
+normalized docstrings of `inari.docstrings.cache` :
+
+~~~
+{cache-dir}/inari-0.2.1-cpython-311/docstrings.json
+{cache-dir}/inari-0.2.1-cpython-311/pages/ab/ab12....md
+~~~
+
+Like digests in yaml headers, a page is reused while sources of its own module are
+unchanged. Modules are still imported and collected to resolve links.
+"""
+
+import hashlib
+import json
+import os
+import pathlib
+import shutil
+import sys
+import threading
+from collections.abc import Callable
+from typing import Any, Optional, Union
+
+from .docstrings import cache
+from .hooks import hooks
+
+
+def version_tag() -> str:
+    """
+    **Returns**
+
+    * `str`: Name of the subdirectory of entries, like `inari-0.2.1-cpython-311` .
+        `dev` is used as the version if inari is not installed.
+
+    """
+    # imported here, as it is slow to import and only needed to open a cache.
+    import importlib.metadata
+
+    try:
+        version = importlib.metadata.version("inari")
+    except importlib.metadata.PackageNotFoundError:
+        version = "dev"
+    return f"inari-{version}-{sys.implementation.cache_tag}"
+
+
+class BuildCache:
+    """
+    Pages before linking, keyed by digests of their inputs. Pages are rendered as
+    usual until the cache is opened.
+
+    **Attributes**
+
+    * directory (`Optional[pathlib.Path]`): Subdirectory of entries for the current
+        versions, or `None` if the cache is not opened.
+    * hits (`int`): Number of pages read from the cache.
+    * misses (`int`): Number of pages rendered and stored.
+
+    """
+
+    directory: Optional[pathlib.Path]
+    hits: int
+    misses: int
+
+    _used: set[str]
+    _lock: threading.Lock
+
+    def __init__(self) -> None:
+        self.directory = None
+        self.hits = 0
+        self.misses = 0
+        self._used = set()
+        self._lock = threading.Lock()
+
+    def open(self, root: Union[str, os.PathLike[str]]) -> None:
+        """
+        Use entries in the directory, and load normalized docstrings saved in it.
+
+        **Args**
+
+        * root (`Union[str, Path]`): Cache directory given by users. Created if
+            missing.
+
+        """
+        self.directory = pathlib.Path(root) / version_tag()
+        self.hits = 0
+        self.misses = 0
+        self._used.clear()
+        cache.load(self.directory / "docstrings.json")
+
+    def close(self, prune: bool = True, prune_versions: bool = False) -> None:
+        """
+        Save normalized docstrings, and stop using the directory.
+
+        **Args**
+
+        * prune (`bool`): Remove pages of the current versions not used since
+            `open` . Set `False` for partial builds sharing the directory.
+        * prune_versions (`bool`): Remove entries of other versions. Keep them if
+            builds on several versions of Python share the directory.
+
+        """
+        if self.directory is None:
+            return
+        cache.dump(self.directory / "docstrings.json")
+        if prune:
+            for path in self.directory.glob("pages/*/*.md"):
+                if path.stem not in self._used:
+                    path.unlink()
+        if prune_versions:
+            for path in self.directory.parent.iterdir():
+                if path.is_dir() and path.name.startswith("inari-"):
+                    if path != self.directory:
+                        shutil.rmtree(path)
+        self.directory = None
+
+    @staticmethod
+    def key(*inputs: Any) -> str:
+        """
+        **Args**
+
+        * inputs (`Any`): Values serializable to JSON, like digests and options.
+
+        **Returns**
+
+        * `str`: MD5 hex digest of inputs.
+
+        """
+        data = json.dumps(inputs, ensure_ascii=False, separators=(",", ":"))
+        return hashlib.md5(data.encode("utf-8")).hexdigest()
+
+    def page(self, key: str, render: Callable[[], str]) -> str:
+        """
+        **Args**
+
+        * key (`str`): See `inari.buildcache.BuildCache.key` .
+        * render (`Callable[[], str]`): Render the page before linking.
+
+        **Returns**
+
+        * `str`: The stored page, or the rendered page. Pages are always rendered if
+            the cache is not opened, or `symbol_rendered` hooks may change them.
+
+        """
+        if self.directory is None or hooks.wants("symbol_rendered"):
+            return render()
+        path = self.directory / "pages" / key[:2] / f"{key}.md"
+        with self._lock:
+            self._used.add(key)
+        try:
+            with open(path, mode="r", newline="\n", encoding="utf-8") as f:
+                content = f.read()
+        except OSError:
+            pass
+        else:
+            with self._lock:
+                self.hits += 1
+            return content
+        content = render()
+        os.makedirs(path.parent, exist_ok=True)
+        # pages are stored by rendering threads.
+        temp = path.with_name(f"{path.name}.{threading.get_ident()}")
+        with open(temp, mode="w", newline="\n", encoding="utf-8") as f:
+            f.write(content)
+        os.replace(temp, path)
+        with self._lock:
+            self.misses += 1
+        return content
+
+
+build_cache = BuildCache()
+"""(`BuildCache`): Shared by collectors."""
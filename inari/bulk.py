@@ -0,0 +1,187 @@
+"""
+bulk - Document installed distributions matching patterns in one run.
+
+Distributions share one interpreter, `name_to_path` , the symbol index and the
+docstring cache, so dependencies are imported once and links between distributions
+are resolved. Each top-level module is a root of its own, placed like several roots
+of `inari.build.make_roots` . A distribution failing to import, collect or write is
+reported, and other distributions are still written.
+"""
+
+import importlib.metadata
+import os
+import pathlib
+import re
+import sys
+import time
+from collections.abc import Iterable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, NamedTuple, Optional, Union
+
+from .build import update_index, write_pages
+from .collectors import ModuleCollector
+from .hooks import hooks
+from .imports import timer
+from .selectors import Selector
+
+
+class BulkResult(NamedTuple):
+    """
+    Returned by `inari.bulk.write_distributions` .
+
+    **Attributes**
+
+    * written (`dict[str, list[ModuleCollector]]`): Root collectors, keyed by
+        distribution names.
+    * failed (`dict[str, str]`): Errors like `ImportError: ...` , keyed by
+        distribution names.
+
+    """
+
+    written: dict[str, list[ModuleCollector]]
+    failed: dict[str, str]
+
+
+def normalize(name: str) -> str:
+    """Distribution name like `Foo_Bar` to `foo-bar` , as package indexes do."""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def top_level_modules(dist: importlib.metadata.Distribution) -> list[str]:
+    """
+    **Args**
+
+    * dist (`Distribution`): Installed distribution.
+
+    **Returns**
+
+    * `list[str]`: Public top-level modules, from `top_level.txt` or installed
+        files, sorted by names.
+
+    """
+    text = dist.read_text("top_level.txt")
+    names: set[str] = set()
+    if text is not None:
+        names.update(text.split())
+    else:
+        for file in dist.files or []:
+            if len(file.parts) == 1 and file.suffix == ".py":
+                names.add(file.stem)
+            elif len(file.parts) == 2 and file.parts[1] == "__init__.py":
+                names.add(file.parts[0])
+    return sorted(x for x in names if x.isidentifier() and not x.startswith("_"))
+
+
+def find_distributions(
+    include: Iterable[str],
+    exclude: Optional[Iterable[str]] = None,
+    path: Optional[Sequence[str]] = None,
+) -> dict[str, list[str]]:
+    """
+    Find installed distributions by normalized names. Modules are not imported.
+
+    **Args**
+
+    * include (`Iterable[str]`): Patterns of `inari.selectors.Selector` , like
+        `acme-*` .
+    * exclude (`Optional[Iterable[str]]`): Patterns to ignore.
+    * path (`Optional[Sequence[str]]`): Directories to search. Default:
+        `sys.path` .
+
+    **Returns**
+
+    * `dict[str, list[str]]`: Top-level modules keyed by distribution names,
+        sorted by names. Modules of several distributions, like namespace
+        packages, belong to the first one.
+
+    """
+    selector = Selector(include, exclude)
+    found: dict[str, list[str]] = {}
+    search = list(sys.path if path is None else path)
+    for dist in importlib.metadata.distributions(path=search):
+        name = dist.metadata["Name"]
+        if not name or normalize(name) in found or not selector.match(normalize(name)):
+            continue
+        found[normalize(name)] = top_level_modules(dist)
+    claimed: set[str] = set()
+    distributions = {}
+    for name, modules in sorted(found.items()):
+        modules = [x for x in modules if x not in claimed]
+        claimed.update(modules)
+        if modules:
+            distributions[name] = modules
+    return distributions
+
+
+def _error(e: BaseException) -> str:
+    return f"{type(e).__name__}: {e}"
+
+
+def write_distributions(
+    distributions: Mapping[str, Sequence[str]],
+    out_dir: Union[str, os.PathLike[str]],
+    jobs: int = 1,
+    **options: Any,
+) -> BulkResult:
+    """
+    Collect all distributions first, then write their documents and update the
+    symbol index. Links to members of failed distributions are left as names.
+
+    **Args**
+
+    * distributions (`Mapping[str, Sequence[str]]`): Root modules keyed by
+        distribution names, like `inari.bulk.find_distributions` .
+    * out_dir (`Union[str, Path]`): Output directory.
+    * jobs (`int`): Render pages in one pool of this number of threads if larger
+        than `1` . See `inari.build.write_pages` .
+    * options (`Any`): Passed to `inari.collectors.ModuleCollector` .
+
+    **Returns**
+
+    * `BulkResult`: Written and failed distributions.
+
+    """
+    start = time.perf_counter()
+    name_to_path: dict[str, str] = {}
+    prepared: dict[str, list[ModuleCollector]] = {}
+    failed: dict[str, str] = {}
+    for dist, modules in sorted(distributions.items()):
+        known = set(name_to_path)
+        try:
+            roots = []
+            for name in modules:
+                mod = timer.import_module(name)
+                parent = pathlib.Path(out_dir).joinpath(*name.split(".")[:-1])
+                roots.append(ModuleCollector(mod, parent, name_to_path, **options))
+            for root in roots:
+                root._prepare_docs()
+        except (Exception, SystemExit) as e:
+            failed[dist] = _error(e)
+            for name in set(name_to_path) - known:
+                del name_to_path[name]
+            continue
+        prepared[dist] = roots
+
+    written: dict[str, list[ModuleCollector]] = {}
+    pool = ThreadPoolExecutor(jobs, thread_name_prefix="inari") if jobs > 1 else None
+    try:
+        for dist, roots in prepared.items():
+            try:
+                if pool:
+                    write_pages(roots, jobs, pool)
+                else:
+                    for root in roots:
+                        root._write()
+            except Exception as e:
+                failed[dist] = _error(e)
+                continue
+            written[dist] = roots
+    finally:
+        if pool:
+            pool.shutdown()
+
+    all_roots = [root for roots in written.values() for root in roots]
+    update_index(all_roots, out_dir)
+    if hooks.wants("build_finished"):
+        hooks.emit("build_finished", all_roots, time.perf_counter() - start)
+    return BulkResult(written, dict(sorted(failed.items())))
@@ -1,17 +1,41 @@
 import argparse
-import importlib
 import os
 import sys
+from typing import Any
 
-from .collectors import ModuleCollector
+main_parser = argparse.ArgumentParser(
+    prog="inari",
+    description="make markdown documents from python modules. Without a command,"
+    + " arguments are passed to `inari build` .",
+)
+commands = main_parser.add_subparsers(dest="subcommand", metavar="command")
+
+
+def shard(value: str) -> tuple[int, int]:
+    """See `inari.shards.parse_shard` ."""
+    from .shards import parse_shard
+
+    return parse_shard(value)
 
-parser = argparse.ArgumentParser()
-parser.add_argument("module", help="root of your module.")
+
+parser = commands.add_parser(
+    "build",
+    help="write documents. Default command, name it to document a module named"
+    + " like other commands.",
+    description="write documents of modules.",
+)
+parser.add_argument(
+    "module",
+    help="root of your module, or path to a wheel or `.tar.gz` source distribution."
+    + " Several roots share links and the symbol index.",
+    nargs="+",
+)
 parser.add_argument("out_dir", help="directory to write documents.", metavar="out-dir")
 parser.add_argument(
     "-n",
     "--name",
     help="root directory/file name like `{out-dir}/{name}/{submods}` ."
+    + " With several roots, a directory like `{out-dir}/{name}/{module}` ."
     + " Default: module name.",
 )
 parser.add_argument(
@@ -20,19 +44,529 @@ parser.add_argument(
     help="deciding whether to include yaml header. Default: `False`.",
     action="store_true",
 )
+parser.add_argument(
+    "-s",
+    "--search-index",
+    help="write a symbol index to `{out-dir}/.inari/index.json` . Default: `False`.",
+    action="store_true",
+)
+parser.add_argument(
+    "--split-classes",
+    help="put each class on its own page. Default: `False`.",
+    action="store_true",
+)
+parser.add_argument(
+    "--max-symbols",
+    help="put classes on their own pages if a module has more symbols than this.",
+    type=int,
+)
+parser.add_argument(
+    "--max-bytes",
+    help="put classes on their own pages if a module page is larger than this.",
+    type=int,
+)
+parser.add_argument(
+    "--fold-below",
+    help="put modules with fewer symbols than this into the page of their package"
+    + " as sections.",
+    type=int,
+    metavar="N",
+)
+parser.add_argument(
+    "--since",
+    help="rebuild only modules changed since the git ref, and pages linking to them."
+    + " Falls back to a full build if there is no previous symbol index.",
+    metavar="REF",
+)
+parser.add_argument(
+    "--include",
+    help="document only modules matching the glob, or regex with `re:` prefix."
+    + " Packages containing them are also documented. Repeatable.",
+    action="append",
+    metavar="PATTERN",
+)
+parser.add_argument(
+    "--exclude",
+    help="skip modules matching the pattern, with their submodules. Repeatable.",
+    action="append",
+    metavar="PATTERN",
+)
+parser.add_argument(
+    "--include-symbols",
+    help="document only classes, functions, variables, and their members matching"
+    + " the pattern. Repeatable.",
+    action="append",
+    metavar="PATTERN",
+)
+parser.add_argument(
+    "--exclude-symbols",
+    help="skip symbols matching the pattern. Repeatable.",
+    action="append",
+    metavar="PATTERN",
+)
+parser.add_argument(
+    "--html",
+    help="write HTML pages instead of markdown. Requires `markdown` package.",
+    action="store_true",
+)
+parser.add_argument(
+    "--sqlite",
+    help="write `{out-dir}/inari.sqlite3` instead of markdown pages."
+    + " Only changed modules are rewritten.",
+    action="store_true",
+)
+parser.add_argument(
+    "--zip",
+    help="write markdown pages into the archive instead of `{out-dir}` , keeping"
+    + " paths relative to `{out-dir}` .",
+    metavar="FILE",
+)
+parser.add_argument(
+    "--nav",
+    help="write a navigation file of modules and class pages for literate-nav,"
+    + " like `api/SUMMARY.md` , relative to `{out-dir}` .",
+    metavar="FILE",
+)
+parser.add_argument(
+    "--shard",
+    help="write only a part of modules, like `2/4` for the second of four shards,"
+    + " with a partial index. Run `inari merge` after all shards.",
+    type=shard,
+    metavar="I/N",
+)
+parser.add_argument(
+    "-j",
+    "--jobs",
+    help="render markdown pages in N threads after collecting modules. 0 for the"
+    + " number of CPUs on free-threaded Python, or 1 with the GIL.",
+    type=int,
+    metavar="N",
+)
+parser.add_argument(
+    "--cache-dir",
+    help="keep pages before linking and normalized docstrings in this directory,"
+    + " keyed by versions of inari and Python and digests of sources. Free of"
+    + " absolute paths, so CI can save and restore it between runs.",
+    metavar="DIR",
+)
+parser.add_argument(
+    "--prune-cache-versions",
+    help="remove entries of other versions of inari and Python from `--cache-dir` .",
+    action="store_true",
+)
+parser.add_argument(
+    "--import-profile",
+    help="report import and reload time of each module to stderr.",
+    action="store_true",
+)
+parser.add_argument(
+    "--max-import-time",
+    help="fail if a module takes longer than this to import and reload.",
+    type=float,
+    metavar="SECONDS",
+)
+parser.add_argument(
+    "--memory-profile",
+    help="report memory usage of each phase to stderr with `tracemalloc` .",
+    action="store_true",
+)
 
+serve_parser = commands.add_parser(
+    "serve",
+    help="preview documents rendered on request.",
+    description="preview documents rendered on request.",
+)
+serve_parser.add_argument("module", help="root of your module.", nargs="+")
+serve_parser.add_argument("--host", help="Default: `127.0.0.1`.", default="127.0.0.1")
+serve_parser.add_argument("--port", help="Default: `8000`.", type=int, default=8000)
 
-def run() -> None:
-    """CLI entry point."""
-    sys.path.append(os.getcwd())
-    args = parser.parse_args()
-    root_name = args.module
+export_parser = commands.add_parser(
+    "export",
+    help="write collected data as newline-delimited JSON.",
+    description="write collected data as newline-delimited JSON, module by module.",
+)
+export_parser.add_argument("module", help="root of your module.", nargs="+")
+export_parser.add_argument(
+    "-o", "--output", help="file to write. Default: stdout.", metavar="FILE"
+)
+for selector_option in [
+    "--include",
+    "--exclude",
+    "--include-symbols",
+    "--exclude-symbols",
+]:
+    export_parser.add_argument(
+        selector_option,
+        help=f"same as `inari {selector_option}` .",
+        action="append",
+        metavar="PATTERN",
+    )
+
+merge_parser = commands.add_parser(
+    "merge",
+    help="merge outputs of `inari --shard` .",
+    description="merge outputs of `inari --shard` copied into one directory.",
+)
+merge_parser.add_argument(
+    "out_dir", help="directory containing outputs of all shards.", metavar="out-dir"
+)
+merge_parser.add_argument("--nav", help="same as `inari --nav` .", metavar="FILE")
+
+daemon_parser = commands.add_parser(
+    "daemon",
+    help="build on request from `inari client` .",
+    description="keep modules imported and build them on request from `inari client` .",
+)
+daemon_parser.add_argument("module", help="root of your module.", nargs="+")
+daemon_parser.add_argument(
+    "out_dir", help="directory to write documents.", metavar="out-dir"
+)
+daemon_parser.add_argument(
+    "--socket",
+    help="socket file. Default: `{out-dir}/.inari/daemon.sock`.",
+    metavar="FILE",
+)
+daemon_parser.add_argument("-n", "--name", help="same as `inari --name` .")
+for flag_option in ["--enable-yaml-header", "--split-classes"]:
+    daemon_parser.add_argument(
+        flag_option, help=f"same as `inari {flag_option}` .", action="store_true"
+    )
+for int_option in ["--max-symbols", "--max-bytes", "--fold-below"]:
+    daemon_parser.add_argument(
+        int_option, help=f"same as `inari {int_option}` .", type=int
+    )
+for selector_option in [
+    "--include",
+    "--exclude",
+    "--include-symbols",
+    "--exclude-symbols",
+]:
+    daemon_parser.add_argument(
+        selector_option,
+        help=f"same as `inari {selector_option}` .",
+        action="append",
+        metavar="PATTERN",
+    )
+
+bulk_parser = commands.add_parser(
+    "bulk",
+    help="document installed distributions.",
+    description="document installed distributions matching patterns in one run.",
+)
+bulk_parser.add_argument(
+    "pattern",
+    help="distribution names like `acme-*` , or regular expressions with `re:`"
+    + " prefix. Names are normalized like `acme-utils` .",
+    nargs="+",
+)
+bulk_parser.add_argument(
+    "out_dir", help="directory to write documents.", metavar="out-dir"
+)
+bulk_parser.add_argument(
+    "--exclude-dist",
+    help="distributions to ignore. Repeatable.",
+    action="append",
+    metavar="PATTERN",
+)
+for flag_option in ["--enable-yaml-header", "--split-classes"]:
+    bulk_parser.add_argument(
+        flag_option, help=f"same as `inari {flag_option}` .", action="store_true"
+    )
+for int_option in ["--max-symbols", "--max-bytes", "--fold-below", "--jobs"]:
+    bulk_parser.add_argument(
+        int_option, help=f"same as `inari {int_option}` .", type=int
+    )
+for selector_option in [
+    "--include",
+    "--exclude",
+    "--include-symbols",
+    "--exclude-symbols",
+]:
+    bulk_parser.add_argument(
+        selector_option,
+        help=f"same as `inari {selector_option}` .",
+        action="append",
+        metavar="PATTERN",
+    )
+
+client_parser = commands.add_parser(
+    "client",
+    help="send a request to `inari daemon` .",
+    description="send a request to `inari daemon` .",
+)
+client_parser.add_argument("socket", help="socket file of the daemon.")
+client_parser.add_argument(
+    "command",
+    help="`build` , `rebuild MODULE...` , `render PAGE` , `ping` or `stop` .",
+    choices=["build", "rebuild", "render", "ping", "stop"],
+)
+client_parser.add_argument("args", help="modules or a page.", nargs="*")
+
+
+def run_serve(args: argparse.Namespace) -> None:
+    """Preview roots given by arguments."""
+    from .serve import PreviewServer
+
+    server = PreviewServer(args.module)
+    server.serve_forever(args.host, args.port)
+
+
+def run_daemon(args: argparse.Namespace) -> None:
+    """Serve builds of roots given by arguments on the socket."""
+    from .daemon import BuildDaemon, socket_path
+    from .selectors import Selector
+
+    daemon = BuildDaemon(
+        args.module,
+        args.out_dir,
+        args.name,
+        enable_yaml_header=args.enable_yaml_header,
+        split_classes=args.split_classes,
+        max_symbols=args.max_symbols,
+        max_bytes=args.max_bytes,
+        fold_below=args.fold_below,
+        module_selector=Selector(args.include, args.exclude),
+        symbol_selector=Selector(args.include_symbols, args.exclude_symbols),
+    )
+    daemon.serve_forever(args.socket or socket_path(args.out_dir))
+
+
+def run_client(args: argparse.Namespace) -> None:
+    """Send the request given by arguments, and print the response."""
+    from .daemon import request
+
+    payload: dict[str, Any] = dict(command=args.command)
+    if args.command == "rebuild":
+        payload["modules"] = args.args
+    elif args.command == "render":
+        if len(args.args) != 1:
+            client_parser.error("`render` takes one page.")
+        payload["page"] = args.args[0]
+    response = request(args.socket, **payload)
+    if not response["ok"]:
+        client_parser.exit(1, f"{response['error']}\n")
+    if "page" in response:
+        print(response["page"])
+    for name in response.get("modules", []):
+        print(name)
+
+
+def run_bulk(args: argparse.Namespace) -> None:
+    """Document distributions given by arguments, and report failures."""
+    from .build import default_jobs
+    from .bulk import find_distributions, write_distributions
+    from .docstrings import cache, cache_path
+    from .selectors import Selector
+
+    distributions = find_distributions(args.pattern, args.exclude_dist)
+    if not distributions:
+        bulk_parser.exit(1, "No distributions matched.\n")
+    out_dir = args.out_dir
+    cache.load(cache_path(out_dir))
+    result = write_distributions(
+        distributions,
+        out_dir,
+        default_jobs() if args.jobs == 0 else args.jobs or 1,
+        enable_yaml_header=args.enable_yaml_header,
+        split_classes=args.split_classes,
+        max_symbols=args.max_symbols,
+        max_bytes=args.max_bytes,
+        fold_below=args.fold_below,
+        module_selector=Selector(args.include, args.exclude),
+        symbol_selector=Selector(args.include_symbols, args.exclude_symbols),
+    )
+    cache.dump(cache_path(out_dir))
+    for name, error in result.failed.items():
+        print(f"{name}: {error}", file=sys.stderr)
+    print(
+        f"{len(result.written)} distributions written, {len(result.failed)} failed.",
+        file=sys.stderr,
+    )
+    if result.failed:
+        bulk_parser.exit(1)
+
+
+def run_merge(args: argparse.Namespace) -> None:
+    """Merge outputs of shards in the directory given by arguments."""
+    from .nav import pages_from_index, write_nav
+    from .shards import merge_shards
+
+    try:
+        merged = merge_shards(args.out_dir)
+    except ValueError as e:
+        merge_parser.exit(1, f"{e}\n")
+    if args.nav:
+        write_nav(pages_from_index(merged), args.out_dir, args.nav)
+
+
+def run_export(args: argparse.Namespace) -> None:
+    """Export roots given by arguments as NDJSON."""
+    import importlib
+
+    from .export import export
+    from .selectors import Selector
+
+    export_roots = [importlib.import_module(n) for n in args.module]
+    selectors = dict(
+        module_selector=Selector(args.include, args.exclude),
+        symbol_selector=Selector(args.include_symbols, args.exclude_symbols),
+    )
+    if args.output:
+        with open(args.output, mode="w", encoding="utf-8") as out:
+            export(export_roots, out, **selectors)
+    else:
+        export(export_roots, sys.stdout, **selectors)
+
+
+def run_build(args: argparse.Namespace) -> None:
+    """Write documents of roots given by arguments."""
+    import contextlib
+    import tarfile
+    import zipfile
+
+    from .archives import expand_roots
+    from .build import default_jobs, make_roots, update_index, write_roots
+    from .buildcache import build_cache
+    from .docstrings import cache, cache_path
+    from .imports import timer
+    from .index import SymbolIndex, index_path
+    from .memory import MemoryProfiler
+    from .nav import pages_from_collectors, pages_from_index, write_nav
+    from .selectors import Selector
+
+    if args.html and args.sqlite:
+        parser.error("`--html` and `--sqlite` are exclusive.")
+    if (args.html or args.sqlite) and (args.since or args.zip):
+        parser.error("`--since` and `--zip` are available only with markdown pages.")
+    if args.zip and args.since:
+        parser.error("`--since` is not available with `--zip` .")
+    if args.shard and (args.html or args.sqlite or args.zip or args.since):
+        parser.error("`--shard` is available only with markdown pages.")
+    if args.nav and (args.html or args.sqlite or args.zip or args.shard):
+        parser.error("`--nav` is available only with markdown pages.")
+    if args.jobs is not None and (args.html or args.sqlite or args.since or args.shard):
+        parser.error("`--jobs` is available only with full builds of markdown pages.")
+    if args.fold_below is not None and args.shard:
+        parser.error("`--fold-below` is not available with `--shard` .")
+    if args.cache_dir and (args.html or args.sqlite or args.since):
+        parser.error("`--cache-dir` is available only with markdown pages.")
+    if args.prune_cache_versions and not args.cache_dir:
+        parser.error("`--prune-cache-versions` requires `--cache-dir` .")
+    try:
+        root_names, archives = expand_roots(args.module)
+    except (OSError, ValueError, tarfile.TarError, zipfile.BadZipFile) as e:
+        parser.error(f"Invalid archive: {e}")
+    if archives and (args.since or args.shard):
+        parser.error("`--since` and `--shard` are not available with archives.")
+    # stubs of archives are kept until the end of the build.
+    stack = contextlib.ExitStack()
+    for archive in archives:
+        stack.enter_context(archive)
     out_dir = args.out_dir
     out_name = args.name
     enable_yaml_header = args.enable_yaml_header
-    root_mod = importlib.import_module(root_name)
-    # create docs.
-    mod = ModuleCollector(
-        root_mod, out_dir, out_name=out_name, enable_yaml_header=enable_yaml_header
+    search_index = args.search_index
+    options = dict(
+        enable_yaml_header=enable_yaml_header,
+        split_classes=args.split_classes,
+        max_symbols=args.max_symbols,
+        max_bytes=args.max_bytes,
+        fold_below=args.fold_below,
+        module_selector=Selector(args.include, args.exclude),
+        symbol_selector=Selector(args.include_symbols, args.exclude_symbols),
     )
-    mod.write()
+    profiler = MemoryProfiler() if args.memory_profile else None
+    if profiler:
+        profiler.start()
+    root_mods = [timer.import_module(name) for name in root_names]
+    if profiler:
+        profiler.phase("import")
+    # normalized docstrings are kept with other build states, except for archives.
+    docstrings = None if args.zip else cache_path(out_dir)
+    if docstrings:
+        cache.load(docstrings)
+    if args.cache_dir:
+        build_cache.open(args.cache_dir)
+    rebuilt = None
+    if args.since:
+        from .rebuild import rebuild_since
+
+        rebuilt = rebuild_since(root_mods, out_dir, args.since, out_name, **options)
+    if args.shard:
+        from .shards import write_shard
+
+        rebuilt = write_shard(
+            root_mods, out_dir, args.shard, out_name, profiler, **options
+        )
+    if rebuilt is None:
+        # create docs.
+        sink = None
+        if args.zip:
+            from .sinks import ZipSink
+
+            sink = ZipSink(args.zip, out_dir)
+        roots = make_roots(root_mods, out_dir, out_name, sink=sink, **options)
+        if args.html:
+            from .html import write_html_roots
+
+            write_html_roots(roots, out_dir, profiler)
+        elif args.sqlite:
+            from .store import write_store
+
+            os.makedirs(out_dir, exist_ok=True)
+            write_store(roots, os.path.join(out_dir, "inari.sqlite3"), profiler)
+        else:
+            jobs = default_jobs() if args.jobs == 0 else args.jobs or 1
+            write_roots(roots, profiler, jobs)
+        if sink:
+            sink.close()
+
+        if search_index or args.since:
+            update_index(roots, out_dir)
+        if args.nav:
+            write_nav(pages_from_collectors(roots, out_dir), out_dir, args.nav)
+    elif args.nav and args.since:
+        # only changed modules are collected.
+        index = SymbolIndex.load(index_path(out_dir))
+        write_nav(pages_from_index(index), out_dir, args.nav)
+    if docstrings:
+        cache.dump(docstrings)
+    if args.cache_dir:
+        # other shards may use other pages.
+        build_cache.close(
+            prune=not args.shard, prune_versions=args.prune_cache_versions
+        )
+    stack.close()
+    if profiler:
+        print(profiler.finish(), file=sys.stderr)
+        profiler.stop()
+    if args.import_profile:
+        print(timer.report(), file=sys.stderr)
+    if args.max_import_time is not None:
+        slow = timer.slow_modules(args.max_import_time)
+        if slow:
+            for name in slow:
+                print(f"{timer.total(name):.3f}s {name}", file=sys.stderr)
+            parser.exit(1, f"{len(slow)} modules exceeded `--max-import-time` .\n")
+
+
+_commands = {
+    "build": run_build,
+    "serve": run_serve,
+    "daemon": run_daemon,
+    "client": run_client,
+    "bulk": run_bulk,
+    "merge": run_merge,
+    "export": run_export,
+}
+
+
+def run() -> None:
+    """CLI entry point."""
+    sys.path.append(os.getcwd())
+    argv = sys.argv[1:]
+    if argv[:1] not in [[name] for name in _commands] + [["-h"], ["--help"]]:
+        # `inari build` is the default. Name it to document modules like `serve` .
+        argv = ["build", *argv]
+    args = main_parser.parse_args(argv)
+    _commands[args.subcommand](args)
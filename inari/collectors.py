@@ -3,20 +3,26 @@ collectors -  Store module members, and build markdown documents from docstrings
 """
 
 import hashlib
-import importlib
 import inspect
 import os
 import pathlib
 import re
-from functools import reduce
-from importlib import import_module
+import time
+from functools import partial, reduce
 from pkgutil import walk_packages
 from types import ModuleType
 from typing import Any, Callable, Optional, Union
 
-from ._internal._format import join_fragments, modify_attrs
-from ._internal._path import get_relative_path
+from ._internal._format import join_fragments, summarize
+from ._internal._members import class_members
+from ._internal._path import link_names, make_relpaths, path_to_name, to_page
 from ._internal._templates import build_yaml_header
+from .buildcache import build_cache
+from .docstrings import cache
+from .hooks import hooks
+from .imports import timer
+from .selectors import Selector
+from .sinks import FileSink, Sink
 
 try:
     import markdown
@@ -24,6 +30,27 @@ except ImportError:
     markdown = None
 
 
+def _separate(docs: list[str]) -> list[str]:
+    """Put horizontal rules between documents."""
+    separated = []
+    for i, doc in enumerate(docs):
+        if i:
+            separated.append("------")
+        separated.append(doc)
+    return separated
+
+
+def _source_exists(mod: ModuleType, path: str) -> bool:
+    if os.path.isfile(path):
+        return True
+    # sources in archives, see `inari.archives` .
+    path_stats = getattr(mod.__loader__, "path_stats", None)
+    try:
+        return path_stats is not None and bool(path_stats(path))
+    except OSError:
+        return False
+
+
 def is_var(obj: object) -> bool:
     """Utility for filtering unexpected objects."""
 
@@ -64,7 +91,7 @@ class BaseCollector:
         * name_to_path (`dict[str, str]`): Mapping of name and path.
 
         """
-        self.name_to_path = name_to_path or {}
+        self.name_to_path = {} if name_to_path is None else name_to_path
         self.abs_path = abs_path
 
     def doc_str(self) -> str:
@@ -99,6 +126,21 @@ class ModuleCollector(BaseCollector):
     * relpaths (`dict[str, tuple[str, str]]`): Store relational paths. See
         `inari.collectors.ModuleCollector.make_relpaths` .
     * enable_yaml_header (`bool`): a flag for deciding whether to include yaml header.
+    * split_classes (`bool`): Always put each class on its own page.
+    * max_symbols (`Optional[int]`): Split classes into their own pages if the module
+        has more public classes, functions and variables than this.
+    * max_bytes (`Optional[int]`): Split classes into their own pages if documents of
+        classes and functions are larger than this.
+    * class_pages (`dict[str, ClassCollector]`): Classes on their own pages, keyed by
+        filenames relative to `out_dir` .
+    * recursive (`bool`): If `False` , submodules are found but not documented.
+    * module_selector (`Selector`): Select submodules before importing them.
+    * symbol_selector (`Selector`): Select classes, functions, variables and their
+        members by qualified names.
+    * sink (`Sink`): Destination of pages, shared with submodules.
+    * fold_below (`Optional[int]`): Fold modules with fewer public classes,
+        functions and variables than this into the page of their parent package.
+    * folded (`bool`): `True` if this module is a section of the parent page.
 
     """
 
@@ -113,9 +155,22 @@ class ModuleCollector(BaseCollector):
     filename: str
     relpaths: dict[str, tuple[str, str]]
     enable_yaml_header: bool
+    split_classes: bool
+    max_symbols: Optional[int]
+    max_bytes: Optional[int]
+    class_pages: dict[str, "ClassCollector"]
+    recursive: bool
+    module_selector: Selector
+    symbol_selector: Selector
+    sink: Sink
+    fold_below: Optional[int]
+    folded: bool
 
     _has_submodules: bool
+    _own_page: tuple[str, str]
     _module_digest: str
+    _members: Optional[list[tuple[str, Any]]]
+    _prepared: bool
 
     def __init__(
         self,
@@ -124,6 +179,14 @@ class ModuleCollector(BaseCollector):
         name_to_path: Optional[dict[str, str]] = None,
         out_name: Optional[str] = None,
         enable_yaml_header: bool = False,
+        split_classes: bool = False,
+        max_symbols: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        recursive: bool = True,
+        module_selector: Optional[Selector] = None,
+        symbol_selector: Optional[Selector] = None,
+        sink: Optional[Sink] = None,
+        fold_below: Optional[int] = None,
     ):
         """
         **Args**
@@ -134,6 +197,14 @@ class ModuleCollector(BaseCollector):
         * out_name (`str`): Output file name.
         * enable_yaml_header (`bool`): a flag for deciding whether to include
             yaml header.
+        * split_classes (`bool`): Put each class on its own page.
+        * max_symbols (`Optional[int]`): Threshold of symbols to split the page.
+        * max_bytes (`Optional[int]`): Threshold of document size to split the page.
+        * recursive (`bool`): Document submodules too.
+        * module_selector (`Optional[Selector]`): Select submodules.
+        * symbol_selector (`Optional[Selector]`): Select members.
+        * sink (`Optional[Sink]`): Default: `inari.sinks.FileSink` .
+        * fold_below (`Optional[int]`): Threshold of symbols to fold the module.
 
         """
         self.mod = mod
@@ -142,6 +213,18 @@ class ModuleCollector(BaseCollector):
         super().__init__(abs_path=abs_path, name_to_path=name_to_path)
         self.relpaths = {}
         self.enable_yaml_header = enable_yaml_header
+        self.split_classes = split_classes
+        self.max_symbols = max_symbols
+        self.max_bytes = max_bytes
+        self.class_pages = {}
+        self.recursive = recursive
+        self.module_selector = module_selector or Selector()
+        self.symbol_selector = symbol_selector or Selector()
+        self.sink = sink or FileSink()
+        self.fold_below = fold_below
+        self.folded = False
+        self._members = None
+        self._prepared = False
 
         mod_path = inspect.getfile(mod)
         if mod_path.endswith("__init__.py"):
@@ -165,8 +248,11 @@ class ModuleCollector(BaseCollector):
                 self.abs_path += "-py"
                 self.name_to_path[mod.__name__] = self.abs_path
             self.filename = f"{name}.md"
+        self._own_page = (self.abs_path, self.filename)
 
         self.doc = inspect.getdoc(self.mod) or ""
+        if hooks.wants("module_discovered"):
+            hooks.emit("module_discovered", self, timer.imports.get(mod.__name__, 0.0))
 
     def init_submodules(self) -> None:
         """
@@ -177,9 +263,10 @@ class ModuleCollector(BaseCollector):
             # get submodules.
             module_path = getattr(self.mod, "__path__", [])
             submods = [
-                import_module(f"{self.mod.__name__}.{x.name}")
+                timer.import_module(f"{self.mod.__name__}.{x.name}")
                 for x in walk_packages(module_path)
                 if not x.name.startswith("_")
+                and self.module_selector.may_contain(f"{self.mod.__name__}.{x.name}")
             ]
             for submod in submods:
                 key = inspect.getfile(submod)
@@ -190,6 +277,13 @@ class ModuleCollector(BaseCollector):
                         self.out_dir,
                         self.name_to_path,
                         enable_yaml_header=self.enable_yaml_header,
+                        split_classes=self.split_classes,
+                        max_symbols=self.max_symbols,
+                        max_bytes=self.max_bytes,
+                        module_selector=self.module_selector,
+                        symbol_selector=self.symbol_selector,
+                        sink=self.sink,
+                        fold_below=self.fold_below,
                     ),
                 )
 
@@ -197,6 +291,8 @@ class ModuleCollector(BaseCollector):
             # no submodules.
             self.submodules = {}
 
+        if not self.recursive:
+            return
         for submodule in self.submodules.values():
             submodule._prepare_docs()
 
@@ -204,11 +300,18 @@ class ModuleCollector(BaseCollector):
         """Find public classes defined in the module."""
         mod_classes = [
             x[1]
-            for x in inspect.getmembers(self.mod, inspect.isclass)
-            if (not x[0].startswith("_")) and (inspect.getmodule(x[1]) == self.mod)
+            for x in self.public_members()
+            if inspect.isclass(x[1])
+            and self._select(x[0])
+            and (inspect.getmodule(x[1]) == self.mod)
         ]
         self.classes = [
-            ClassCollector(c, name_to_path=self.name_to_path, abs_path=self.abs_path)
+            ClassCollector(
+                c,
+                name_to_path=self.name_to_path,
+                abs_path=self.abs_path,
+                selector=self.symbol_selector,
+            )
             for c in mod_classes
         ]
 
@@ -226,8 +329,8 @@ class ModuleCollector(BaseCollector):
 
         mod_vars = [
             {"name": x[0], "value": x[1], "doc": var_docs[x[0]]}
-            for x in inspect.getmembers(self.mod, is_var)
-            if (not x[0].startswith("_")) and (x[0] in var_docs)
+            for x in self.public_members()
+            if (x[0] in var_docs) and is_var(x[1]) and self._select(x[0])
         ]
 
         self.variables = [
@@ -245,73 +348,137 @@ class ModuleCollector(BaseCollector):
         """Find public functions in the module."""
         mod_functions = [
             x[1]
-            for x in inspect.getmembers(
-                self.mod,
-                lambda f: (inspect.isroutine(f) and (inspect.getmodule(f) is self.mod)),
-            )
-            if (not x[0].startswith("_"))
+            for x in self.public_members()
+            if inspect.isroutine(x[1])
+            and (inspect.getmodule(x[1]) is self.mod)
+            and self._select(x[0])
         ]
         self.functions = [
             FunctionCollector(m, name_to_path=self.name_to_path, abs_path=self.abs_path)
             for m in mod_functions
         ]
 
+    def public_members(self) -> list[tuple[str, Any]]:
+        """
+        Names and values in the module namespace without `_` prefix, sorted by
+        names. Scanned once after each reload, and shared by `init_*` methods.
+        """
+        if self._members is None:
+            self._members = sorted(
+                (name, value)
+                for name, value in vars(self.mod).items()
+                if not name.startswith("_")
+            )
+        return self._members
+
+    def _select(self, name: str) -> bool:
+        return self.symbol_selector.match(f"{self.mod.__name__}.{name}")
+
     def doc_str(self) -> str:
         self._prepare_docs()
+        self.make_relpaths()
         return self._doc_str()
 
     def _doc_str(self) -> str:
-        yaml_header = self.make_yaml_header()
+        return self.make_links(self._unlinked_doc_str())
+
+    def _unlinked_doc_str(self) -> str:
+        return join_fragments([self.make_yaml_header(), *self._fragments()])
 
+    def _fragments(
+        self, relpaths: Optional[dict[str, tuple[str, str]]] = None
+    ) -> list[str]:
+        """
+        Parts of the page without the yaml header and links, in order. Each class
+        and function is a single fragment. Submodules are linked by `relpaths` ,
+        default: `self.relpaths` .
+        """
+        if relpaths is None:
+            relpaths = self.relpaths
         mod_head = f"# Module {self.mod.__name__}"
         mod_ds = self.doc
 
         def submod_to_link(sub_name: str) -> str:
-            rel_path = self.relpaths[sub_name][0]
+            # folded modules are linked by their anchors.
+            rel_path = "".join(relpaths[sub_name])
             return f"[{sub_name}]({rel_path})"
 
         submodules_head = "## Submodules"
         submodules = [submod_to_link(x.mod.__name__) for x in self.submodules.values()]
-        submodules_list = join_fragments(submodules)
         if not submodules:
             submodules_head = ""
 
         vars_head = "## Variables"
-        vars_ = [x.doc_str() for x in self.variables]
-        vars_list = join_fragments(vars_)
+        vars_ = [self._render(x) for x in self.variables]
         if not vars_:
             vars_head = ""
 
         classes_head = "## Classes"
-        classes = [x.doc_str() for x in self.classes]
-        classes_list = "\n\n------\n\n".join(classes)
+        if self.class_pages:
+            # link to each page of classes.
+            classes = [
+                " ".join(["*", f"`{path_to_name(x.abs_path)}`", summarize(x.doc)])
+                for x in self.classes
+            ]
+            classes = ["\n".join(classes)]
+        else:
+            classes = _separate([self._render(x) for x in self.classes])
         if not classes:
             classes_head = ""
 
         functions_head = "## Functions"
-        functions = [x.doc_str() for x in self.functions]
-        functions_list = "\n\n------\n\n".join(functions)
+        functions = _separate([self._render(x) for x in self.functions])
         if not functions:
             functions_head = ""
 
-        doc = join_fragments(
-            [
-                yaml_header,
-                mod_head,
-                mod_ds,
-                submodules_head,
-                submodules_list,
-                vars_head,
-                vars_list,
-                classes_head,
-                classes_list,
-                functions_head,
-                functions_list,
-            ]
+        sections = _separate(
+            [join_fragments(x._section_fragments()) for x in self.folded_submodules()]
         )
+        if sections and (vars_ or classes or functions):
+            sections.insert(0, "------")
+
+        fragments = [
+            mod_head,
+            mod_ds,
+            submodules_head,
+            *submodules,
+            vars_head,
+            *vars_,
+            classes_head,
+            *classes,
+            functions_head,
+            *functions,
+            *sections,
+        ]
+        return [x.strip() for x in fragments if x.strip()]
 
-        doc = self.make_links(doc)
-        return doc
+    def _section_fragments(self) -> list[str]:
+        """Parts of the section of the folded module in the parent page."""
+        h = ""
+        if markdown:
+            h = f" {{: #{self.abs_path.split('#')[-1]} }}"
+        fragments = [
+            f"## Module {self.mod.__name__}{h}",
+            self.doc,
+            *[self._render(x) for x in self.variables],
+            *_separate([self._render(x) for x in [*self.classes, *self.functions]]),
+        ]
+        return [x.strip() for x in fragments if x.strip()]
+
+    def folded_submodules(self) -> list["ModuleCollector"]:
+        """
+        Submodules documented in this page. They are collected if not yet, even if
+        `recursive` is `False` .
+        """
+        if self.fold_below is None:
+            return []
+        folded = []
+        for submodule in self.submodules.values():
+            if not submodule._prepared and not submodule._has_submodules:
+                submodule._prepare_docs()
+            if submodule.folded:
+                folded.append(submodule)
+        return folded
 
     def make_relpaths(self) -> None:
         """
@@ -324,44 +491,30 @@ class ModuleCollector(BaseCollector):
         ~~~
 
         """
-        current_page = self.abs_path
-        if not current_page.endswith("-py"):
-            current_page = f"{current_page}/index".replace("//", "/")
-        for name, path in self.name_to_path.items():
-            if "#" in path:
-                relpath, hash_ = path.split("#")
-                hash_ = "#" + hash_
-            else:
-                relpath, hash_ = path, ""
-            if not relpath.endswith("-py"):
-                relpath = f"{relpath}/index".replace("//", "/")
-
-            relpath = get_relative_path(current_page, relpath)
+        self.relpaths = self._make_relpaths(to_page(self.abs_path.split("#")[0]))
 
-            if relpath:
-                relpath = relpath + ".md"
+    def _make_relpaths(
+        self, current_page: str, suffix: str = ".md"
+    ) -> dict[str, tuple[str, str]]:
+        return make_relpaths(self.name_to_path, current_page, suffix)
 
-            self.relpaths[name] = (relpath, hash_)
-
-    def make_links(self, doc: str) -> str:
+    def make_links(
+        self, doc: str, relpaths: Optional[dict[str, tuple[str, str]]] = None
+    ) -> str:
         """
         Create internal link on back-quoted name.
 
         To ignore this, append a space like `"foo.bar "` .
 
-        """
+        **Args**
 
-        for long_name, rel_hash in self.relpaths.items():
-            _, hash_id = rel_hash
-            if hash_id:
-                short_name = hash_id.removeprefix("#")
-            else:
-                short_name = long_name.rsplit(".", 1)[-1]
-            # append a space after short_name because of avoiding unexpected replacing.
-            doc = doc.replace(
-                f"`{long_name}`", f"[`{short_name} `]({''.join(rel_hash)})"
-            )
-        return doc
+        * doc (`str`): Document to replace names.
+        * relpaths (`Optional[dict[str, tuple[str, str]]]`): Default: `self.relpaths` .
+
+        """
+        if relpaths is None:
+            relpaths = self.relpaths
+        return link_names(doc, relpaths)
 
     def make_yaml_header(self) -> str:
         """
@@ -375,9 +528,14 @@ class ModuleCollector(BaseCollector):
         )
         return header
 
-    def remove_old_submodules(self) -> None:
+    def remove_old_submodules(self, suffix: str = ".md") -> None:
         """
         Remove documents and collectors of deleted modules.
+
+        **Args**
+
+        * suffix (`str`): Suffix of documents, like `.html` .
+
         """
         if not self._has_submodules:
             return
@@ -385,35 +543,163 @@ class ModuleCollector(BaseCollector):
         new_modules: dict[str, ModuleCollector] = {
             path: submodule
             for path, submodule in self.submodules.items()
-            if os.path.isfile(path)
+            if _source_exists(submodule.mod, path)
         }
 
-        filenames = [
-            f for f in os.listdir(self.out_dir) if os.path.isfile(self.out_dir / f)
-        ]
+        filenames = self.sink.listdir(self.out_dir)
 
         submodule_filenames = [x.filename for x in new_modules.values()]
+        submodule_filenames.extend(self.class_pages)
+        submodule_filenames = [
+            x.removesuffix(".md") + suffix for x in submodule_filenames
+        ]
 
         def is_not_used(s: str) -> bool:
             path = pathlib.PurePath(s)
             filename = path.name
-            if filename == "index.md":
+            if filename == f"index{suffix}":
                 return False
             return filename not in submodule_filenames
 
         unused_filenames = filter(is_not_used, filenames)
 
         for unused_filename in unused_filenames:
-            os.remove(self.out_dir / unused_filename)
+            self.sink.remove(self.out_dir / unused_filename)
         self.submodules = new_modules
 
+    def module_digest(self) -> str:
+        """
+        Digest of the module source, used to skip unchanged documents.
+
+        **Returns**
+
+        * `str`: MD5 hex digest of the source. Blank modules share the same digest.
+
+        """
+        try:
+            source = inspect.getsource(self.mod)
+        except OSError:
+            source = ""
+        return hashlib.md5(source.encode("utf-8")).hexdigest()
+
+    def split_pages(self) -> None:
+        """
+        Move classes to their own pages, like `{module}-py/{class}-cls.md` , if
+        `split_classes` is set or the module exceeds `max_symbols` / `max_bytes` .
+        """
+        self.class_pages = {}
+        if not self.classes or not self._should_split():
+            return
+
+        # `{out_dir}/{module}-py/` for modules, `{out_dir}/` for packages.
+        if self.abs_path.endswith("-py"):
+            class_dir = self.filename.removesuffix(".md") + "/"
+        else:
+            class_dir = ""
+        classes = []
+        for c in self.classes:
+            page_name = f"{c.cls.__qualname__}-cls"
+            collector = ClassCollector(
+                c.cls,
+                abs_path=f"{self.abs_path}/{page_name}",
+                name_to_path=self.name_to_path,
+                selector=self.symbol_selector,
+            )
+            # paths of members registered on the module page are overwritten.
+            classes.append(collector)
+            self.class_pages[f"{class_dir}{page_name}.md"] = collector
+        self.classes = classes
+
+    def _should_split(self) -> bool:
+        if self.split_classes:
+            return True
+        if self.max_symbols is not None:
+            count = len(self.classes) + len(self.functions) + len(self.variables)
+            if count > self.max_symbols:
+                return True
+        if self.max_bytes is not None:
+            docs = [x.doc_str() for x in [*self.classes, *self.functions]]
+            if sum(len(x.encode("utf-8")) for x in docs) > self.max_bytes:
+                return True
+        return False
+
+    def _class_doc_str(
+        self,
+        collector: "ClassCollector",
+        relpaths: Optional[dict[str, tuple[str, str]]] = None,
+    ) -> str:
+        if relpaths is None:
+            relpaths = self._make_relpaths(collector.abs_path.split("#", 1)[0])
+        return self.make_links(self._unlinked_class_doc_str(collector), relpaths)
+
+    def _unlinked_class_doc_str(self, collector: "ClassCollector") -> str:
+        long_name = path_to_name(collector.abs_path)
+        if self.enable_yaml_header:
+            yaml_header = build_yaml_header(
+                title=long_name, module_digest=self._module_digest
+            )
+        else:
+            yaml_header = ""
+        return join_fragments([yaml_header, *self._class_fragments(collector)])
+
+    def _class_fragments(self, collector: "ClassCollector") -> list[str]:
+        return [f"# Class {path_to_name(collector.abs_path)}", self._render(collector)]
+
+    def _render(self, collector: BaseCollector) -> str:
+        """`doc_str` of the member, passed to `symbol_rendered` hooks."""
+        if not hooks.wants("symbol_rendered"):
+            return collector.doc_str()
+        start = time.perf_counter()
+        doc = collector.doc_str()
+        seconds = time.perf_counter() - start
+        return hooks.emit("symbol_rendered", collector, seconds, doc)
+
     def _prepare_docs(self) -> None:
-        importlib.reload(self.mod)
+        reloaded = timer.refresh(self.mod)
+        # submodules may be added or deleted without changing this module.
         self.init_submodules()
+        if self._prepared and not reloaded:
+            return
+        start = time.perf_counter()
+        self._members = None
+        if self.folded:
+            self._unfold()
         self.init_vars()
         self.init_classes()
         self.init_functions()
-        self.make_relpaths()
+        self.split_pages()
+        if self._should_fold():
+            self._fold()
+        self._prepared = True
+        if hooks.wants("module_collected"):
+            hooks.emit("module_collected", self, time.perf_counter() - start)
+
+    def _should_fold(self) -> bool:
+        if self.fold_below is None or self._has_submodules or self.class_pages:
+            return False
+        # the parent package should be documented in this build.
+        parent = self.mod.__name__.rpartition(".")[0]
+        if self.name_to_path.get(parent) != "/" + parent.replace(".", "/"):
+            return False
+        count = len(self.classes) + len(self.functions) + len(self.variables)
+        return count < self.fold_below
+
+    def _fold(self) -> None:
+        """Move the module and its members to a section of the parent page."""
+        parent, _, name = self.mod.__name__.rpartition(".")
+        self.abs_path = "/" + parent.replace(".", "/") + "#" + name
+        self.filename = "index.md"
+        self.name_to_path[self.mod.__name__] = self.abs_path
+        # paths of members are registered again under the section.
+        self.init_vars()
+        self.init_classes()
+        self.init_functions()
+        self.folded = True
+
+    def _unfold(self) -> None:
+        self.abs_path, self.filename = self._own_page
+        self.name_to_path[self.mod.__name__] = self.abs_path
+        self.folded = False
 
     def write(self) -> None:
         """Write documents to files. Directories are created automatically."""
@@ -421,40 +707,122 @@ class ModuleCollector(BaseCollector):
         self._prepare_docs()
         self._write()
 
-    def _write(self) -> None:
-        os.makedirs(self.out_dir, exist_ok=True)
+    def _write(self, force: bool = False) -> None:
+        for path, render in self._pages(force):
+            self._write_page(path, render)
+
+        if not self.recursive:
+            return
+        # write submodules.
+        for submod in self.submodules.values():
+            submod._write()
+
+    def _pages(
+        self, force: bool = False
+    ) -> list[tuple[pathlib.Path, Callable[[], str]]]:
+        """
+        Remove outdated pages, and find pages to write. Paths and links are
+        resolved here, so rendering only reads the collector and runs in any thread.
+        """
+        if self.folded:
+            # written in the page of the parent package.
+            return []
         self.remove_old_submodules()
-        try:
-            source = inspect.getsource(self.mod)
-        except OSError:
-            source = ""
-        current_digest = hashlib.md5(source.encode("utf-8")).hexdigest()
-
-        if os.path.isfile(self.out_dir / self.filename):
-            with open(
-                self.out_dir / self.filename, mode="r", newline="\n", encoding="utf-8"
-            ) as index:
-                content = index.read()
-                matched = re.match(
-                    r"^---\n(.+)\n---\n", content, re.MULTILINE | re.DOTALL
-                )
-                headers = matched.group(0) if matched else ""
+        current_digest = self.module_digest()
+        folded = self.folded_submodules()
+        if folded:
+            digests = [current_digest, *[x.module_digest() for x in folded]]
+            current_digest = hashlib.md5("".join(digests).encode()).hexdigest()
+
+        content = self.sink.read(self.out_dir / self.filename)
+        if content is not None:
+            matched = re.match(r"^---\n(.+)\n---\n", content, re.MULTILINE | re.DOTALL)
+            headers = matched.group(0) if matched else ""
         else:
             headers = ""
 
-        modified = current_digest not in headers
+        modified = force or current_digest not in headers
+        self._module_digest = current_digest
 
+        pages: list[tuple[pathlib.Path, Callable[[], str]]] = []
         if modified:
-            self._module_digest = current_digest
-            # write self.
-            with open(
-                self.out_dir / self.filename, mode="w", newline="\n", encoding="utf-8"
-            ) as index:
-                index.write(self._doc_str())
+            # paths of all modules are registered before writing.
+            self.make_relpaths()
+            submodules = [
+                self.relpaths[x.mod.__name__] for x in self.submodules.values()
+            ]
+            key = self._page_key(
+                self.filename,
+                submodules,
+                [x.mod.__name__ for x in folded],
+                markdown is not None,
+            )
+            render = partial(
+                self._render_page, key, self._unlinked_doc_str, self.relpaths
+            )
+            pages.append((self.out_dir / self.filename, render))
+
+        self.remove_old_class_pages()
+
+        for filename, collector in self.class_pages.items():
+            path = self.out_dir / filename
+            if not modified and self.sink.exists(path):
+                continue
+            relpaths = self._make_relpaths(collector.abs_path.split("#", 1)[0])
+            unlinked = partial(self._unlinked_class_doc_str, collector)
+            key = self._page_key(filename, markdown is not None)
+            render = partial(self._render_page, key, unlinked, relpaths)
+            pages.append((path, render))
+        return pages
+
+    def remove_old_class_pages(self, suffix: str = ".md") -> None:
+        """
+        Remove documents of deleted classes in `{module}-py/` .
 
-        # write submodules.
-        for submod in self.submodules.values():
-            submod._write()
+        **Args**
+
+        * suffix (`str`): Suffix of documents, like `.html` .
+
+        """
+        if not self.abs_path.endswith("-py"):
+            return
+        class_dir = self.out_dir / self.filename.removesuffix(".md")
+        for filename in self.sink.listdir(class_dir):
+            relpath = f"{class_dir.name}/{filename.removesuffix(suffix)}.md"
+            if filename.endswith(f"-cls{suffix}") and relpath not in self.class_pages:
+                self.sink.remove(class_dir / filename)
+
+    def _page_key(self, filename: str, *inputs: Any) -> str:
+        """Digest of inputs of the page before linking. See `inari.buildcache` ."""
+        return build_cache.key(
+            self.mod.__name__,
+            filename,
+            self._module_digest,
+            self.enable_yaml_header,
+            sorted(self.class_pages),
+            self.symbol_selector.include,
+            self.symbol_selector.exclude,
+            *inputs,
+        )
+
+    def _render_page(
+        self,
+        key: str,
+        unlinked: Callable[[], str],
+        relpaths: dict[str, tuple[str, str]],
+    ) -> str:
+        """Render the page before linking, or read it from the build cache."""
+        return self.make_links(build_cache.page(key, unlinked), relpaths)
+
+    def _write_page(self, path: pathlib.Path, render: Callable[[], str]) -> None:
+        """Render and write the page, and emit `page_written` ."""
+        if not hooks.wants("page_written"):
+            self.sink.write(path, render())
+            return
+        start = time.perf_counter()
+        content = render()
+        self.sink.write(path, content)
+        hooks.emit("page_written", self, time.perf_counter() - start, content, path)
 
 
 class VariableCollector(BaseCollector):
@@ -501,16 +869,13 @@ class VariableCollector(BaseCollector):
             self._should_skip = True
             return
         self.name = name.rsplit(".")[-1]
-        module_name = ".".join([n for n in abs_path.split("/") if n]).replace("-py", "")
 
         if "#" in abs_path:
-            abs_path = f"{abs_path}.{self.name}"
-            long_name = module_name.replace("#", ".") + "." + self.name
+            self.abs_path = f"{abs_path}.{self.name}"
         else:
-            abs_path = f"{abs_path}#{self.name}"
-            long_name = module_name + "." + self.name
-        self.name_to_path[long_name] = abs_path
-        self.hash_ = "#" + abs_path.rsplit("#", 1)[-1]
+            self.abs_path = f"{abs_path}#{self.name}"
+        self.name_to_path[path_to_name(self.abs_path)] = self.abs_path
+        self.hash_ = "#" + self.abs_path.rsplit("#", 1)[-1]
 
     def doc_str(self) -> str:
         if self._should_skip:
@@ -522,7 +887,7 @@ class VariableCollector(BaseCollector):
             doc = f"* {self.name} {self.doc}"
         else:
             doc = f"* {self.name}"
-        return modify_attrs(doc, attributes)
+        return cache.normalize(doc, attributes, clean=False)
 
 
 class ClassCollector(BaseCollector):
@@ -536,6 +901,7 @@ class ClassCollector(BaseCollector):
     * variables (`list[VariableCollector]`): Class properties.
     * methods (`list[FunctionCollector]`): Methods of the class.
     * hash_ (`str`): Used for HTML id.
+    * selector (`Selector`): Select members by qualified names.
 
     """
 
@@ -545,32 +911,45 @@ class ClassCollector(BaseCollector):
     methods: list["FunctionCollector"]
 
     hash_: str
+    selector: Selector
 
-    def __init__(self, cls: type, abs_path: str, name_to_path: dict[str, str]):
+    def __init__(
+        self,
+        cls: type,
+        abs_path: str,
+        name_to_path: dict[str, str],
+        selector: Optional[Selector] = None,
+    ):
         """
         **Args**
 
         * cls (`type`): Class to make documents.
         * abs_path (`str`): See `inari.collectors.BaseCollector` .
         * name_to_path (`dict[str, str]`): See `inari.collectors.BaseCollector` .
+        * selector (`Optional[Selector]`): Select members.
 
         """
         self.cls = cls
-        self.doc = inspect.getdoc(cls) or ""
-        self.doc = modify_attrs(self.doc)
+        self.selector = selector or Selector()
+        self.doc = cache.getdoc(cls)
 
-        module_name = ".".join([n for n in abs_path.split("/") if n]).replace("-py", "")
-        long_name = module_name + "." + self.cls.__qualname__
-        self.hash_ = "#" + self.cls.__qualname__
-        abs_path = abs_path + self.hash_
+        if "#" in abs_path:
+            abs_path = f"{abs_path}.{self.cls.__qualname__}"
+        else:
+            abs_path = f"{abs_path}#{self.cls.__qualname__}"
+        self.hash_ = "#" + abs_path.split("#")[-1]
         super().__init__(abs_path=abs_path, name_to_path=name_to_path)
-        self.name_to_path[long_name] = self.abs_path
+        self.name_to_path[path_to_name(self.abs_path)] = self.abs_path
+        # register paths of members before pages are rendered.
+        self.init_variables()
+        self.init_methods()
+
+    def _select(self, name: str) -> bool:
+        return self.selector.match(f"{path_to_name(self.abs_path)}.{name}")
 
     def init_variables(self) -> None:
         cls_variables = [
-            x
-            for x in inspect.getmembers(self.cls, lambda v: v.__class__ is property)
-            if (not x[0].startswith("_"))
+            x for x in class_members(self.cls).properties if self._select(x[0])
         ]
         self.variables = [
             VariableCollector(
@@ -580,27 +959,13 @@ class ClassCollector(BaseCollector):
         ]
 
     def init_methods(self) -> None:
-        methods = [
-            x[1]
-            for x in inspect.getmembers(
-                self.cls,
-                lambda f: (
-                    inspect.isroutine(f)
-                    and (f.__class__ is not property)
-                    and f.__qualname__.startswith(self.cls.__qualname__)
-                    and not inspect.isbuiltin(f)
-                ),
-            )
-            if (not x[0].startswith("_"))
-        ]
+        methods = [x[1] for x in class_members(self.cls).methods if self._select(x[0])]
         self.methods = [
             FunctionCollector(m, name_to_path=self.name_to_path, abs_path=self.abs_path)
             for m in methods
         ]
 
     def doc_str(self) -> str:
-        self.init_variables()
-        self.init_methods()
         name = self.cls.__name__.rsplit(".")[-1]
         h = ""
         if markdown:
@@ -630,10 +995,9 @@ class ClassCollector(BaseCollector):
             defs = f"```python\nclass {name}{args_}\n```".replace(" -> None", "")
         init = self.cls.__init__
         if init.__qualname__.startswith(self.cls.__qualname__):
-            init_doc = inspect.getdoc(init) or ""
+            init_doc = cache.getdoc(init)
         else:
             init_doc = ""
-        init_doc = modify_attrs(init_doc)
         cls_doc = join_fragments([defs, self.doc, init_doc])
         # base classes
         bases_doc = ""
@@ -717,21 +1081,17 @@ class FunctionCollector(BaseCollector):
 
         """
         self.function = f
-        self.doc = inspect.getdoc(f) or ""
-        self.doc = modify_attrs(self.doc)
+        self.doc = cache.getdoc(f)
 
-        module_name = ".".join([n for n in abs_path.split("/") if n]).replace("-py", "")
         if "#" in abs_path:
             abs_path = f"{abs_path}.{f.__name__}"
-            long_name = module_name.replace("#", ".") + "." + f.__name__
         else:
             abs_path = f"{abs_path}#{f.__name__}"
-            long_name = module_name + "." + f.__name__
 
         self.hash_ = "#" + abs_path.split("#")[-1]
         super().__init__(abs_path=abs_path, name_to_path=name_to_path)
 
-        self.name_to_path[long_name] = self.abs_path
+        self.name_to_path[path_to_name(self.abs_path)] = self.abs_path
 
     def doc_str(self) -> str:
         # is method?
@@ -0,0 +1,279 @@
+"""
+daemon - Warm build server on a Unix domain socket.
+
+The daemon keeps root modules imported, with their collectors, the symbol index and
+the docstring cache, so each request only reloads and writes changed modules.
+Clients send one JSON object per connection, and receive one JSON object.
+
+Requests:
+
+* `{"command": "build"}` : Build all modules like `inari` CLI.
+* `{"command": "rebuild", "modules": [...]}` : Rebuild given modules and modules
+    linking to them.
+* `{"command": "render", "page": "pkg/mod-py.md"}` : Render the page without
+    writing it.
+* `{"command": "ping"}` , `{"command": "stop"}` .
+
+Responses have `ok` , and `modules` , `page` or `error` .
+"""
+
+import json
+import os
+import pathlib
+import socket
+import socketserver
+import time
+from collections.abc import Sequence
+from threading import Event
+from typing import Any, Optional, Union
+
+from .build import make_roots, write_roots
+from .collectors import ModuleCollector
+from .docstrings import cache, cache_path
+from .hooks import hooks
+from .imports import timer
+from .index import STATE_DIR, SymbolIndex, index_path, iter_collectors
+
+
+def socket_path(out_dir: Union[str, os.PathLike[str]]) -> pathlib.Path:
+    """
+    **Args**
+
+    * out_dir (`Union[str, Path]`): Output directory of the daemon.
+
+    **Returns**
+
+    * `Path`: Default location of the socket.
+
+    """
+    return pathlib.Path(out_dir) / STATE_DIR / "daemon.sock"
+
+
+class BuildDaemon:
+    """
+    Keep collectors of root modules, and build them on request.
+
+    **Attributes**
+
+    * roots (`list[ModuleCollector]`): Collectors sharing `name_to_path` .
+    * out_dir (`pathlib.Path`): Output directory.
+    * index (`SymbolIndex`): Symbol index, saved after each build.
+
+    """
+
+    roots: list[ModuleCollector]
+    out_dir: pathlib.Path
+    index: SymbolIndex
+
+    _stopped: bool
+
+    def __init__(
+        self,
+        root_names: Sequence[str],
+        out_dir: Union[str, os.PathLike[str]],
+        out_name: Optional[str] = None,
+        **options: Any,
+    ) -> None:
+        """
+        **Args**
+
+        * root_names (`Sequence[str]`): Root modules.
+        * out_dir (`Union[str, Path]`): Output directory.
+        * out_name (`Optional[str]`): See `inari.build.make_roots` .
+        * options (`Any`): Passed to `inari.collectors.ModuleCollector` .
+
+        """
+        self.out_dir = pathlib.Path(out_dir)
+        root_mods = [timer.import_module(name) for name in root_names]
+        self.roots = make_roots(root_mods, out_dir, out_name, **options)
+        self.index = SymbolIndex.load(index_path(out_dir))
+        cache.load(cache_path(out_dir))
+        self._stopped = False
+
+    def collectors(self) -> dict[str, ModuleCollector]:
+        """Collectors of all modules, keyed by module names."""
+        return {c.mod.__name__: c for root in self.roots for c in iter_collectors(root)}
+
+    def _save(self, before: dict[str, str]) -> list[str]:
+        """Save build states, and return modules whose digests are changed."""
+        self.index.dump(index_path(self.out_dir))
+        cache.dump(cache_path(self.out_dir))
+        return sorted(
+            name
+            for name, (digest, _) in self.index.modules.items()
+            if before.get(name) != digest
+        )
+
+    def _digests(self) -> dict[str, str]:
+        return {name: digest for name, (digest, _) in self.index.modules.items()}
+
+    def build(self) -> list[str]:
+        """
+        Build all modules. Unchanged modules are neither reloaded nor written.
+
+        **Returns**
+
+        * `list[str]`: Modules whose sources are changed since the last build.
+
+        """
+        timer.clear()
+        before = self._digests()
+        write_roots(self.roots)
+        for root in self.roots:
+            self.index.update(root, self.out_dir)
+        return self._save(before)
+
+    def rebuild(self, names: Sequence[str]) -> list[str]:
+        """
+        Rebuild given modules and modules linking to them, even if unchanged.
+
+        **Args**
+
+        * names (`Sequence[str]`): Module names.
+
+        **Returns**
+
+        * `list[str]`: Rebuilt modules.
+
+        """
+        timer.clear()
+        start = time.perf_counter()
+        collectors = self.collectors()
+        unknown = [n for n in names if n not in collectors]
+        if unknown:
+            raise ValueError(f"Unknown modules: {', '.join(unknown)}")
+        targets = sorted({*names, *self.index.dependents(names)} & set(collectors))
+        before = self._digests()
+        folded = {n for n in targets if collectors[n].folded}
+        for name in targets:
+            collectors[name]._prepare_docs()
+        # folded modules are written in the page of their parent.
+        folded.update(n for n in targets if collectors[n].folded)
+        parents = {n.rsplit(".", 1)[0] for n in folded} - set(targets)
+        for name in sorted(parents):
+            collectors[name]._prepare_docs()
+        targets = sorted({*targets, *parents})
+        for name in targets:
+            collectors[name]._write(force=True)
+        self.index.update_modules([collectors[n] for n in targets], self.out_dir)
+        self._save(before)
+        if hooks.wants("build_finished"):
+            written = [collectors[n] for n in targets]
+            hooks.emit("build_finished", written, time.perf_counter() - start)
+        return targets
+
+    def render(self, page: str) -> Optional[str]:
+        """
+        **Args**
+
+        * page (`str`): Page path relative to `out_dir` , like `pkg/mod-py.md` .
+
+        **Returns**
+
+        * `Optional[str]`: Markdown document, or `None` if the page is not found.
+
+        """
+        for collector in self.collectors().values():
+            if self._relpage(collector.out_dir / collector.filename) == page:
+                collector._prepare_docs()
+                collector.make_relpaths()
+                return collector._doc_str()
+            for filename, class_collector in collector.class_pages.items():
+                if self._relpage(collector.out_dir / filename) == page:
+                    collector._prepare_docs()
+                    return collector._class_doc_str(class_collector)
+        return None
+
+    def _relpage(self, path: pathlib.Path) -> str:
+        return pathlib.Path(os.path.relpath(path, self.out_dir)).as_posix()
+
+    def handle(self, request: dict[str, Any]) -> dict[str, Any]:
+        """
+        **Args**
+
+        * request (`dict[str, Any]`): Decoded request.
+
+        **Returns**
+
+        * `dict[str, Any]`: Response. Errors are returned, not raised.
+
+        """
+        command = request.get("command")
+        try:
+            if command == "ping":
+                return {"ok": True}
+            if command == "stop":
+                self._stopped = True
+                return {"ok": True}
+            if command == "build":
+                return {"ok": True, "modules": self.build()}
+            if command == "rebuild":
+                return {"ok": True, "modules": self.rebuild(request["modules"])}
+            if command == "render":
+                doc = self.render(request["page"])
+                if doc is None:
+                    return {"ok": False, "error": f"Page not found: {request['page']}"}
+                return {"ok": True, "page": doc}
+        except Exception as e:
+            return {"ok": False, "error": f"{type(e).__name__}: {e}"}
+        return {"ok": False, "error": f"Unknown command: {command}"}
+
+    def serve_forever(
+        self, path: Union[str, os.PathLike[str]], ready: Optional[Event] = None
+    ) -> None:
+        """
+        Build all modules, then handle requests one by one until `stop` .
+
+        **Args**
+
+        * path (`Union[str, Path]`): Socket file. Replaced if it exists.
+        * ready (`Optional[Event]`): Set when the socket accepts requests.
+
+        """
+        daemon = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self) -> None:
+                try:
+                    request = json.loads(self.rfile.readline())
+                except ValueError:
+                    response = {"ok": False, "error": "Invalid request"}
+                else:
+                    response = daemon.handle(request)
+                self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+
+        self.build()
+        os.makedirs(pathlib.Path(path).parent, exist_ok=True)
+        if os.path.exists(path):
+            os.remove(path)
+        with socketserver.UnixStreamServer(os.fspath(path), Handler) as server:
+            print(f"Listening on {path}")
+            if ready:
+                ready.set()
+            try:
+                while not self._stopped:
+                    server.handle_request()
+            finally:
+                os.remove(path)
+
+
+def request(path: Union[str, os.PathLike[str]], **payload: Any) -> dict[str, Any]:
+    """
+    Send a request to the daemon.
+
+    **Args**
+
+    * path (`Union[str, Path]`): Socket file.
+    * payload (`Any`): Request like `command="render", page="pkg/mod-py.md"` .
+
+    **Returns**
+
+    * `dict[str, Any]`: Response.
+
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(os.fspath(path))
+        client.sendall(json.dumps(payload).encode("utf-8") + b"\n")
+        with client.makefile("rb") as f:
+            response: dict[str, Any] = json.loads(f.readline())
+    return response
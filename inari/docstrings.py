@@ -0,0 +1,166 @@
+"""
+docstrings - Memoized docstring normalization.
+
+`inspect.cleandoc` and `modify_attrs` run once for each distinct docstring and
+attribute suffix. Results are kept in a bounded LRU cache, which is saved with other
+build states so that warm builds reuse it.
+"""
+
+import inspect
+import json
+import os
+import pathlib
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Union
+
+from ._internal._format import modify_attrs
+
+CACHE_VERSION = 1
+"""(`int`): Bumped when the output of normalization is changed."""
+
+
+def cache_path(out_dir: Union[str, os.PathLike[str]]) -> pathlib.Path:
+    """
+    **Args**
+
+    * out_dir (`Union[str, Path]`): Output directory given to the build.
+
+    **Returns**
+
+    * `Path`: Location of the saved cache.
+
+    """
+    # `inari.index` depends on collectors, which depend on this module.
+    from .index import STATE_DIR
+
+    return pathlib.Path(out_dir) / STATE_DIR / "docstrings.json"
+
+
+class DocstringCache:
+    """
+    LRU cache of normalized docstrings, keyed by docstring text and attribute suffix.
+    Lookups are locked, so rendering threads share the cache.
+
+    **Attributes**
+
+    * maxsize (`int`): Maximum number of entries. The least recently used entry is
+        dropped first.
+    * hits (`int`): Number of lookups found in the cache.
+    * misses (`int`): Number of normalized docstrings.
+
+    """
+
+    maxsize: int
+    hits: int
+    misses: int
+
+    _entries: "OrderedDict[tuple[str, str, bool], str]"
+    _lock: Lock
+    _saved: dict[str, frozenset[tuple[str, str, bool]]]
+
+    def __init__(self, maxsize: int = 8192) -> None:
+        """
+        **Args**
+
+        * maxsize (`int`): Maximum number of entries.
+
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = Lock()
+        self._saved = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def normalize(self, doc: str, attributes: str = "", clean: bool = True) -> str:
+        """
+        **Args**
+
+        * doc (`str`): Docstring.
+        * attributes (`str`): Passed to `modify_attrs` , like `{: #Class.name }` .
+        * clean (`bool`): Apply `inspect.cleandoc` first. It is not idempotent, so
+            set `False` for cleaned docstrings.
+
+        **Returns**
+
+        * `str`: Same as `modify_attrs(inspect.cleandoc(doc), attributes)` .
+
+        """
+        key = (doc, attributes, clean)
+        with self._lock:
+            try:
+                normalized = self._entries[key]
+            except KeyError:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return normalized
+        # normalized out of the lock. Threads may normalize the same docstring.
+        normalized = modify_attrs(inspect.cleandoc(doc) if clean else doc, attributes)
+        with self._lock:
+            self._entries[key] = normalized
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return normalized
+
+    def getdoc(self, obj: Any, attributes: str = "") -> str:
+        """
+        Same as `inspect.getdoc` followed by `modify_attrs` . Inherited docstrings
+        are looked up only if the object has no docstring.
+        """
+        doc = getattr(obj, "__doc__", None)
+        if isinstance(doc, str):
+            return self.normalize(doc, attributes)
+        return self.normalize(inspect.getdoc(obj) or "", attributes, clean=False)
+
+    def clear(self) -> None:
+        """Drop entries and reset counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def load(self, path: Union[str, os.PathLike[str]]) -> None:
+        """Add entries of the saved cache. Missing or outdated files are ignored."""
+        try:
+            with open(path, mode="r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") != CACHE_VERSION:
+            return
+        keys = []
+        for doc, attributes, clean, normalized in data["entries"]:
+            keys.append((doc, attributes, clean))
+            self._entries.setdefault((doc, attributes, clean), normalized)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        self._saved[os.fspath(path)] = frozenset(keys)
+
+    def dump(self, path: Union[str, os.PathLike[str]]) -> None:
+        """
+        Save entries from the least recently used one. The file is not rewritten if
+        the same entries are loaded from or saved to it, so watchers like
+        `mkdocs serve` are not triggered by unchanged builds.
+        """
+        keys = frozenset(self._entries)
+        if self._saved.get(os.fspath(path)) == keys and os.path.isfile(path):
+            return
+        os.makedirs(pathlib.Path(path).parent, exist_ok=True)
+        entries = [[*key, value] for key, value in self._entries.items()]
+        with open(path, mode="w", newline="\n", encoding="utf-8") as f:
+            json.dump(
+                {"version": CACHE_VERSION, "entries": entries},
+                f,
+                ensure_ascii=False,
+                separators=(",", ":"),
+            )
+        self._saved[os.fspath(path)] = keys
+
+
+cache = DocstringCache()
+"""(`DocstringCache`): Shared by collectors."""
@@ -0,0 +1,164 @@
+"""
+export - Stream collected data as newline-delimited JSON.
+
+Modules are collected one by one, and their records are written before the next
+module is imported. Memory usage does not grow with the size of the package.
+"""
+
+import inspect
+import json
+from collections.abc import Iterator, Sequence
+from types import ModuleType
+from typing import Any, Optional, TextIO, TypedDict
+
+from ._internal._path import path_to_name
+from .collectors import ModuleCollector
+from .selectors import Selector
+
+
+class Record(TypedDict):
+    """
+    A line of the export.
+
+    **Attributes**
+
+    * name (`str`): Qualified name like `inari.collectors.ModuleCollector` .
+    * kind (`str`): `module` , `class` , `function` , `method` , `variable` or
+        `property` .
+    * signature (`str`): Like `(self, name: str) -> bool` . Blank for modules and
+        variables, or if not available.
+    * docstring (`str`): Cleaned docstring.
+    * bases (`list[str]`): Qualified names of direct base classes except `object` .
+    * path (`str`): Absolute path of the document, like `/pkg/mod-py#Class` .
+
+    """
+
+    name: str
+    kind: str
+    signature: str
+    docstring: str
+    bases: list[str]
+    path: str
+
+
+def _signature(obj: Any) -> str:
+    try:
+        return str(inspect.signature(obj))
+    except (TypeError, ValueError):
+        return ""
+
+
+def _record(path: str, kind: str, obj: Any = None, doc: Optional[str] = None) -> Record:
+    bases = [
+        f"{b.__module__}.{b.__qualname__}"
+        for b in getattr(obj, "__bases__", ())
+        if b is not object
+    ]
+    return {
+        "name": path_to_name(path),
+        "kind": kind,
+        "signature": _signature(obj) if callable(obj) else "",
+        "docstring": (inspect.getdoc(obj) or "") if doc is None else doc,
+        "bases": bases,
+        "path": path,
+    }
+
+
+def module_records(collector: ModuleCollector) -> Iterator[Record]:
+    """
+    **Args**
+
+    * collector (`ModuleCollector`): Collector with members initialized.
+
+    **Returns**
+
+    * `Iterator[Record]`: The module, its variables, classes with their members, and
+        functions.
+
+    """
+    module: Record = {
+        "name": collector.mod.__name__,
+        "kind": "module",
+        "signature": "",
+        "docstring": collector.doc,
+        "bases": [],
+        "path": collector.abs_path,
+    }
+    yield module
+    for v in collector.variables:
+        if not v._should_skip:
+            yield _record(v.abs_path, "variable", doc=v.doc)
+    for c in collector.classes:
+        yield _record(c.abs_path, "class", c.cls)
+        for p in c.variables:
+            if not p._should_skip:
+                yield _record(p.abs_path, "property", doc=p.doc)
+        for m in c.methods:
+            yield _record(m.abs_path, "method", m.function)
+    for f in collector.functions:
+        yield _record(f.abs_path, "function", f.function)
+
+
+def iter_modules(
+    root: ModuleType,
+    module_selector: Optional[Selector] = None,
+    symbol_selector: Optional[Selector] = None,
+) -> Iterator[ModuleCollector]:
+    """
+    Collect the root and its submodules in depth-first order. Each collector is
+    dropped after the next one is requested.
+
+    **Args**
+
+    * root (`ModuleType`): Root module.
+    * module_selector (`Optional[Selector]`): Select submodules.
+    * symbol_selector (`Optional[Selector]`): Select members.
+
+    **Returns**
+
+    * `Iterator[ModuleCollector]`: Collectors with members initialized, not submodules.
+
+    """
+    stack = [root]
+    while stack:
+        mod = stack.pop()
+        collector = ModuleCollector(
+            mod,
+            ".",
+            {},
+            recursive=False,
+            module_selector=module_selector,
+            symbol_selector=symbol_selector,
+        )
+        collector.init_submodules()
+        collector.init_vars()
+        collector.init_classes()
+        collector.init_functions()
+        children = [c.mod for c in collector.submodules.values()]
+        yield collector
+        stack.extend(reversed(children))
+
+
+def export(roots: Sequence[ModuleType], out: TextIO, **options: Any) -> int:
+    """
+    Write records of root modules as lines of JSON.
+
+    **Args**
+
+    * roots (`Sequence[ModuleType]`): Root modules.
+    * out (`TextIO`): Destination like `sys.stdout` . Flushed after each module.
+    * options (`Any`): Passed to `inari.export.iter_modules` .
+
+    **Returns**
+
+    * `int`: Number of written records.
+
+    """
+    count = 0
+    for root in roots:
+        for collector in iter_modules(root, **options):
+            for record in module_records(collector):
+                out.write(json.dumps(record, ensure_ascii=False) + "\n")
+                count += 1
+            out.flush()
+    return count
@@ -0,0 +1,152 @@
+"""
+hooks - Build events for extensions.
+
+Register callbacks to the shared `inari.hooks.hooks` :
+
+~~~python
+from inari.hooks import hooks
+
+@hooks.on("page_written")
+def report(event):
+    print(f"{event.path}: {event.seconds * 1000:.1f}ms")
+~~~
+
+Events are:
+
+* `module_discovered` : A module collector is created. `seconds` is the time to
+    import the module, or `0.0` if it was imported before.
+* `module_collected` : Members of the module are collected. Not emitted if the
+    module is unchanged since the previous collection.
+* `symbol_rendered` : A class, function or variable of a module is rendered into
+    `content` . Callbacks may return a string to replace it. Called from rendering
+    threads with `inari.build.write_pages` .
+* `page_written` : A markdown page of the module or its class is written to
+    `path` . `seconds` includes rendering.
+* `build_finished` : All pages are written. `collector` is the list of root
+    collectors, or written modules of partial builds like `--since` . `seconds` is
+    the time to collect and write them.
+
+Events without callbacks are not timed, so builds without hooks are not slowed.
+"""
+
+import pathlib
+from typing import Any, Callable, NamedTuple, Optional
+
+EVENTS = (
+    "module_discovered",
+    "module_collected",
+    "symbol_rendered",
+    "page_written",
+    "build_finished",
+)
+"""(`tuple[str, ...]`): Names of events, in the order of a build."""
+
+
+class Event(NamedTuple):
+    """
+    Passed to callbacks.
+
+    **Attributes**
+
+    * name (`str`): One of `inari.hooks.EVENTS` .
+    * collector (`Any`): Collector of the module or the symbol. Root collectors for
+        `build_finished` .
+    * seconds (`float`): Time taken by the event.
+    * content (`str`): Rendered markdown for `symbol_rendered` and `page_written` .
+    * path (`Optional[pathlib.Path]`): Written page for `page_written` .
+
+    """
+
+    name: str
+    collector: Any
+    seconds: float
+    content: str = ""
+    path: Optional[pathlib.Path] = None
+
+
+Callback = Callable[[Event], Optional[str]]
+"""Callbacks receive an event. `symbol_rendered` callbacks may return new content."""
+
+
+class Hooks:
+    """Callbacks of build events, called in the order of registration."""
+
+    _callbacks: dict[str, list[Callback]]
+
+    def __init__(self) -> None:
+        self._callbacks = {}
+
+    def __bool__(self) -> bool:
+        return bool(self._callbacks)
+
+    def register(self, name: str, callback: Callback) -> None:
+        """
+        **Args**
+
+        * name (`str`): One of `inari.hooks.EVENTS` .
+        * callback (`Callback`): Called with `inari.hooks.Event` .
+
+        """
+        if name not in EVENTS:
+            raise ValueError(f"Unknown event: {name}")
+        self._callbacks.setdefault(name, []).append(callback)
+
+    def on(self, name: str) -> Callable[[Callback], Callback]:
+        """Decorator version of `inari.hooks.Hooks.register` ."""
+
+        def decorator(callback: Callback) -> Callback:
+            self.register(name, callback)
+            return callback
+
+        return decorator
+
+    def unregister(self, name: str, callback: Callback) -> None:
+        """Remove the callback. Missing callbacks are ignored."""
+        callbacks = self._callbacks.get(name, [])
+        if callback in callbacks:
+            callbacks.remove(callback)
+        if not callbacks:
+            self._callbacks.pop(name, None)
+
+    def clear(self) -> None:
+        """Remove all callbacks."""
+        self._callbacks.clear()
+
+    def wants(self, name: str) -> bool:
+        """`True` if the event has callbacks. Check this before timing the event."""
+        return name in self._callbacks
+
+    def emit(
+        self,
+        name: str,
+        collector: Any,
+        seconds: float,
+        content: str = "",
+        path: Optional[pathlib.Path] = None,
+    ) -> str:
+        """
+        Call callbacks of the event.
+
+        **Args**
+
+        * name (`str`): One of `inari.hooks.EVENTS` .
+        * collector (`Any`): See `inari.hooks.Event` .
+        * seconds (`float`): See `inari.hooks.Event` .
+        * content (`str`): See `inari.hooks.Event` .
+        * path (`Optional[pathlib.Path]`): See `inari.hooks.Event` .
+
+        **Returns**
+
+        * `str`: Content returned by the last callback returning a string, or
+            `content` .
+
+        """
+        for callback in self._callbacks.get(name, []):
+            returned = callback(Event(name, collector, seconds, content, path))
+            if isinstance(returned, str):
+                content = returned
+        return content
+
+
+hooks = Hooks()
+"""(`Hooks`): Shared by collectors and builds."""
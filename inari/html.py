@@ -0,0 +1,209 @@
+"""
+html - Write HTML pages instead of markdown.
+
+Each class, function and other fragment of a page is converted separately, and the
+result is cached by the hash of the fragment. Unchanged fragments are never converted
+again, even in the next build.
+"""
+
+import hashlib
+import html
+import json
+import os
+import pathlib
+import time
+from collections.abc import Iterable, Sequence
+from typing import Optional, Union
+
+from ._internal._path import path_to_name, to_page
+from .build import _iter_written
+from .collectors import ModuleCollector
+from .hooks import hooks
+from .index import STATE_DIR
+from .memory import MemoryProfiler
+
+try:
+    import markdown
+except ImportError:
+    markdown = None  # type: ignore[assignment]
+
+EXTENSIONS = ["attr_list", "fenced_code", "tables"]
+"""(`list[str]`): Extensions of Python-Markdown used for conversion."""
+
+CACHE_VERSION = 1
+"""(`int`): Bumped when the format of the cache file is changed."""
+
+
+def cache_path(out_dir: Union[str, os.PathLike[str]]) -> pathlib.Path:
+    """
+    **Args**
+
+    * out_dir (`Union[str, Path]`): Output directory given to the build.
+
+    **Returns**
+
+    * `Path`: Location of the conversion cache.
+
+    """
+    return pathlib.Path(out_dir) / STATE_DIR / "html-cache.json"
+
+
+def page_html(title: str, body: str) -> str:
+    """Wrap converted fragments in a minimal HTML document."""
+    return (
+        "<!DOCTYPE html>\n<html><head><meta charset='utf-8'>"
+        + f"<title>{html.escape(title)}</title></head>\n"
+        + f"<body>\n{body}\n</body></html>\n"
+    )
+
+
+class HtmlConverter:
+    """
+    Convert markdown fragments to HTML with a cache.
+
+    **Attributes**
+
+    * cache (`dict[str, str]`): Converted HTML keyed by MD5 digests of fragments.
+    * hits (`int`): Number of fragments found in the cache.
+    * misses (`int`): Number of converted fragments.
+
+    """
+
+    cache: dict[str, str]
+    hits: int
+    misses: int
+
+    _used: set[str]
+
+    def __init__(self, cache: Optional[dict[str, str]] = None) -> None:
+        """
+        **Args**
+
+        * cache (`Optional[dict[str, str]]`): Cache of the previous build.
+
+        """
+        if markdown is None:
+            raise ImportError("`markdown` is required for HTML output.")
+        self.cache = {} if cache is None else cache
+        self.hits = 0
+        self.misses = 0
+        self._used = set()
+
+    @classmethod
+    def load(cls, path: Union[str, os.PathLike[str]]) -> "HtmlConverter":
+        """Read the cache file. A missing or outdated file gives an empty cache."""
+        try:
+            with open(path, mode="r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return cls()
+        if data.get("version") != CACHE_VERSION:
+            return cls()
+        return cls(data["fragments"])
+
+    def dump(self, path: Union[str, os.PathLike[str]]) -> None:
+        """Write fragments used in this build. Others are dropped."""
+        os.makedirs(pathlib.Path(path).parent, exist_ok=True)
+        fragments = {k: v for k, v in self.cache.items() if k in self._used}
+        with open(path, mode="w", newline="\n", encoding="utf-8") as f:
+            json.dump({"version": CACHE_VERSION, "fragments": fragments}, f)
+
+    def convert(self, fragment: str) -> str:
+        """
+        **Args**
+
+        * fragment (`str`): Markdown with links already made.
+
+        **Returns**
+
+        * `str`: HTML.
+
+        """
+        key = hashlib.md5(fragment.encode("utf-8")).hexdigest()
+        self._used.add(key)
+        if key in self.cache:
+            self.hits += 1
+            return self.cache[key]
+        self.misses += 1
+        converted: str = markdown.markdown(  # type: ignore[attr-defined]
+            fragment, extensions=EXTENSIONS
+        )
+        self.cache[key] = converted
+        return converted
+
+    def convert_page(self, title: str, fragments: Iterable[str]) -> str:
+        """Convert fragments, and join them into a page."""
+        body = "\n".join(self.convert(x) for x in fragments)
+        return page_html(title, body)
+
+
+def write_html(collector: ModuleCollector, converter: HtmlConverter) -> None:
+    """
+    Write HTML pages of the prepared module and its classes through its sink, and
+    remove pages of deleted modules and classes. Links point to `.html` pages.
+
+    **Args**
+
+    * collector (`ModuleCollector`): Prepared collector.
+    * converter (`HtmlConverter`): Shared converter.
+
+    """
+    collector.remove_old_submodules(".html")
+    collector.remove_old_class_pages(".html")
+    relpaths = collector._make_relpaths(to_page(collector.abs_path), ".html")
+    fragments = [
+        collector.make_links(x, relpaths) for x in collector._fragments(relpaths)
+    ]
+    path = collector.out_dir / (collector.filename.removesuffix(".md") + ".html")
+    title = collector.mod.__name__
+    collector.sink.write(path, converter.convert_page(title, fragments))
+
+    for filename, class_collector in collector.class_pages.items():
+        class_page = class_collector.abs_path.split("#", 1)[0]
+        class_relpaths = collector._make_relpaths(class_page, ".html")
+        fragments = [
+            collector.make_links(x, class_relpaths)
+            for x in collector._class_fragments(class_collector)
+        ]
+        path = collector.out_dir / (filename.removesuffix(".md") + ".html")
+        title = path_to_name(class_collector.abs_path)
+        collector.sink.write(path, converter.convert_page(title, fragments))
+
+
+def write_html_roots(
+    roots: Sequence[ModuleCollector],
+    out_dir: Union[str, os.PathLike[str]],
+    profiler: Optional[MemoryProfiler] = None,
+) -> HtmlConverter:
+    """
+    Same as `inari.build.write_roots` , but write HTML pages with the conversion
+    cache in `out_dir` .
+
+    **Args**
+
+    * roots (`Sequence[ModuleCollector]`): Collectors sharing `name_to_path` .
+    * out_dir (`Union[str, Path]`): Output directory, to store the cache.
+    * profiler (`Optional[MemoryProfiler]`): Snapshots are taken after collecting
+        and writing.
+
+    **Returns**
+
+    * `HtmlConverter`: Converter with statistics of this build.
+
+    """
+    path = cache_path(out_dir)
+    start = time.perf_counter()
+    converter = HtmlConverter.load(path)
+    for root in roots:
+        root._prepare_docs()
+    if profiler:
+        profiler.phase("collect")
+    for root in roots:
+        for collector in _iter_written(root):
+            write_html(collector, converter)
+    if profiler:
+        profiler.phase("write")
+    converter.dump(path)
+    if hooks.wants("build_finished"):
+        hooks.emit("build_finished", list(roots), time.perf_counter() - start)
+    return converter
@@ -0,0 +1,167 @@
+"""
+imports - Import, reload, and import time of documented modules.
+
+Import time of a module includes modules imported for the first time while it is
+executed, like third-party dependencies. Modules imported by another documented
+module first are counted in that module.
+
+Modules are reloaded only if their source files are changed, checked by stat and
+digest.
+"""
+
+import hashlib
+import importlib
+import os
+import sys
+import time
+from types import ModuleType
+from typing import Any, Optional
+
+
+class ImportTimer:
+    """
+    Record time of imports and reloads by collectors.
+
+    **Attributes**
+
+    * imports (`dict[str, float]`): Seconds to import each module first.
+    * reloads (`dict[str, float]`): Seconds to reload each module, summed.
+    * transitive (`dict[str, list[str]]`): Modules imported for the first time
+        while each module was imported.
+
+    """
+
+    imports: dict[str, float]
+    reloads: dict[str, float]
+    transitive: dict[str, list[str]]
+
+    _stamps: dict[str, tuple[int, int, str]]
+    _fresh: set[str]
+
+    def __init__(self) -> None:
+        self.imports = {}
+        self.reloads = {}
+        self.transitive = {}
+        self._stamps = {}
+        self._fresh = set()
+
+    def clear(self) -> None:
+        """Forget records of the previous build."""
+        self.imports.clear()
+        self.reloads.clear()
+        self.transitive.clear()
+
+    def import_module(self, name: str) -> ModuleType:
+        """Same as `importlib.import_module` , recording the first import."""
+        if name in sys.modules:
+            return importlib.import_module(name)
+        before = set(sys.modules)
+        start = time.perf_counter()
+        mod = importlib.import_module(name)
+        self.imports[name] = time.perf_counter() - start
+        self.transitive[name] = sorted(set(sys.modules) - before - {name})
+        self._fresh.add(name)
+        self._fresh.update(self.transitive[name])
+        return mod
+
+    def reload(self, mod: ModuleType) -> ModuleType:
+        """Same as `importlib.reload` , recording the time."""
+        start = time.perf_counter()
+        mod = importlib.reload(mod)
+        name = mod.__name__
+        self.reloads[name] = self.reloads.get(name, 0.0) + time.perf_counter() - start
+        return mod
+
+    def refresh(self, mod: ModuleType) -> bool:
+        """
+        Reload the module only if its source file is changed since the last check.
+        Modules imported by this timer are not reloaded at the first check.
+
+        **Args**
+
+        * mod (`ModuleType`): Module to check.
+
+        **Returns**
+
+        * `bool`: `True` if the module was reloaded.
+
+        """
+        name = mod.__name__
+        path = getattr(mod, "__file__", None) or ""
+        loader: Any = getattr(mod, "__loader__", None)
+        try:
+            stat = os.stat(path)
+            mtime, size = stat.st_mtime_ns, stat.st_size
+        except OSError:
+            if not hasattr(loader, "path_stats"):
+                self.reload(mod)
+                return True
+            # sources in archives, see `inari.archives` .
+            stats = loader.path_stats(path)
+            mtime, size = int(stats["mtime"] * 1e9), stats["size"]
+        known = self._stamps.get(name)
+        if known and known[:2] == (mtime, size):
+            return False
+        if os.path.isfile(path):
+            with open(path, mode="rb") as f:
+                digest = hashlib.md5(f.read()).hexdigest()
+        else:
+            digest = hashlib.md5(loader.get_data(path)).hexdigest()
+        stamp = (mtime, size, digest)
+        self._stamps[name] = stamp
+        if known is None and name in self._fresh:
+            return False
+        if known and known[2] == digest:
+            # touched, but not changed.
+            return False
+        self.reload(mod)
+        return True
+
+    def total(self, name: str) -> float:
+        """Seconds to import and reload the module."""
+        return self.imports.get(name, 0.0) + self.reloads.get(name, 0.0)
+
+    def slow_modules(self, threshold: float) -> list[str]:
+        """
+        **Args**
+
+        * threshold (`float`): Seconds.
+
+        **Returns**
+
+        * `list[str]`: Modules taking longer than `threshold` , slowest first.
+
+        """
+        return [name for name in self.ranking() if self.total(name) > threshold]
+
+    def ranking(self) -> list[str]:
+        """Recorded modules, slowest first."""
+        names = {*self.imports, *self.reloads}
+        return sorted(names, key=lambda n: (-self.total(n), n))
+
+    def report(self, top: Optional[int] = None) -> str:
+        """
+        **Args**
+
+        * top (`Optional[int]`): Number of modules. All modules by default.
+
+        **Returns**
+
+        * `str`: Import and reload time in milliseconds, slowest first, with the
+            number of modules imported transitively.
+
+        """
+        lines = ["inari import profile", "   import     reload  module"]
+        for name in self.ranking()[:top]:
+            imported = self.imports.get(name, 0.0) * 1000
+            reloaded = self.reloads.get(name, 0.0) * 1000
+            line = f"{imported:>7.1f}ms {reloaded:>7.1f}ms  {name}"
+            transitive = self.transitive.get(name)
+            if transitive:
+                line += f" (+{len(transitive)} modules)"
+            lines.append(line)
+        return "\n".join(lines)
+
+
+timer = ImportTimer()
+"""(`ImportTimer`): Shared by collectors."""
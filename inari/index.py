@@ -0,0 +1,357 @@
+"""
+index - Compact symbol index built from collectors.
+
+The index is written alongside generated documents, and updated incrementally by
+digests of modules and options.
+"""
+
+import json
+import os
+import pathlib
+import re
+from collections.abc import Iterable, Iterator
+from typing import NamedTuple, Optional, Union
+
+from ._internal._format import summarize
+from ._internal._path import path_to_name
+from .buildcache import BuildCache
+from .collectors import ModuleCollector
+
+INDEX_VERSION = 2
+"""(`int`): Bumped when the format of the index file is changed."""
+
+STATE_DIR = ".inari"
+"""(`str`): Directory to store build states, ignored by MkDocs as a dot directory."""
+
+_reference = re.compile(r"`([A-Za-z_]\w*(?:\.\w+)+)`")
+
+
+class Symbol(NamedTuple):
+    """
+    A documented object.
+
+    **Attributes**
+
+    * name (`str`): Qualified name like `inari.collectors.ModuleCollector` .
+    * kind (`str`): `module` , `class` , `function` , `method` , `variable` or
+        `property` .
+    * summary (`str`): First paragraph of the docstring.
+    * path (`str`): Absolute path, same as values of `name_to_path` .
+    * page (`str`): Markdown file relative to the output directory.
+
+    """
+
+    name: str
+    kind: str
+    summary: str
+    path: str
+    page: str
+
+    @property
+    def anchor(self) -> str:
+        """HTML id in the page. Blank for modules on their own pages."""
+        return self.path.partition("#")[2]
+
+
+def index_path(out_dir: Union[str, os.PathLike[str]]) -> pathlib.Path:
+    """
+    **Args**
+
+    * out_dir (`Union[str, Path]`): Output directory given to the build.
+
+    **Returns**
+
+    * `Path`: Location of the index file.
+
+    """
+    return pathlib.Path(out_dir) / STATE_DIR / "index.json"
+
+
+def iter_collectors(root: ModuleCollector) -> Iterator[ModuleCollector]:
+    """Yield `root` and its submodules recursively."""
+    yield root
+    for submodule in root.submodules.values():
+        yield from iter_collectors(submodule)
+
+
+def collect_symbols(
+    collector: ModuleCollector, base_dir: Union[str, os.PathLike[str]]
+) -> list[Symbol]:
+    """
+    Make symbols of the module and its members.
+
+    **Args**
+
+    * collector (`ModuleCollector`): Prepared collector.
+    * base_dir (`Union[str, Path]`): `Symbol.page` is relative to this directory.
+
+    **Returns**
+
+    * `list[Symbol]`: The module itself comes first.
+
+    """
+
+    def relpage(filename: str) -> str:
+        path = os.path.relpath(collector.out_dir / filename, base_dir)
+        return pathlib.Path(path).as_posix()
+
+    page = relpage(collector.filename)
+    class_pages = {c: relpage(f) for f, c in collector.class_pages.items()}
+
+    def make(path: str, kind: str, doc: str, page: str = page) -> Symbol:
+        return Symbol(path_to_name(path), kind, summarize(doc), path, page)
+
+    symbols = [
+        Symbol(
+            collector.mod.__name__,
+            "module",
+            summarize(collector.doc),
+            collector.abs_path,
+            page,
+        )
+    ]
+    symbols.extend(
+        make(v.abs_path, "variable", v.doc)
+        for v in collector.variables
+        if not v._should_skip
+    )
+    for c in collector.classes:
+        cls_page = class_pages.get(c, page)
+        symbols.append(make(c.abs_path, "class", c.doc, cls_page))
+        symbols.extend(
+            make(v.abs_path, "property", v.doc, cls_page)
+            for v in c.variables
+            if not v._should_skip
+        )
+        symbols.extend(make(m.abs_path, "method", m.doc, cls_page) for m in c.methods)
+    symbols.extend(make(f.abs_path, "function", f.doc) for f in collector.functions)
+    return symbols
+
+
+def collect_references(collector: ModuleCollector) -> list[str]:
+    """
+    Find names which may be linked from the module page: back-quoted dotted names
+    in docstrings, and base classes.
+
+    **Args**
+
+    * collector (`ModuleCollector`): Prepared collector.
+
+    **Returns**
+
+    * `list[str]`: Sorted names.
+
+    """
+    docs = [collector.doc]
+    docs.extend(v.doc for v in collector.variables)
+    docs.extend(f.doc for f in collector.functions)
+    names: set[str] = set()
+    for c in collector.classes:
+        docs.append(c.doc)
+        docs.extend(v.doc for v in c.variables)
+        docs.extend(m.doc for m in c.methods)
+        names.update(f"{b.__module__}.{b.__qualname__}" for b in c.cls.__bases__)
+    for doc in docs:
+        names.update(_reference.findall(doc))
+    return sorted(names)
+
+
+def symbols_digest(
+    collector: ModuleCollector, base_dir: Union[str, os.PathLike[str]]
+) -> str:
+    """
+    Digest of inputs of symbols: the module source, its page and paths, class pages
+    and the symbol selector.
+
+    **Args**
+
+    * collector (`ModuleCollector`): Prepared collector.
+    * base_dir (`Union[str, Path]`): See `inari.index.collect_symbols` .
+
+    **Returns**
+
+    * `str`: MD5 hex digest.
+
+    """
+    page = pathlib.Path(
+        os.path.relpath(collector.out_dir / collector.filename, base_dir)
+    ).as_posix()
+    return BuildCache.key(
+        collector.module_digest(),
+        page,
+        collector.abs_path,
+        sorted(collector.class_pages),
+        collector.symbol_selector.include,
+        collector.symbol_selector.exclude,
+    )
+
+
+class SymbolIndex:
+    """
+    Symbols of documented modules, keyed by module name.
+
+    **Attributes**
+
+    * modules (`dict[str, tuple[str, list[Symbol]]]`): Pairs of the digest and
+        symbols of each module. See `inari.index.symbols_digest` .
+    * references (`dict[str, list[str]]`): Names referred by each module. See
+        `inari.index.collect_references` .
+
+    """
+
+    modules: dict[str, tuple[str, list[Symbol]]]
+    references: dict[str, list[str]]
+
+    def __init__(
+        self,
+        modules: Optional[dict[str, tuple[str, list[Symbol]]]] = None,
+        references: Optional[dict[str, list[str]]] = None,
+    ) -> None:
+        """
+        **Args**
+
+        * modules (`dict[str, tuple[str, list[Symbol]]]`): Initial entries.
+        * references (`dict[str, list[str]]`): Initial references.
+
+        """
+        self.modules = modules or {}
+        self.references = references or {}
+
+    @classmethod
+    def load(cls, path: Union[str, os.PathLike[str]]) -> "SymbolIndex":
+        """
+        Read the index file. Missing or outdated files make an empty index.
+
+        **Args**
+
+        * path (`Union[str, Path]`): Index file.
+
+        **Returns**
+
+        * `SymbolIndex`: Loaded index.
+
+        """
+        try:
+            with open(path, mode="r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return cls()
+        if data.get("version") != INDEX_VERSION:
+            return cls()
+        modules = {
+            name: (digest, [Symbol(*s) for s in symbols])
+            for name, (digest, symbols) in data["modules"].items()
+        }
+        return cls(modules, data["references"])
+
+    def dump(self, path: Union[str, os.PathLike[str]]) -> None:
+        """
+        Write the index file. Directories are created automatically. The file is
+        left untouched if its content is the same, not to trigger watchers of
+        `mkdocs serve` .
+
+        **Args**
+
+        * path (`Union[str, Path]`): Index file.
+
+        """
+        path = pathlib.Path(path)
+        os.makedirs(path.parent, exist_ok=True)
+        data = {
+            "version": INDEX_VERSION,
+            "modules": {
+                name: [digest, [list(s) for s in symbols]]
+                for name, (digest, symbols) in sorted(self.modules.items())
+            },
+            "references": dict(sorted(self.references.items())),
+        }
+        content = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+        if path.is_file() and path.read_text(encoding="utf-8") == content:
+            return
+        with open(path, mode="w", newline="\n", encoding="utf-8") as f:
+            f.write(content)
+
+    def update(
+        self, root: ModuleCollector, base_dir: Union[str, os.PathLike[str]]
+    ) -> None:
+        """
+        Refresh symbols of changed modules, and drop deleted modules.
+
+        **Args**
+
+        * root (`ModuleCollector`): Prepared collector of the root module.
+        * base_dir (`Union[str, Path]`): See `inari.index.collect_symbols` .
+
+        """
+        found = {c.mod.__name__ for c in iter_collectors(root)}
+        root_name = root.mod.__name__
+        for name in list(self.modules):
+            in_root = name == root_name or name.startswith(root_name + ".")
+            if in_root and name not in found:
+                self.remove(name)
+        self.update_modules(iter_collectors(root), base_dir)
+
+    def update_modules(
+        self,
+        collectors: Iterable[ModuleCollector],
+        base_dir: Union[str, os.PathLike[str]],
+    ) -> None:
+        """
+        Refresh symbols of given modules if changed. Other modules are kept.
+
+        **Args**
+
+        * collectors (`Iterable[ModuleCollector]`): Prepared collectors.
+        * base_dir (`Union[str, Path]`): See `inari.index.collect_symbols` .
+
+        """
+        for collector in collectors:
+            name = collector.mod.__name__
+            digest = symbols_digest(collector, base_dir)
+            cached = self.modules.get(name)
+            if cached and cached[0] == digest:
+                continue
+            self.modules[name] = (digest, collect_symbols(collector, base_dir))
+            self.references[name] = collect_references(collector)
+
+    def remove(self, name: str) -> None:
+        """Drop the module from the index."""
+        self.modules.pop(name, None)
+        self.references.pop(name, None)
+
+    def dependents(self, names: Iterable[str]) -> set[str]:
+        """
+        Find modules referring to given modules or their members.
+
+        **Args**
+
+        * names (`Iterable[str]`): Module names.
+
+        **Returns**
+
+        * `set[str]`: Names of referring modules, excluding `names` themselves.
+
+        """
+        targets = set(names)
+        prefixes = tuple(f"{n}." for n in targets)
+        found = {
+            module
+            for module, references in self.references.items()
+            if any(r in targets or r.startswith(prefixes) for r in references)
+        }
+        return found - targets
+
+    def symbols(self) -> Iterator[Symbol]:
+        """Yield all symbols."""
+        for _, symbols in self.modules.values():
+            yield from symbols
+
+    def name_to_path(self) -> dict[str, str]:
+        """
+        **Returns**
+
+        * `dict[str, str]`: Same form as `inari.collectors.BaseCollector.name_to_path`
+            .
+
+        """
+        return {s.name: s.path for s in self.symbols()}
@@ -0,0 +1,174 @@
+"""
+memory - Peak-memory profiling of builds with `tracemalloc` .
+"""
+
+import linecache
+import sys
+import tracemalloc
+from typing import Optional
+
+PHASES = ("import", "collect", "write")
+"""(`tuple[str, ...]`): Phase names in order. Each page is written right after it
+is rendered, as in builds without a profiler, so the peak of `write` includes
+rendering."""
+
+
+def _size(n: float) -> str:
+    for unit in ["B", "KiB", "MiB"]:
+        if abs(n) < 1024:
+            return f"{n:.1f} {unit}"
+        n /= 1024
+    return f"{n:.1f} GiB"
+
+
+def _module_names() -> dict[str, str]:
+    """Names of imported modules by their source files."""
+    names: dict[str, str] = {}
+    for name, mod in list(sys.modules.items()):
+        filename = getattr(mod, "__file__", None)
+        if isinstance(filename, str):
+            # first imported name, like `posixpath` rather than `os.path` .
+            names.setdefault(filename, name)
+    return names
+
+
+class MemoryProfiler:
+    """
+    Take snapshots at phase boundaries, and compare the last snapshot with the
+    previous build, like rebuilds of `mkdocs serve` .
+
+    **Attributes**
+
+    * top (`int`): Number of lines in each ranking.
+    * snapshots (`dict[str, tracemalloc.Snapshot]`): Snapshots of the current build.
+    * peaks (`dict[str, int]`): Peak traced size of each phase.
+    * growth (`Optional[int]`): Growth of retained size since the previous build.
+
+    """
+
+    top: int
+    snapshots: dict[str, tracemalloc.Snapshot]
+    peaks: dict[str, int]
+    growth: Optional[int]
+
+    _previous: Optional[tracemalloc.Snapshot]
+    _started: bool
+
+    def __init__(self, top: int = 10) -> None:
+        """
+        **Args**
+
+        * top (`int`): Number of lines in each ranking.
+
+        """
+        self.top = top
+        self.snapshots = {}
+        self.peaks = {}
+        self.growth = None
+        self._previous = None
+        self._started = False
+
+    def start(self) -> None:
+        """Start tracing if not yet."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started = True
+        tracemalloc.reset_peak()
+
+    def stop(self) -> None:
+        """Stop tracing if this profiler started it."""
+        if self._started:
+            tracemalloc.stop()
+            self._started = False
+
+    def phase(self, name: str) -> None:
+        """
+        Take a snapshot at the end of the phase.
+
+        **Args**
+
+        * name (`str`): One of `inari.memory.PHASES` .
+
+        """
+        if not tracemalloc.is_tracing():
+            return
+        _, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            [
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, linecache.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+            ]
+        )
+        self.snapshots[name] = snapshot
+        self.peaks[name] = peak
+        tracemalloc.reset_peak()
+
+    def finish(self) -> str:
+        """
+        End the build.
+
+        **Returns**
+
+        * `str`: Report of the build. See `inari.memory.MemoryProfiler.report` .
+
+        """
+        last = self.snapshots.get(PHASES[-1])
+        if last and self._previous:
+            self.growth = sum(
+                s.size_diff for s in last.compare_to(self._previous, "filename")
+            )
+        report = self.report()
+        if last:
+            self._previous = last
+        self.snapshots = {}
+        self.peaks = {}
+        return report
+
+    def report(self) -> str:
+        """
+        **Returns**
+
+        * `str`: Retained and peak size of phases, top allocation sites, retained size
+            per module of allocations, and growth since the previous build. Files
+            of no module are listed by their names.
+
+        """
+        lines = ["inari memory profile", "phase     retained        peak"]
+        for name in PHASES:
+            if name not in self.snapshots:
+                continue
+            retained = sum(s.size for s in self.snapshots[name].statistics("filename"))
+            lines.append(f"{name:<8}{_size(retained):>12}{_size(self.peaks[name]):>12}")
+
+        last = self.snapshots.get(PHASES[-1])
+        if last:
+            lines.append("top allocation sites:")
+            for stat in last.statistics("lineno")[: self.top]:
+                frame = stat.traceback[0]
+                lines.append(
+                    f"  {frame.filename}:{frame.lineno}"
+                    + f" {_size(stat.size)} ({stat.count} blocks)"
+                )
+            lines.append("retained by module:")
+            names = _module_names()
+            modules: dict[str, tuple[int, int]] = {}
+            for stat in last.statistics("filename"):
+                filename = stat.traceback[0].filename
+                name = names.get(filename, filename)
+                size, count = modules.get(name, (0, 0))
+                modules[name] = (size + stat.size, count + stat.count)
+            ranking = sorted(modules.items(), key=lambda x: x[1][0], reverse=True)
+            for name, (size, count) in ranking[: self.top]:
+                lines.append(f"  {name} {_size(size)} ({count} blocks)")
+
+        if self.growth is not None and last and self._previous:
+            lines.append(f"growth since the previous build: {_size(self.growth)}")
+            for diff in last.compare_to(self._previous, "lineno")[: self.top]:
+                if diff.size_diff <= 0:
+                    continue
+                frame = diff.traceback[0]
+                lines.append(
+                    f"  {frame.filename}:{frame.lineno} +{_size(diff.size_diff)}"
+                )
+        return "\n".join(lines)
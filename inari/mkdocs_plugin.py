@@ -1,13 +1,28 @@
-import importlib
+import logging
 import os
+import pathlib
 import sys
+from threading import Thread
 from typing import Any, Callable, Optional
 
 from mkdocs.config import Config, config_options
+from mkdocs.exceptions import PluginError
 from mkdocs.livereload import LiveReloadServer
 from mkdocs.plugins import BasePlugin
+from mkdocs.structure.files import File, Files
+from mkdocs.structure.pages import Page
 
+from .build import default_jobs, make_roots, write_roots
+from .buildcache import build_cache
 from .collectors import ModuleCollector
+from .docstrings import cache, cache_path
+from .imports import timer
+from .index import SymbolIndex, index_path, iter_collectors
+from .memory import MemoryProfiler
+from .nav import pages_from_collectors, write_nav
+from .selectors import Selector
+
+log = logging.getLogger(f"mkdocs.plugins.{__name__}")
 
 
 class Plugin(BasePlugin):
@@ -15,25 +30,70 @@ class Plugin(BasePlugin):
     MkDocs Plugin class.
     """
 
-    _root_module: Optional[ModuleCollector] = None
+    _root_modules: Optional[list[ModuleCollector]] = None
+    _index: Optional[SymbolIndex] = None
+    _profiler: Optional[MemoryProfiler] = None
+    _cache_loaded: bool = False
+    _worker: Optional[Thread] = None
+    _error: Optional[BaseException] = None
 
     # out-dir is config["docs_dir"]
     config_scheme = (
-        ("module", config_options.Type(str, required=True)),
+        # a module name, or a list of them.
+        ("module", config_options.Type((str, list), required=True)),
         ("out-name", config_options.Type(str, default=None)),
+        ("search-index", config_options.Type(bool, default=False)),
+        ("split-classes", config_options.Type(bool, default=False)),
+        ("max-symbols", config_options.Type(int, default=None)),
+        ("max-bytes", config_options.Type(int, default=None)),
+        ("fold-below", config_options.Type(int, default=None)),
+        ("include", config_options.Type(list, default=[])),
+        ("exclude", config_options.Type(list, default=[])),
+        ("include-symbols", config_options.Type(list, default=[])),
+        ("exclude-symbols", config_options.Type(list, default=[])),
+        ("memory-profile", config_options.Type(bool, default=False)),
+        ("import-profile", config_options.Type(bool, default=False)),
+        ("max-import-time", config_options.Type((int, float), default=None)),
+        ("nav-file", config_options.Type(str, default=None)),
+        ("jobs", config_options.Type(int, default=1)),
+        ("cache-dir", config_options.Type(str, default=None)),
     )
 
-    def root_module(self, config: Config) -> ModuleCollector:
-        if not self._root_module:
+    def module_names(self) -> list[str]:
+        names = self.config["module"]
+        if isinstance(names, str):
+            return [names]
+        return list(names)
+
+    def root_modules(self, config: Config) -> list[ModuleCollector]:
+        if not self._root_modules:
             out_dir = config["docs_dir"]
             out_name = self.config["out-name"]
-            root_name = self.config["module"]
-            _root_module = importlib.import_module(root_name)
-            self._root_module = ModuleCollector(
-                _root_module, out_dir, out_name=out_name, enable_yaml_header=True
+            modules = [timer.import_module(x) for x in self.module_names()]
+            self._root_modules = make_roots(
+                modules,
+                out_dir,
+                out_name,
+                enable_yaml_header=True,
+                split_classes=self.config["split-classes"],
+                max_symbols=self.config["max-symbols"],
+                max_bytes=self.config["max-bytes"],
+                fold_below=self.config["fold-below"],
+                module_selector=Selector(
+                    self.config["include"], self.config["exclude"]
+                ),
+                symbol_selector=Selector(
+                    self.config["include-symbols"], self.config["exclude-symbols"]
+                ),
             )
 
-        return self._root_module
+        return self._root_modules
+
+    def on_startup(self, *, command: str, dirty: bool) -> None:
+        """
+        Defined to keep this instance across rebuilds of `mkdocs serve` , with the
+        memory profiler, the symbol index and loaded caches.
+        """
 
     def on_config(self, config: Config, **kw: Any) -> Config:
         md_ext = config.get("markdown_extensions", [])
@@ -42,6 +102,8 @@ class Plugin(BasePlugin):
         if "meta" not in md_ext:
             md_ext.append("meta")
         config["markdown_extantions"] = md_ext
+        # overlap generation with the rest of the build until `on_files` .
+        self._start(config)
         return config
 
     def on_serve(
@@ -49,22 +111,173 @@ class Plugin(BasePlugin):
         server: LiveReloadServer,
         config: Config,
         builder: Callable[[], None],
-        **kw: Any
+        **kw: Any,
     ) -> LiveReloadServer:
-        self._build(config)
-        # add watching path.
-        module_path = self.config["module"].replace(".", "/")
-        server.watch(module_path)
+        # pages are generated by the first build. add watching path.
+        for name in self.module_names():
+            server.watch(name.replace(".", "/"))
         return server
 
     def on_pre_build(self, config: Config) -> None:
-        """Build markdown docs from python modules."""
-        self._build(config)
+        """Build markdown docs from python modules, if not started yet."""
+        if self._worker is None:
+            self._start(config)
+
+    def _start(self, config: Config) -> None:
+        """Start building in a background thread."""
+        self._error = None
+        self._worker = Thread(
+            target=self._run, args=(config,), name="inari", daemon=True
+        )
+        self._worker.start()
+
+    def _run(self, config: Config) -> None:
+        try:
+            self._build(config)
+        except BaseException as e:
+            # raised in the main thread by `_join` .
+            self._error = e
+
+    def _join(self) -> None:
+        """Wait for the background build, and raise its error."""
+        if self._worker is None:
+            return
+        self._worker.join()
+        self._worker = None
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
 
     def _build(self, config: Config) -> None:
         cwd = os.getcwd()
         if cwd not in sys.path:
             sys.path.append(cwd)
 
+        profiler = None
+        if self.config["memory-profile"]:
+            # kept across rebuilds of `mkdocs serve` to find growth.
+            if self._profiler is None:
+                self._profiler = MemoryProfiler()
+            profiler = self._profiler
+            profiler.start()
+
+        docstrings = cache_path(config["docs_dir"])
+        if not self._cache_loaded:
+            # kept in memory across rebuilds of `mkdocs serve` .
+            cache.load(docstrings)
+            self._cache_loaded = True
+
         # create docs.
-        self.root_module(config).write()
+        roots = self.root_modules(config)
+        if profiler:
+            profiler.phase("import")
+        # modules are imported once, but reloaded in every build.
+        timer.reloads.clear()
+        jobs = self.config["jobs"] or default_jobs()
+        if self.config["cache-dir"]:
+            build_cache.open(self.config["cache-dir"])
+        write_roots(roots, profiler, jobs)
+        if self.config["cache-dir"]:
+            log.debug(
+                f"inari: page cache hits {build_cache.hits},"
+                + f" misses {build_cache.misses}"
+            )
+            build_cache.close()
+        cache.dump(docstrings)
+        if self.config["nav-file"]:
+            out_dir = config["docs_dir"]
+            pages = pages_from_collectors(roots, out_dir)
+            write_nav(pages, out_dir, self.config["nav-file"])
+        log.debug(f"inari: docstring cache hits {cache.hits}, misses {cache.misses}")
+
+        if self.config["search-index"]:
+            out_dir = config["docs_dir"]
+            path = index_path(out_dir)
+            if self._index is None:
+                self._index = SymbolIndex.load(path)
+            for root in roots:
+                self._index.update(root, out_dir)
+            self._index.dump(path)
+
+        if profiler:
+            log.info(profiler.finish())
+            if profiler.growth:
+                log.warning(
+                    f"inari: retained memory grew by {profiler.growth} bytes"
+                    + " since the previous build."
+                )
+
+        if self.config["import-profile"]:
+            log.info(timer.report())
+        max_import_time = self.config["max-import-time"]
+        if max_import_time is not None:
+            slow = timer.slow_modules(max_import_time)
+            if slow:
+                raise PluginError(
+                    f"inari: {', '.join(slow)} took longer than {max_import_time}s"
+                    + " to import and reload."
+                )
+
+    def _sync_files(self, files: Files, config: Config) -> None:
+        """
+        Files were listed while pages were generated. Add new pages, and drop
+        removed pages.
+        """
+        docs_dir = config["docs_dir"]
+        generated = set()
+        for root in self._root_modules or []:
+            for collector in iter_collectors(root):
+                for filename in [collector.filename, *collector.class_pages]:
+                    path = os.path.relpath(collector.out_dir / filename, docs_dir)
+                    generated.add(pathlib.PurePath(path).as_posix())
+        if self.config["nav-file"]:
+            generated.add(pathlib.PurePath(self.config["nav-file"]).as_posix())
+        out_dirs = tuple(
+            pathlib.PurePath(os.path.relpath(r.out_dir, docs_dir)).as_posix() + "/"
+            for r in self._root_modules or []
+        )
+        for file in list(files):
+            src = pathlib.PurePath(file.src_path).as_posix()
+            if src.startswith(out_dirs) and not os.path.isfile(file.abs_src_path):
+                files.remove(file)
+        for path in sorted(generated):
+            if not files.get_file_from_path(path):
+                files.append(
+                    File(
+                        path,
+                        docs_dir,
+                        config["site_dir"],
+                        config["use_directory_urls"],
+                    )
+                )
+
+    def on_files(self, files: Files, config: Config) -> Files:
+        """
+        Wait for generated pages, then merge the symbol index into the search
+        plugin.
+        """
+        self._join()
+        self._sync_files(files, config)
+        search = config["plugins"].get("search")
+        search_index = getattr(search, "search_index", None)
+        if self._index is None or search_index is None:
+            return files
+
+        pages = {s.page for s in self._index.symbols()}
+        add_entry = search_index.add_entry_from_context
+
+        def add_entry_from_context(page: Page) -> None:
+            # generated pages are indexed from symbols instead of parsed HTML.
+            if pathlib.PurePath(page.file.src_path).as_posix() not in pages:
+                add_entry(page)
+
+        search_index.add_entry_from_context = add_entry_from_context
+        for symbol in self._index.symbols():
+            file = files.get_file_from_path(symbol.page)
+            if not file:
+                continue
+            location = file.url + (f"#{symbol.anchor}" if symbol.anchor else "")
+            search_index._add_entry(
+                title=symbol.name, text=symbol.summary, loc=location
+            )
+        return files
@@ -0,0 +1,123 @@
+"""
+nav - Navigation file of generated pages, for `mkdocs-literate-nav` .
+
+Entries are made from collectors or the symbol index, so the output directory is not
+scanned. The file is rewritten only if entries are changed.
+"""
+
+import os
+import pathlib
+from collections.abc import Sequence
+from typing import Union
+
+from ._internal._path import path_to_name
+from .collectors import ModuleCollector
+from .index import SymbolIndex, iter_collectors
+
+
+def _relpage(path: pathlib.Path, base_dir: Union[str, os.PathLike[str]]) -> str:
+    return pathlib.Path(os.path.relpath(path, base_dir)).as_posix()
+
+
+def pages_from_collectors(
+    roots: Sequence[ModuleCollector], base_dir: Union[str, os.PathLike[str]]
+) -> dict[str, str]:
+    """
+    **Args**
+
+    * roots (`Sequence[ModuleCollector]`): Prepared collectors.
+    * base_dir (`Union[str, Path]`): Pages are relative to this directory.
+
+    **Returns**
+
+    * `dict[str, str]`: Names of modules and classes on their own pages, and the
+        pages.
+
+    """
+    pages = {}
+    for root in roots:
+        for collector in iter_collectors(root):
+            if collector.folded:
+                continue
+            pages[collector.mod.__name__] = _relpage(
+                collector.out_dir / collector.filename, base_dir
+            )
+            for filename, class_collector in collector.class_pages.items():
+                name = path_to_name(class_collector.abs_path)
+                pages[name] = _relpage(collector.out_dir / filename, base_dir)
+    return pages
+
+
+def pages_from_index(index: SymbolIndex) -> dict[str, str]:
+    """
+    Same as `inari.nav.pages_from_collectors` , but read from the index. Pages are
+    relative to the directory of the index.
+    """
+    pages = {}
+    for _, symbols in index.modules.values():
+        module, *members = symbols
+        if "#" in module.path:
+            # folded into the page of the parent package.
+            continue
+        pages[module.name] = module.page
+        for symbol in members:
+            if symbol.kind == "class" and symbol.page != module.page:
+                pages[symbol.name] = symbol.page
+    return pages
+
+
+def render_nav(pages: dict[str, str], nav_dir: str = "") -> str:
+    """
+    Make a nested list of links. Submodules and classes are put under their parent.
+
+    **Args**
+
+    * pages (`dict[str, str]`): See `inari.nav.pages_from_collectors` .
+    * nav_dir (`str`): Directory of the navigation file, relative to the same base
+        directory as pages. Links are relative to this.
+
+    **Returns**
+
+    * `str`: Markdown list.
+
+    """
+    lines = []
+    parents: list[str] = []
+    for name in sorted(pages, key=lambda n: n.split(".")):
+        while parents and not name.startswith(parents[-1] + "."):
+            parents.pop()
+        title = name.removeprefix(parents[-1] + ".") if parents else name
+        link = pathlib.PurePosixPath(os.path.relpath(pages[name], nav_dir or "."))
+        lines.append(f"{'    ' * len(parents)}- [{title}]({link.as_posix()})")
+        parents.append(name)
+    return "\n".join(lines) + "\n"
+
+
+def write_nav(
+    pages: dict[str, str],
+    base_dir: Union[str, os.PathLike[str]],
+    nav_path: Union[str, os.PathLike[str]],
+) -> bool:
+    """
+    Write the navigation file if it is changed.
+
+    **Args**
+
+    * pages (`dict[str, str]`): See `inari.nav.pages_from_collectors` .
+    * base_dir (`Union[str, Path]`): Base directory of pages.
+    * nav_path (`Union[str, Path]`): Navigation file, relative to `base_dir` .
+
+    **Returns**
+
+    * `bool`: `True` if the file was written.
+
+    """
+    path = pathlib.Path(base_dir, nav_path)
+    nav_dir = pathlib.PurePath(nav_path).parent.as_posix()
+    content = render_nav(pages, "" if nav_dir == "." else nav_dir)
+    if path.is_file() and path.read_text(encoding="utf-8") == content:
+        return False
+    os.makedirs(path.parent, exist_ok=True)
+    with open(path, mode="w", newline="\n", encoding="utf-8") as f:
+        f.write(content)
+    return True
@@ -0,0 +1,168 @@
+"""
+rebuild - Rebuild a part of documents, reusing the symbol index of the previous build.
+"""
+
+import os
+import pathlib
+import time
+from collections.abc import Collection, Sequence
+from types import ModuleType
+from typing import Any, Optional, Union
+
+from ._internal._git import changed_files, to_module_names
+from .build import make_roots
+from .collectors import ModuleCollector
+from .hooks import hooks
+from .imports import timer
+from .index import SymbolIndex, index_path
+from .selectors import Selector
+
+
+def _in_root(name: str, root_name: str) -> bool:
+    return name == root_name or name.startswith(root_name + ".")
+
+
+def rebuild_modules(
+    roots: Sequence[ModuleType],
+    out_dir: Union[str, os.PathLike[str]],
+    names: Collection[str],
+    deleted: Collection[str] = (),
+    out_name: Optional[str] = None,
+    **options: Any,
+) -> list[ModuleCollector]:
+    """
+    Rebuild pages of given modules and modules linking to them. Other modules are
+    not imported, their paths are read from the symbol index.
+
+    **Args**
+
+    * roots (`Sequence[ModuleType]`): Root modules of the previous build.
+    * out_dir (`Union[str, Path]`): Output directory of the previous build.
+    * names (`Collection[str]`): Changed modules.
+    * deleted (`Collection[str]`): Deleted modules. Their pages are removed.
+    * out_name (`Optional[str]`): See `inari.build.make_roots` .
+    * options (`Any`): Passed to `inari.collectors.ModuleCollector` .
+
+    **Returns**
+
+    * `list[ModuleCollector]`: Rebuilt modules.
+
+    """
+    start = time.perf_counter()
+    path = index_path(out_dir)
+    index = SymbolIndex.load(path)
+    root_names = [r.__name__ for r in roots]
+
+    # new or deleted modules change the list of submodules in their parent.
+    parents = {
+        n.rsplit(".", 1)[0]
+        for n in names
+        if n not in root_names and (n not in index.modules or n in deleted)
+    }
+    targets = {
+        n
+        for n in {*names, *parents, *index.dependents(names)}
+        if any(_in_root(n, r) for r in root_names)
+    }
+    # folded modules are written in the page of their parent.
+    folded = {
+        module
+        for module, (_, symbols) in index.modules.items()
+        if symbols and "#" in symbols[0].path
+    }
+    targets.update(n.rsplit(".", 1)[0] for n in targets & folded)
+
+    name_to_path = {
+        s.name: s.path
+        for module, (_, symbols) in index.modules.items()
+        if module not in targets
+        for s in symbols
+    }
+    root_collectors = make_roots(
+        roots, out_dir, out_name, name_to_path, recursive=False, **options
+    )
+
+    def collect(name: str) -> ModuleCollector:
+        root = next(r for r in root_collectors if _in_root(name, r.mod.__name__))
+        if name == root.mod.__name__:
+            return root
+        mod = timer.import_module(name)
+        parts = name.removeprefix(root.mod.__name__ + ".").split(".")[:-1]
+        return ModuleCollector(
+            mod, root.out_dir.joinpath(*parts), name_to_path, recursive=False, **options
+        )
+
+    collectors = []
+    for name in sorted(targets):
+        if name in deleted:
+            _, symbols = index.modules.get(name, ("", []))
+            # pages of folded modules are kept, and rebuilt as their parent.
+            pages = set() if name in folded else {s.page for s in symbols}
+            for page in pages:
+                if os.path.isfile(pathlib.Path(out_dir, page)):
+                    os.remove(pathlib.Path(out_dir, page))
+            index.remove(name)
+            continue
+        collectors.append(collect(name))
+
+    for collector in collectors:
+        collector._prepare_docs()
+    # modules folded in this build change the page of their parent.
+    newly_folded = {c.mod.__name__.rsplit(".", 1)[0] for c in collectors if c.folded}
+    for name in sorted(newly_folded - targets):
+        collector = collect(name)
+        collector._prepare_docs()
+        collectors.append(collector)
+    for collector in collectors:
+        collector._write(force=True)
+
+    index.update_modules(collectors, out_dir)
+    index.dump(path)
+    if hooks.wants("build_finished"):
+        hooks.emit("build_finished", collectors, time.perf_counter() - start)
+    return collectors
+
+
+def rebuild_since(
+    roots: Sequence[ModuleType],
+    out_dir: Union[str, os.PathLike[str]],
+    ref: str,
+    out_name: Optional[str] = None,
+    **options: Any,
+) -> Optional[list[ModuleCollector]]:
+    """
+    Rebuild modules changed since the git `ref` , and modules linking to them.
+
+    **Args**
+
+    * roots (`Sequence[ModuleType]`): Root modules.
+    * out_dir (`Union[str, Path]`): Output directory.
+    * ref (`str`): Git revision like `main` or `HEAD~3` .
+    * out_name (`Optional[str]`): See `inari.build.make_roots` .
+    * options (`Any`): Passed to `inari.collectors.ModuleCollector` .
+
+    **Returns**
+
+    * `Optional[list[ModuleCollector]]`: Rebuilt modules, or `None` if there is no
+        previous build to reuse.
+
+    """
+    index = SymbolIndex.load(index_path(out_dir))
+    if any(r.__name__ not in index.modules for r in roots):
+        return None
+    files = changed_files(ref)
+    selector: Selector = options.get("module_selector") or Selector()
+
+    def selected(name: str) -> bool:
+        parts = name.split(".")
+        return all(
+            selector.may_contain(".".join(parts[:i])) for i in range(1, 1 + len(parts))
+        )
+
+    existing = {f for f in files if f.exists()}
+    names: set[str] = set()
+    deleted: set[str] = set()
+    for root in roots:
+        names.update(n for n in to_module_names(root, files) if selected(n))
+        deleted.update(to_module_names(root, files - existing))
+    return rebuild_modules(roots, out_dir, names, deleted, out_name, **options)
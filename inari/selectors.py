@@ -0,0 +1,114 @@
+"""
+selectors - Include/exclude patterns for modules and symbols.
+
+Patterns are globs like `pkg.sub.*` by default. `*` also matches dots. Patterns
+starting with `re:` are regular expressions like `re:pkg\\.(foo|bar)` . Both must
+match whole names.
+"""
+
+import fnmatch
+import re
+from collections.abc import Iterable
+from typing import Optional
+
+REGEX_PREFIX = "re:"
+"""(`str`): Prefix of regular expression patterns."""
+
+_literal = re.compile(r"(?:\w|\\\.)*")
+
+
+def _compile(pattern: str) -> tuple[re.Pattern[str], str]:
+    """Compile the pattern, and find its literal prefix."""
+    if pattern.startswith(REGEX_PREFIX):
+        regex = pattern.removeprefix(REGEX_PREFIX).removeprefix("^")
+        literal = _literal.match(regex).group(0)  # type: ignore[union-attr]
+        prefix = literal.replace("\\.", ".")
+        # a quantifier makes the last character optional.
+        if regex.removeprefix(literal)[:1] in ("?", "*", "{"):
+            prefix = prefix[:-1]
+        if "|" in regex:
+            prefix = ""
+        return re.compile(regex), prefix
+    prefix = re.split(r"[*?[]", pattern, maxsplit=1)[0]
+    return re.compile(fnmatch.translate(pattern)), prefix
+
+
+class Selector:
+    """
+    Select names by include/exclude patterns.
+
+    **Attributes**
+
+    * include (`list[str]`): If not empty, names should match one of these.
+    * exclude (`list[str]`): Names matching these are ignored.
+
+    """
+
+    include: list[str]
+    exclude: list[str]
+
+    _include: list[tuple[re.Pattern[str], str]]
+    _exclude: list[re.Pattern[str]]
+
+    def __init__(
+        self,
+        include: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> None:
+        """
+        **Args**
+
+        * include (`Optional[Iterable[str]]`): Patterns to include.
+        * exclude (`Optional[Iterable[str]]`): Patterns to exclude.
+
+        """
+        self.include = list(include or [])
+        self.exclude = list(exclude or [])
+        self._include = [_compile(p) for p in self.include]
+        self._exclude = [_compile(p)[0] for p in self.exclude]
+
+    def __bool__(self) -> bool:
+        return bool(self.include or self.exclude)
+
+    def excludes(self, name: str) -> bool:
+        """`True` if `name` matches one of exclude patterns."""
+        return any(p.fullmatch(name) for p in self._exclude)
+
+    def match(self, name: str) -> bool:
+        """
+        **Args**
+
+        * name (`str`): Qualified name like `pkg.module.Class` .
+
+        **Returns**
+
+        * `bool`: `True` if `name` is included and not excluded.
+
+        """
+        if self.excludes(name):
+            return False
+        return not self._include or any(p.fullmatch(name) for p, _ in self._include)
+
+    def may_contain(self, name: str) -> bool:
+        """
+        Decide whether to visit the module before importing it. Excluded modules are
+        skipped with their submodules.
+
+        **Args**
+
+        * name (`str`): Module name.
+
+        **Returns**
+
+        * `bool`: `True` if the module or its submodules can be included.
+
+        """
+        if self.excludes(name):
+            return False
+        if not self._include:
+            return True
+        child = name + "."
+        return any(
+            p.fullmatch(name) or prefix.startswith(child) or child.startswith(prefix)
+            for p, prefix in self._include
+        )
@@ -0,0 +1,233 @@
+"""
+serve - Preview server rendering pages on request.
+
+Only module names are collected at startup, from the file system. Each page is
+imported, collected and rendered when it is requested first, and cached until its
+source file is changed. Modules are found again if a page is missing, or if the
+directory of a package is changed.
+"""
+
+import html
+import importlib
+import os
+import pathlib
+from collections.abc import Sequence
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock
+from types import ModuleType
+from typing import Any, Optional
+
+from ._internal._modules import find_modules
+from .collectors import ModuleCollector
+from .html import EXTENSIONS, page_html
+from .index import collect_references
+
+try:
+    import markdown
+except ImportError:
+    markdown = None  # type: ignore[assignment]
+
+
+def _stamp(mod: ModuleType) -> tuple[int, ...]:
+    """Stats of the source file, and of directories of the package."""
+    stat = os.stat(pathlib.Path(mod.__file__ or ""))
+    stamp = [stat.st_mtime_ns, stat.st_size]
+    for directory in getattr(mod, "__path__", []):
+        stamp.append(os.stat(directory).st_mtime_ns)
+    return tuple(stamp)
+
+
+class PreviewServer:
+    """
+    Render pages on request, and cache them.
+
+    **Attributes**
+
+    * root_names (`list[str]`): Root modules to preview.
+    * modules (`dict[str, str]`): Module names and their paths. See
+        `inari._internal._modules.find_modules` .
+    * pages (`dict[str, str]`): Mapping of page paths like `pkg/mod-py.md` to module
+        names.
+    * cache (`dict[str, tuple[tuple[int, ...], str]]`): Rendered pages with stats of
+        their source files, and directories of packages.
+
+    """
+
+    root_names: list[str]
+    modules: dict[str, str]
+    pages: dict[str, str]
+    cache: dict[str, tuple[tuple[int, ...], str]]
+
+    _lock: Lock
+
+    def __init__(self, root_names: Sequence[str]) -> None:
+        """
+        **Args**
+
+        * root_names (`Sequence[str]`): Root modules to preview.
+
+        """
+        self.root_names = list(root_names)
+        self.modules = {}
+        self.pages = {}
+        self.cache = {}
+        self._lock = Lock()
+        self.refresh()
+
+    def refresh(self) -> set[str]:
+        """
+        Find modules again. Cached pages of added or removed modules and their
+        parent packages are dropped.
+
+        **Returns**
+
+        * `set[str]`: Names of added or removed modules.
+
+        """
+        importlib.invalidate_caches()
+        modules: dict[str, str] = {}
+        for root_name in self.root_names:
+            modules.update(find_modules(root_name))
+        pages = {}
+        for name, path in modules.items():
+            page = path.lstrip("/")
+            page = page + ".md" if page.endswith("-py") else page + "/index.md"
+            pages[page] = name
+
+        with self._lock:
+            changed = {
+                name
+                for name in {*modules, *self.modules}
+                if modules.get(name) != self.modules.get(name)
+            }
+            affected = changed | {name.rpartition(".")[0] for name in changed}
+            for page in list(self.cache):
+                if pages.get(page) in affected or page not in pages:
+                    del self.cache[page]
+            self.modules = modules
+            self.pages = pages
+        return changed
+
+    def resolve(self, name: str) -> Optional[str]:
+        """
+        Guess the path of the name from the longest module name.
+
+        **Args**
+
+        * name (`str`): Qualified name like `pkg.mod.Class.method` .
+
+        **Returns**
+
+        * `Optional[str]`: Path like `/pkg/mod-py#Class.method` .
+
+        """
+        module, rest = name, ""
+        while module:
+            if module in self.modules:
+                path = self.modules[module]
+                return f"{path}#{rest}" if rest else path
+            module, _, last = module.rpartition(".")
+            rest = f"{last}.{rest}" if rest else last
+        return None
+
+    def render(self, page: str) -> Optional[str]:
+        """
+        **Args**
+
+        * page (`str`): Page path like `pkg/mod-py.md` .
+
+        **Returns**
+
+        * `Optional[str]`: Markdown document, or `None` if the page is not found.
+
+        """
+        name = self.pages.get(page)
+        if name is None:
+            # added after the last search.
+            self.refresh()
+            name = self.pages.get(page)
+            if name is None:
+                return None
+        try:
+            mod = importlib.import_module(name)
+            stamp = _stamp(mod)
+        except (ModuleNotFoundError, FileNotFoundError) as e:
+            if isinstance(e, ModuleNotFoundError) and e.name != name:
+                raise
+            # removed after the last search.
+            self.refresh()
+            return None
+
+        with self._lock:
+            cached = self.cache.get(page)
+            if cached and cached[0] == stamp:
+                return cached[1]
+        if len(stamp) > 2:
+            # submodules of the package may be added or removed.
+            self.refresh()
+
+        with self._lock:
+            collector = ModuleCollector(mod, ".", dict(self.modules), recursive=False)
+            collector._prepare_docs()
+            for reference in collect_references(collector):
+                path = self.resolve(reference)
+                if path:
+                    collector.name_to_path.setdefault(reference, path)
+            collector.make_relpaths()
+            doc = collector._doc_str()
+            self.cache[page] = (stamp, doc)
+            return doc
+
+    def to_html(self, page: str, doc: str) -> str:
+        """Convert markdown if available."""
+        if markdown:
+            body = markdown.markdown(  # type: ignore[attr-defined]
+                doc, extensions=EXTENSIONS
+            )
+        else:
+            body = f"<pre>{html.escape(doc)}</pre>"
+        return page_html(page, body)
+
+    def handler(self) -> type[BaseHTTPRequestHandler]:
+        """Make a request handler bound to this server."""
+        preview = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                page = self.path.split("?", 1)[0].split("#", 1)[0].lstrip("/")
+                if not page:
+                    root_page = next(iter(preview.pages))
+                    self.send_response(HTTPStatus.FOUND)
+                    self.send_header("Location", "/" + root_page)
+                    self.end_headers()
+                    return
+                doc = preview.render(page)
+                if doc is None:
+                    self.send_error(HTTPStatus.NOT_FOUND)
+                    return
+                body = preview.to_html(page, doc).encode("utf-8")
+                self.send_response(HTTPStatus.OK)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        return Handler
+
+    def serve_forever(self, host: str = "127.0.0.1", port: int = 8000) -> None:
+        """
+        Start the HTTP server.
+
+        **Args**
+
+        * host (`str`): Address to bind.
+        * port (`int`): Port to listen.
+
+        """
+        with ThreadingHTTPServer((host, port), self.handler()) as httpd:
+            print(f"Serving on http://{host}:{port}/")
+            httpd.serve_forever()
@@ -0,0 +1,224 @@
+"""
+shards - Split a build across machines, and merge the results.
+
+Modules are assigned to shards by digests of their names, so every shard agrees on
+the partition without importing modules of other shards. Each shard writes its pages
+and a partial symbol index. Links to members of other shards are left as
+back-quoted names, and replaced by `inari.shards.merge_shards` from the merged
+index without importing anything.
+"""
+
+import hashlib
+import os
+import pathlib
+import re
+import time
+from collections.abc import Sequence
+from types import ModuleType
+from typing import Any, Optional, Union
+
+from ._internal._modules import find_modules
+from ._internal._path import link_names, make_relpaths, to_page
+from .build import make_roots
+from .collectors import ModuleCollector
+from .hooks import hooks
+from .imports import timer
+from .index import STATE_DIR, SymbolIndex, index_path
+from .memory import MemoryProfiler
+from .selectors import Selector
+
+_shard_file = re.compile(r"shard-(\d+)-of-(\d+)\.json")
+
+
+def parse_shard(value: str) -> tuple[int, int]:
+    """
+    **Args**
+
+    * value (`str`): Like `2/4` , the second of four shards.
+
+    **Returns**
+
+    * `tuple[int, int]`: Shard number from 1, and the number of shards. Raise
+        `ValueError` if the value is malformed or out of range.
+
+    """
+    number, _, count = value.partition("/")
+    shard = int(number), int(count)
+    if not 1 <= shard[0] <= shard[1]:
+        raise ValueError(f"Shard out of range: {value}")
+    return shard
+
+
+def shard_of(name: str, count: int) -> int:
+    """
+    **Args**
+
+    * name (`str`): Module name.
+    * count (`int`): Number of shards.
+
+    **Returns**
+
+    * `int`: Shard number from 1. Same on every machine and Python version.
+
+    """
+    digest = hashlib.md5(name.encode("utf-8")).hexdigest()
+    return int(digest[:8], 16) % count + 1
+
+
+def shard_index_path(
+    out_dir: Union[str, os.PathLike[str]], shard: tuple[int, int]
+) -> pathlib.Path:
+    """
+    **Args**
+
+    * out_dir (`Union[str, Path]`): Output directory given to the build.
+    * shard (`tuple[int, int]`): See `inari.shards.parse_shard` .
+
+    **Returns**
+
+    * `Path`: Location of the partial index. Names differ by shards, so outputs of
+        all shards can be copied into one directory.
+
+    """
+    number, count = shard
+    return pathlib.Path(out_dir) / STATE_DIR / f"shard-{number}-of-{count}.json"
+
+
+def _selected(name: str, root_name: str, selector: Selector) -> bool:
+    """Same as `inari.collectors.ModuleCollector.init_submodules` , from names."""
+    parts = name.split(".")
+    start = len(root_name.split(".")) + 1
+    return all(
+        selector.may_contain(".".join(parts[:i])) for i in range(start, len(parts) + 1)
+    )
+
+
+def write_shard(
+    roots: Sequence[ModuleType],
+    out_dir: Union[str, os.PathLike[str]],
+    shard: tuple[int, int],
+    out_name: Optional[str] = None,
+    profiler: Optional[MemoryProfiler] = None,
+    **options: Any,
+) -> list[ModuleCollector]:
+    """
+    Collect and write modules of the shard, and write its partial index. Modules
+    are found from the file system, and only modules of the shard and their direct
+    submodules are imported.
+
+    **Args**
+
+    * roots (`Sequence[ModuleType]`): Root modules.
+    * out_dir (`Union[str, Path]`): Output directory.
+    * shard (`tuple[int, int]`): See `inari.shards.parse_shard` .
+    * out_name (`Optional[str]`): See `inari.build.make_roots` .
+    * profiler (`Optional[MemoryProfiler]`): Snapshots are taken after collecting
+        and writing.
+    * options (`Any`): Passed to `inari.collectors.ModuleCollector` .
+
+    **Returns**
+
+    * `list[ModuleCollector]`: Written modules.
+
+    """
+    start = time.perf_counter()
+    number, count = shard
+    selector: Selector = options.get("module_selector") or Selector()
+    name_to_path: dict[str, str] = {}
+    for root_mod in roots:
+        for name, path in find_modules(root_mod.__name__).items():
+            if _selected(name, root_mod.__name__, selector):
+                name_to_path[name] = path
+    root_collectors = make_roots(
+        roots, out_dir, out_name, name_to_path, recursive=False, **options
+    )
+
+    collectors: list[ModuleCollector] = []
+    for name in sorted(name_to_path):
+        if shard_of(name, count) != number:
+            continue
+        root = next(
+            r
+            for r in root_collectors
+            if name == r.mod.__name__ or name.startswith(r.mod.__name__ + ".")
+        )
+        if name == root.mod.__name__:
+            collectors.append(root)
+            continue
+        mod = timer.import_module(name)
+        parts = name.removeprefix(root.mod.__name__ + ".").split(".")[:-1]
+        collectors.append(
+            ModuleCollector(
+                mod,
+                root.out_dir.joinpath(*parts),
+                name_to_path,
+                recursive=False,
+                **options,
+            )
+        )
+
+    for collector in collectors:
+        collector._prepare_docs()
+    if profiler:
+        profiler.phase("collect")
+    for collector in collectors:
+        collector._write()
+    if profiler:
+        profiler.phase("write")
+
+    index = SymbolIndex()
+    index.update_modules(collectors, out_dir)
+    index.dump(shard_index_path(out_dir, shard))
+    if hooks.wants("build_finished"):
+        hooks.emit("build_finished", collectors, time.perf_counter() - start)
+    return collectors
+
+
+def merge_shards(out_dir: Union[str, os.PathLike[str]]) -> SymbolIndex:
+    """
+    Merge partial indexes of all shards into the symbol index, and link names
+    left in pages by other shards.
+
+    **Args**
+
+    * out_dir (`Union[str, Path]`): Directory containing outputs of all shards.
+
+    **Returns**
+
+    * `SymbolIndex`: Merged index, also written to `inari.index.index_path` . Raise
+        `ValueError` if partial indexes are missing or from different shard counts.
+
+    """
+    found: dict[int, set[int]] = {}
+    for path in pathlib.Path(out_dir, STATE_DIR).glob("shard-*-of-*.json"):
+        matched = _shard_file.fullmatch(path.name)
+        if matched:
+            number, count = int(matched.group(1)), int(matched.group(2))
+            found.setdefault(count, set()).add(number)
+    if len(found) != 1:
+        raise ValueError(f"Expected partial indexes of one build: {sorted(found)}")
+    ((count, numbers),) = found.items()
+    missing = sorted(set(range(1, count + 1)) - numbers)
+    if missing:
+        raise ValueError(f"Missing shards of {count}: {missing}")
+
+    index = SymbolIndex()
+    for number in range(1, count + 1):
+        part = SymbolIndex.load(shard_index_path(out_dir, (number, count)))
+        index.modules.update(part.modules)
+        index.references.update(part.references)
+
+    name_to_path = index.name_to_path()
+    pages = {s.page: to_page(s.path.partition("#")[0]) for s in index.symbols()}
+    for page, current_page in sorted(pages.items()):
+        path = pathlib.Path(out_dir, page)
+        with open(path, mode="r", newline="\n", encoding="utf-8") as f:
+            doc = f.read()
+        linked = link_names(doc, make_relpaths(name_to_path, current_page))
+        if linked == doc:
+            continue
+        with open(path, mode="w", newline="\n", encoding="utf-8") as f:
+            f.write(linked)
+
+    index.dump(index_path(out_dir))
+    return index
@@ -0,0 +1,123 @@
+"""
+sinks - Destinations of generated pages.
+
+`inari.collectors.ModuleCollector` writes pages through a sink. `FileSink` writes
+files, and is the default. `ZipSink` streams pages into one archive.
+"""
+
+import os
+import pathlib
+import zipfile
+from abc import ABC, abstractmethod
+from typing import Optional, Union
+
+
+class Sink(ABC):
+    """Interface of destinations. Paths are the same as file output."""
+
+    @abstractmethod
+    def read(self, path: pathlib.Path) -> Optional[str]:
+        """Content of the page written by the previous build, or `None` ."""
+
+    @abstractmethod
+    def write(self, path: pathlib.Path, content: str) -> None:
+        """Write the page. Parent directories are created automatically."""
+
+    @abstractmethod
+    def exists(self, path: pathlib.Path) -> bool:
+        """`True` if the page exists."""
+
+    @abstractmethod
+    def listdir(self, path: pathlib.Path) -> list[str]:
+        """Names of pages in the directory. Blank if the directory is missing."""
+
+    @abstractmethod
+    def remove(self, path: pathlib.Path) -> None:
+        """Remove the page of a deleted module or class."""
+
+    def close(self) -> None:
+        """Finish writing."""
+
+
+class FileSink(Sink):
+    """Write pages to files."""
+
+    def read(self, path: pathlib.Path) -> Optional[str]:
+        if not os.path.isfile(path):
+            return None
+        with open(path, mode="r", newline="\n", encoding="utf-8") as f:
+            return f.read()
+
+    def write(self, path: pathlib.Path, content: str) -> None:
+        os.makedirs(path.parent, exist_ok=True)
+        with open(path, mode="w", newline="\n", encoding="utf-8") as f:
+            f.write(content)
+
+    def exists(self, path: pathlib.Path) -> bool:
+        return os.path.isfile(path)
+
+    def listdir(self, path: pathlib.Path) -> list[str]:
+        if not os.path.isdir(path):
+            return []
+        return [f for f in os.listdir(path) if os.path.isfile(path / f)]
+
+    def remove(self, path: pathlib.Path) -> None:
+        os.remove(path)
+
+
+class ZipSink(Sink):
+    """
+    Stream pages into a new zip archive in one sequential write. Nothing is read
+    from the previous build, so every page is written.
+
+    **Attributes**
+
+    * archive (`zipfile.ZipFile`): Archive opened for writing.
+    * base_dir (`pathlib.Path`): Output directory. Names in the archive are
+        relative to this, so the layout and links are kept.
+
+    """
+
+    archive: zipfile.ZipFile
+    base_dir: pathlib.Path
+
+    _written: set[str]
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike[str]],
+        base_dir: Union[str, os.PathLike[str]],
+    ) -> None:
+        """
+        **Args**
+
+        * path (`Union[str, Path]`): Archive file, overwritten.
+        * base_dir (`Union[str, Path]`): Output directory given to collectors.
+
+        """
+        self.archive = zipfile.ZipFile(path, mode="w", compression=zipfile.ZIP_DEFLATED)
+        self.base_dir = pathlib.Path(base_dir)
+        self._written = set()
+
+    def _name(self, path: pathlib.Path) -> str:
+        return pathlib.Path(os.path.relpath(path, self.base_dir)).as_posix()
+
+    def read(self, path: pathlib.Path) -> Optional[str]:
+        return None
+
+    def write(self, path: pathlib.Path, content: str) -> None:
+        name = self._name(path)
+        self._written.add(name)
+        self.archive.writestr(name, content)
+
+    def exists(self, path: pathlib.Path) -> bool:
+        return self._name(path) in self._written
+
+    def listdir(self, path: pathlib.Path) -> list[str]:
+        return []
+
+    def remove(self, path: pathlib.Path) -> None:
+        pass
+
+    def close(self) -> None:
+        self.archive.close()
@@ -0,0 +1,278 @@
+"""
+store - Documentation store in a SQLite database.
+
+Collected data and rendered markdown of each object are stored in one file, indexed
+by qualified name, module and kind. Only modules whose source digest is changed are
+rewritten.
+"""
+
+import json
+import os
+import sqlite3
+import time
+from collections.abc import Iterable, Sequence
+from typing import NamedTuple, Optional, Union
+
+from ._internal._format import join_fragments
+from .collectors import ModuleCollector
+from .export import module_records
+from .hooks import hooks
+from .index import iter_collectors
+from .memory import MemoryProfiler
+
+SCHEMA_VERSION = 1
+"""(`int`): Stored in `PRAGMA user_version` . Outdated databases are rebuilt."""
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS modules (name TEXT PRIMARY KEY, digest TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS symbols (
+    name TEXT PRIMARY KEY,
+    module TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    signature TEXT NOT NULL,
+    docstring TEXT NOT NULL,
+    bases TEXT NOT NULL,
+    path TEXT NOT NULL,
+    fragment TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS symbols_module ON symbols (module);
+CREATE INDEX IF NOT EXISTS symbols_kind ON symbols (kind);
+"""
+
+_COLUMNS = "name, module, kind, signature, docstring, bases, path, fragment"
+
+
+class StoredSymbol(NamedTuple):
+    """
+    A row of the store.
+
+    **Attributes**
+
+    * name (`str`): Qualified name like `inari.collectors.ModuleCollector` .
+    * module (`str`): Module defining the object.
+    * kind (`str`): See `inari.export.Record` .
+    * signature (`str`): See `inari.export.Record` .
+    * docstring (`str`): Cleaned docstring.
+    * bases (`list[str]`): Direct base classes.
+    * path (`str`): Absolute path of the document, like `/pkg/mod-py#Class` .
+    * fragment (`str`): Rendered markdown with links. The whole page for modules.
+
+    """
+
+    name: str
+    module: str
+    kind: str
+    signature: str
+    docstring: str
+    bases: list[str]
+    path: str
+    fragment: str
+
+
+def _to_symbol(row: tuple[str, ...]) -> StoredSymbol:
+    name, module, kind, signature, docstring, bases, path, fragment = row
+    return StoredSymbol(
+        name, module, kind, signature, docstring, json.loads(bases), path, fragment
+    )
+
+
+def _fragments(collector: ModuleCollector) -> dict[str, str]:
+    """Rendered markdown without links, keyed by absolute paths."""
+    fragments = {collector.abs_path: join_fragments(collector._fragments())}
+    for v in collector.variables:
+        if not v._should_skip:
+            fragments[v.abs_path] = v.doc_str()
+    for c in collector.classes:
+        fragments[c.abs_path] = c.doc_str()
+        for p in c.variables:
+            if not p._should_skip:
+                fragments[p.abs_path] = p.doc_str()
+        for m in c.methods:
+            fragments[m.abs_path] = m.doc_str()
+    for f in collector.functions:
+        fragments[f.abs_path] = f.doc_str()
+    return fragments
+
+
+class DocStore:
+    """
+    Read and write the database.
+
+    **Attributes**
+
+    * connection (`sqlite3.Connection`): Open connection.
+
+    """
+
+    connection: sqlite3.Connection
+
+    def __init__(self, path: Union[str, os.PathLike[str]]) -> None:
+        """
+        **Args**
+
+        * path (`Union[str, Path]`): Database file, created if missing.
+
+        """
+        self.connection = sqlite3.connect(path)
+        (version,) = self.connection.execute("PRAGMA user_version").fetchone()
+        if version != SCHEMA_VERSION:
+            with self.connection:
+                self.connection.execute("DROP TABLE IF EXISTS modules")
+                self.connection.execute("DROP TABLE IF EXISTS symbols")
+        self.connection.executescript(_SCHEMA)
+        self.connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def digests(self) -> dict[str, str]:
+        """Stored modules and their digests."""
+        return dict(self.connection.execute("SELECT name, digest FROM modules"))
+
+    def update_modules(self, collectors: Iterable[ModuleCollector]) -> list[str]:
+        """
+        Replace rows of modules whose digest is changed.
+
+        **Args**
+
+        * collectors (`Iterable[ModuleCollector]`): Prepared collectors sharing
+            `name_to_path` .
+
+        **Returns**
+
+        * `list[str]`: Updated modules.
+
+        """
+        digests = self.digests()
+        updated = []
+        with self.connection:
+            for collector in collectors:
+                name = collector.mod.__name__
+                digest = collector.module_digest()
+                if digests.get(name) == digest:
+                    continue
+                collector.make_relpaths()
+                fragments = _fragments(collector)
+                rows = [
+                    (
+                        r["name"],
+                        name,
+                        r["kind"],
+                        r["signature"],
+                        r["docstring"],
+                        json.dumps(r["bases"]),
+                        r["path"],
+                        collector.make_links(fragments.get(r["path"], "")),
+                    )
+                    for r in module_records(collector)
+                ]
+                self.connection.execute("DELETE FROM symbols WHERE module = ?", (name,))
+                self.connection.executemany(
+                    f"INSERT OR REPLACE INTO symbols ({_COLUMNS})"
+                    + " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO modules (name, digest) VALUES (?, ?)",
+                    (name, digest),
+                )
+                updated.append(name)
+        return updated
+
+    def update(self, root: ModuleCollector) -> list[str]:
+        """
+        Update changed modules of the root, and remove deleted modules.
+
+        **Args**
+
+        * root (`ModuleCollector`): Prepared collector of the root module.
+
+        **Returns**
+
+        * `list[str]`: Updated modules.
+
+        """
+        collectors = list(iter_collectors(root))
+        found = {c.mod.__name__ for c in collectors}
+        root_name = root.mod.__name__
+        for name in self.digests():
+            in_root = name == root_name or name.startswith(root_name + ".")
+            if in_root and name not in found:
+                self.remove(name)
+        return self.update_modules(collectors)
+
+    def remove(self, module: str) -> None:
+        """Remove rows of the module."""
+        with self.connection:
+            self.connection.execute("DELETE FROM symbols WHERE module = ?", (module,))
+            self.connection.execute("DELETE FROM modules WHERE name = ?", (module,))
+
+    def get(self, name: str) -> Optional[StoredSymbol]:
+        """
+        **Args**
+
+        * name (`str`): Qualified name.
+
+        **Returns**
+
+        * `Optional[StoredSymbol]`: The symbol, or `None` if not found.
+
+        """
+        row = self.connection.execute(
+            f"SELECT {_COLUMNS} FROM symbols WHERE name = ?", (name,)
+        ).fetchone()
+        return _to_symbol(row) if row else None
+
+    def by_module(self, module: str) -> list[StoredSymbol]:
+        """Symbols defined in the module, including the module itself."""
+        rows = self.connection.execute(
+            f"SELECT {_COLUMNS} FROM symbols WHERE module = ? ORDER BY rowid",
+            (module,),
+        )
+        return [_to_symbol(r) for r in rows]
+
+    def by_kind(self, kind: str) -> list[StoredSymbol]:
+        """Symbols of the kind, like `class` ."""
+        rows = self.connection.execute(
+            f"SELECT {_COLUMNS} FROM symbols WHERE kind = ? ORDER BY name", (kind,)
+        )
+        return [_to_symbol(r) for r in rows]
+
+
+def write_store(
+    roots: Sequence[ModuleCollector],
+    path: Union[str, os.PathLike[str]],
+    profiler: Optional[MemoryProfiler] = None,
+) -> list[str]:
+    """
+    Same as `inari.build.write_roots` , but write to the database.
+
+    **Args**
+
+    * roots (`Sequence[ModuleCollector]`): Collectors sharing `name_to_path` .
+    * path (`Union[str, Path]`): Database file.
+    * profiler (`Optional[MemoryProfiler]`): Snapshots are taken after collecting
+        and writing.
+
+    **Returns**
+
+    * `list[str]`: Updated modules.
+
+    """
+    start = time.perf_counter()
+    for root in roots:
+        root._prepare_docs()
+    if profiler:
+        profiler.phase("collect")
+    store = DocStore(path)
+    try:
+        updated = []
+        for root in roots:
+            updated.extend(store.update(root))
+    finally:
+        store.close()
+    if profiler:
+        profiler.phase("write")
+    if hooks.wants("build_finished"):
+        hooks.emit("build_finished", list(roots), time.perf_counter() - start)
+    return updated
@@ -0,0 +1,21 @@
+import pathlib
+
+from inari._internal import _git
+from ward import test
+
+from ..rebuild import sample_package
+
+
+@test("Changed files should be mapped to public modules in the root.")
+def _() -> None:
+    root = pathlib.Path(sample_package.__file__ or "").resolve().parent
+    files = {
+        root / "__init__.py",
+        root / "alpha.py",
+        root / "_private.py",
+        root.parent / "test_rebuild.py",
+    }
+    assert _git.to_module_names(sample_package, files) == {
+        "tests.rebuild.sample_package",
+        "tests.rebuild.sample_package.alpha",
+    }
@@ -0,0 +1,75 @@
+from inari._internal._members import class_members
+from ward import test
+
+
+class Base:
+    @property
+    def shared(self) -> int:
+        return 0
+
+    @property
+    def overridden(self) -> int:
+        return 0
+
+    def inherited(self) -> None:
+        pass
+
+
+class Derived(Base):
+    overridden = 1
+
+    @property
+    def own(self) -> int:
+        return 0
+
+    def method(self) -> None:
+        pass
+
+    @classmethod
+    def create(cls) -> "Derived":
+        return cls()
+
+    def _private(self) -> None:
+        pass
+
+
+class Plain:
+    shared = None
+
+
+class Shadowed(Plain, Base):
+    pass
+
+
+class Left(Base):
+    pass
+
+
+class Right(Base):
+    shared = None
+
+
+class Diamond(Left, Right):
+    pass
+
+
+@test("`class_members` should find own methods and visible properties.")
+def _() -> None:
+    members = class_members(Derived)
+    assert [name for name, _ in members.properties] == ["own", "shared"]
+    assert [name for name, _ in members.methods] == ["create", "method"]
+    assert members.methods[0][1] == Derived.create
+
+
+@test("`class_members` should build the index once per class.")
+def _() -> None:
+    assert class_members(Derived) is class_members(Derived)
+    assert [name for name, _ in class_members(Base).methods] == ["inherited"]
+
+
+@test("`class_members` should resolve properties in the order of the MRO.")
+def _() -> None:
+    assert Shadowed.shared is None
+    assert [name for name, _ in class_members(Shadowed).properties] == ["overridden"]
+    assert Diamond.shared is None
+    assert [name for name, _ in class_members(Diamond).properties] == ["overridden"]
@@ -16,25 +16,53 @@ another_dir = Fixtures(page="/inari/foo/bar", link_to="/inari/baz", result="../b
 another_dir_child = Fixtures(
     page="/inari/foo/bar", link_to="/inari/baz/spam", result="../baz/spam"
 )
+parent_page = Fixtures(
+    page="/inari/foo-py/Bar-cls", link_to="/inari/foo-py", result="../foo-py"
+)
 
 
 @test("Relative link from `{page}` to `{link_to}` should be `{result}` .")
 @using(
     page=each(
-        current_dir.page, link_self.page, another_dir.page, another_dir_child.page
+        current_dir.page,
+        link_self.page,
+        another_dir.page,
+        another_dir_child.page,
+        parent_page.page,
     ),
     link_to=each(
         current_dir.link_to,
         link_self.link_to,
         another_dir.link_to,
         another_dir_child.link_to,
+        parent_page.link_to,
     ),
     result=each(
         current_dir.result,
         link_self.result,
         another_dir.result,
         another_dir_child.result,
+        parent_page.result,
     ),
 )
 def _(page: str, link_to: str, result: str) -> None:
     assert _path.get_relative_path(page, link_to) == result
+
+
+@test("Name of `{abs_path}` should be `{result}` .")
+@using(
+    abs_path=each(
+        "/inari/collectors-py",
+        "/inari/collectors-py#ClassCollector.doc_str",
+        "/inari#ModuleCollector",
+        "/inari/collectors-py/ClassCollector-cls#ClassCollector.doc_str",
+    ),
+    result=each(
+        "inari.collectors",
+        "inari.collectors.ClassCollector.doc_str",
+        "inari.ModuleCollector",
+        "inari.collectors.ClassCollector.doc_str",
+    ),
+)
+def _(abs_path: str, result: str) -> None:
+    assert _path.path_to_name(abs_path) == result
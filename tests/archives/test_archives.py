@@ -0,0 +1,136 @@
+import io
+import pathlib
+import sys
+import tarfile
+import zipfile
+
+from inari.archives import ArchiveImporter, _in_stdlib_dir, expand_roots
+from inari.build import make_roots, write_roots
+from ward import test, using
+
+from ..collectors.fixtures import _temp_dir
+from ..rebuild import sample_package
+
+_live_name = "tests.rebuild.sample_package"
+
+
+def _sources() -> dict[str, bytes]:
+    """Files of the sample package, renamed to a top-level package."""
+    package_dir = pathlib.Path(sample_package.__file__).parent
+    return {
+        f"sample_package/{p.name}": p.read_text()
+        .replace(_live_name, "sample_package")
+        .encode("utf-8")
+        for p in package_dir.glob("*.py")
+    }
+
+
+def _write_wheel(path: pathlib.Path) -> None:
+    with zipfile.ZipFile(path, "w") as archive:
+        for name, data in _sources().items():
+            archive.writestr(name, data)
+        archive.writestr("sample-1.0.dist-info/METADATA", "Name: sample\n")
+
+
+def _write_sdist(path: pathlib.Path) -> None:
+    files = {f"sample-1.0/src/{name}": data for name, data in _sources().items()}
+    files["sample-1.0/setup.py"] = b"raise SystemExit('should not be run')\n"
+    with tarfile.open(path, "w:gz") as archive:
+        for name, data in files.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            archive.addfile(info, io.BytesIO(data))
+
+
+def _pages(out_dir: pathlib.Path) -> dict[str, str]:
+    pages = {}
+    for p in out_dir.rglob("*.md"):
+        text = p.read_text()
+        pages[p.relative_to(out_dir).as_posix()] = text.replace(
+            _live_name, "sample_package"
+        )
+    return pages
+
+
+@test("Wheels and source distributions should be documented like installed modules.")
+@using(temp_dir=_temp_dir)
+def _(temp_dir: str) -> None:
+    live_dir = pathlib.Path(temp_dir, "live")
+    write_roots(make_roots([sample_package], live_dir))
+    expected = _pages(live_dir)
+
+    for filename, write_archive in [
+        ("sample-1.0-py3-none-any.whl", _write_wheel),
+        ("sample-1.0.tar.gz", _write_sdist),
+    ]:
+        path = pathlib.Path(temp_dir, filename)
+        write_archive(path)
+        root_names, importers = expand_roots([str(path)])
+        assert root_names == ["sample_package"]
+        out_dir = pathlib.Path(temp_dir, filename.split("-")[-1])
+        with importers[0]:
+            roots = make_roots([importers[0].import_stub("sample_package")], out_dir)
+            write_roots(roots)
+        assert _pages(out_dir) == expected
+        assert "sample_package" not in sys.modules
+
+
+@test("`ArchiveImporter` should stub dependencies and skip code of the archive.")
+@using(temp_dir=_temp_dir)
+def _(temp_dir: str) -> None:
+    source = '''
+import enum
+import os
+from typing import TYPE_CHECKING
+
+import missing_dependency
+from missing_dependency import Base
+
+if TYPE_CHECKING:
+    from os import PathLike
+else:
+    PathLike = str
+
+os.remove("should not be run")
+
+
+class Color(enum.IntEnum):
+    """Colors."""
+
+    RED = enum.auto()
+
+
+class Derived(Base, missing_dependency.Mixin):
+    """Derived class."""
+
+    def method(self, path: PathLike = os.sep) -> "Base":
+        """Method."""
+        raise NotImplementedError
+'''
+    path = pathlib.Path(temp_dir, "stubbed-1.0-py3-none-any.whl")
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr("stubbed.py", source)
+
+    with ArchiveImporter(path) as importer:
+        mod = importer.import_stub("stubbed")
+        assert "missing_dependency" not in sys.modules
+        assert mod.Color.RED == 1
+        assert [c.__name__ for c in mod.Derived.__mro__] == [
+            "Derived",
+            "Base",
+            "Mixin",
+            "object",
+        ]
+        assert mod.Derived.__mro__[1].__module__ == "missing_dependency"
+        assert mod.Derived.method.__doc__ == "Method."
+        assert mod.Derived.method.__defaults__ == (mod.os.sep,)
+        assert mod.PathLike is str
+    assert "stubbed" not in sys.modules
+
+
+@test("Modules of the standard library should be found without `stdlib_module_names`.")
+def _() -> None:
+    for name in ["enum", "dataclasses", "collections", "json", "sys", "_io"]:
+        assert _in_stdlib_dir(name)
+    for name in ["ward", "inari", "missing_dependency"]:
+        assert not _in_stdlib_dir(name)
@@ -0,0 +1,4 @@
+"""
+Links to another root: `tests.rebuild.sample_package.alpha.Alpha` , and
+`tests.rebuild.sample_package.alpha.Alpha.run` .
+"""
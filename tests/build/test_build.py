@@ -0,0 +1,71 @@
+import pathlib
+from os.path import isfile
+
+from inari.build import make_roots, update_index, write_roots
+from inari.hooks import hooks
+from ward import test, using
+
+from ..collectors.fixtures import _temp_dir
+from ..rebuild import sample_package
+from . import other_package
+
+
+@test("Several roots should be written in one build with links between them.")
+@using(out_dir=_temp_dir)
+def _(out_dir: str) -> None:
+    roots = make_roots([sample_package, other_package], out_dir, "api")
+    assert roots[0].name_to_path is roots[1].name_to_path
+    write_roots(roots)
+
+    api = pathlib.Path(out_dir, "api", "tests")
+    assert isfile(api / "rebuild" / "sample_package" / "alpha-py.md")
+    other = (api / "build" / "other_package" / "index.md").read_text()
+    link = "[`Alpha `](../../rebuild/sample_package/alpha-py.md#Alpha)"
+    assert link in other
+
+    index = update_index(roots, out_dir)
+    assert "tests.build.other_package" in index.modules
+    assert "tests.rebuild.sample_package.alpha" in index.modules
+
+
+@test("A single root should keep `out_name` as its own name.")
+@using(out_dir=_temp_dir)
+def _(out_dir: str) -> None:
+    write_roots(make_roots([sample_package], out_dir, "api"))
+    assert isfile(pathlib.Path(out_dir, "api", "index.md"))
+
+
+@test("Pages rendered in threads should be the same as sequential builds.")
+@using(out_dir=_temp_dir)
+def _(out_dir: str) -> None:
+    outputs = []
+    for jobs in [1, 4]:
+        job_dir = pathlib.Path(out_dir, str(jobs))
+        roots = make_roots(
+            [sample_package, other_package], job_dir, "api", split_classes=True
+        )
+        written: list[str] = []
+        callback = hooks.on("page_written")(lambda e: written.append(str(e.path)))
+        try:
+            write_roots(roots, jobs=jobs)
+        finally:
+            hooks.unregister("page_written", callback)
+        pages = sorted(p for p in job_dir.rglob("*.md"))
+        assert sorted(written) == sorted(str(p) for p in pages)
+        outputs.append({p.relative_to(job_dir): p.read_text() for p in pages})
+    assert outputs[0] == outputs[1]
+
+
+@test("Members linked from other modules should be linked in threaded builds.")
+@using(out_dir=_temp_dir)
+def _(out_dir: str) -> None:
+    pages = []
+    for jobs in [1, 4]:
+        job_dir = pathlib.Path(out_dir, str(jobs))
+        roots = make_roots([sample_package, other_package], job_dir, "api")
+        write_roots(roots, jobs=jobs)
+        other = job_dir / "api" / "tests" / "build" / "other_package" / "index.md"
+        pages.append(other.read_text())
+    link = "[`Alpha.run `](../../rebuild/sample_package/alpha-py.md#Alpha.run)"
+    assert link in pages[0]
+    assert pages[0] == pages[1]
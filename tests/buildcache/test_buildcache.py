@@ -0,0 +1,92 @@
+import pathlib
+
+from inari import collectors
+from inari.build import make_roots, write_roots
+from inari.buildcache import build_cache, version_tag
+from ward import test, using
+
+from ..build import other_package
+from ..collectors.fixtures import _temp_dir
+from ..rebuild import sample_package
+
+
+def _pages(out_dir: pathlib.Path) -> dict[str, str]:
+    return {
+        p.relative_to(out_dir).as_posix(): p.read_text() for p in out_dir.rglob("*.md")
+    }
+
+
+@test("`BuildCache` should restore pages into a new output directory.")
+@using(temp_dir=_temp_dir)
+def _(temp_dir: str) -> None:
+    cache_dir = pathlib.Path(temp_dir, "cache")
+    cold, warm = pathlib.Path(temp_dir, "cold"), pathlib.Path(temp_dir, "warm")
+
+    build_cache.open(cache_dir)
+    write_roots(make_roots([sample_package], cold, split_classes=True))
+    assert build_cache.hits == 0
+    stored = build_cache.misses
+    build_cache.close()
+
+    build_cache.open(cache_dir)
+    write_roots(make_roots([sample_package], warm, split_classes=True))
+    assert (build_cache.hits, build_cache.misses) == (stored, 0)
+    build_cache.close()
+
+    assert _pages(warm) == _pages(cold)
+    entries = list((cache_dir / version_tag()).rglob("*"))
+    assert len([x for x in entries if x.suffix == ".md"]) == stored
+    assert all(temp_dir not in x.read_text() for x in entries if x.is_file())
+
+
+@test("`BuildCache` entries should be linked again, and pruned if unused.")
+@using(temp_dir=_temp_dir)
+def _(temp_dir: str) -> None:
+    cache_dir = pathlib.Path(temp_dir, "cache")
+    stale = cache_dir / "inari-0.0.0-cpython-00"
+    stale.mkdir(parents=True)
+
+    build_cache.open(cache_dir)
+    write_roots(make_roots([sample_package], pathlib.Path(temp_dir, "one")))
+    build_cache.close()
+
+    build_cache.open(cache_dir)
+    out_dir = pathlib.Path(temp_dir, "two")
+    write_roots(make_roots([sample_package, other_package], out_dir, "api"))
+    hits = build_cache.hits
+    build_cache.close()
+
+    # pages of `sample_package` are reused with links to the other root.
+    assert hits == 4
+    other = out_dir / "api" / "tests" / "build" / "other_package" / "index.md"
+    link = "[`Alpha `](../../rebuild/sample_package/alpha-py.md#Alpha)"
+    assert link in other.read_text()
+    assert stale.exists()
+
+    build_cache.open(cache_dir)
+    write_roots(make_roots([other_package], pathlib.Path(temp_dir, "three")))
+    build_cache.close(prune_versions=True)
+    assert len(list(cache_dir.glob("*/pages/*/*.md"))) == 1
+    assert not stale.exists()
+
+
+@test("`BuildCache` entries should depend on whether markdown is installed.")
+@using(temp_dir=_temp_dir)
+def _(temp_dir: str) -> None:
+    cache_dir = pathlib.Path(temp_dir, "cache")
+    build_cache.open(cache_dir)
+    write_roots(make_roots([sample_package], temp_dir, split_classes=True))
+    build_cache.close()
+
+    installed = collectors.markdown
+    collectors.markdown = None  # type: ignore[assignment]
+    try:
+        out_dir = pathlib.Path(temp_dir, "plain")
+        build_cache.open(cache_dir)
+        write_roots(make_roots([sample_package], out_dir, split_classes=True))
+        assert build_cache.hits == 0
+        build_cache.close()
+    finally:
+        collectors.markdown = installed
+    alpha = out_dir / "sample_package" / "alpha-py" / "Alpha-cls.md"
+    assert "{: #" not in alpha.read_text()
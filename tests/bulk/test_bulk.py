@@ -0,0 +1,59 @@
+import pathlib
+from os.path import isfile
+
+from inari.bulk import find_distributions, write_distributions
+from inari.index import SymbolIndex, index_path
+from ward import test, using
+
+from ..collectors.fixtures import _temp_dir
+
+
+def _write_dist(site: pathlib.Path, name: str, files: dict[str, str]) -> None:
+    info = site / f"{name}-1.0.dist-info"
+    info.mkdir()
+    (info / "METADATA").write_text(f"Metadata-Version: 2.1\nName: {name}\n")
+    for filename, text in files.items():
+        (info / filename).write_text(text)
+
+
+@test("`find_distributions` should find top-level modules of matched distributions.")
+@using(site=_temp_dir)
+def _(site: str) -> None:
+    path = pathlib.Path(site)
+    _write_dist(path, "Acme_Alpha", {"top_level.txt": "acme_alpha\n_private\n"})
+    _write_dist(path, "acme.beta", {"RECORD": "acme_beta/__init__.py,,\nsingle.py,,\n"})
+    # modules of several distributions belong to the first one.
+    _write_dist(path, "acme-gamma", {"top_level.txt": "acme_alpha\n"})
+    _write_dist(path, "other", {"top_level.txt": "other\n"})
+
+    found = find_distributions(["acme-*"], path=[site])
+    assert found == {"acme-alpha": ["acme_alpha"], "acme-beta": ["acme_beta", "single"]}
+    assert find_distributions(["acme-*"], ["*-beta"], path=[site]) == {
+        "acme-alpha": ["acme_alpha"]
+    }
+
+
+@test("`write_distributions` should link distributions, and isolate failures.")
+@using(out_dir=_temp_dir)
+def _(out_dir: str) -> None:
+    result = write_distributions(
+        {
+            "sample": ["tests.rebuild.sample_package"],
+            "other": ["tests.build.other_package"],
+            "broken": ["tests.bulk.missing_module"],
+        },
+        out_dir,
+        jobs=2,
+    )
+
+    assert sorted(result.written) == ["other", "sample"]
+    assert list(result.failed) == ["broken"]
+    assert result.failed["broken"].startswith("ModuleNotFoundError: ")
+    tests_dir = pathlib.Path(out_dir, "tests")
+    assert isfile(tests_dir / "rebuild" / "sample_package" / "alpha-py.md")
+    other = (tests_dir / "build" / "other_package" / "index.md").read_text()
+    assert "[`Alpha `](../../rebuild/sample_package/alpha-py.md#Alpha)" in other
+
+    modules = SymbolIndex.load(index_path(out_dir)).modules
+    assert "tests.build.other_package" in modules
+    assert "tests.rebuild.sample_package.alpha" in modules
@@ -0,0 +1,72 @@
+import pathlib
+from os.path import isfile
+
+from inari.collectors import ModuleCollector
+from inari.index import SymbolIndex, index_path
+from inari.nav import pages_from_collectors, pages_from_index
+from inari.rebuild import rebuild_modules
+from ward import test, using
+
+from ..rebuild import sample_package
+from .fixtures import _temp_dir
+
+_name = "tests.rebuild.sample_package"
+
+
+@test("`ModuleCollector` should fold small leaf modules into the package page.")
+@using(out_dir=_temp_dir)
+def _(out_dir: str) -> None:
+    collector = ModuleCollector(sample_package, out_dir, fold_below=2)
+    collector.write()
+
+    package_dir = pathlib.Path(out_dir, "sample_package")
+    assert sorted(p.name for p in package_dir.iterdir()) == ["index.md"]
+    doc = (package_dir / "index.md").read_text()
+    assert f"[{_name}.beta](#beta)" in doc
+    assert f"## Module {_name}.beta {{: #beta }}" in doc
+    assert "### Alpha {: #alpha.Alpha }" in doc
+    assert "* [`alpha.Alpha `](#alpha.Alpha)" in doc
+    assert "[**gamma**](#gamma.gamma){: #gamma.gamma }" in doc
+    assert collector.name_to_path[f"{_name}.alpha.Alpha"] == (
+        "/tests/rebuild/sample_package#alpha.Alpha"
+    )
+
+    index = SymbolIndex()
+    index.update(collector, out_dir)
+    pages = {_name: "sample_package/index.md"}
+    assert pages_from_collectors([collector], out_dir) == pages
+    assert pages_from_index(index) == pages
+
+
+@test("`ModuleCollector` should not fold modules with enough symbols.")
+@using(out_dir=_temp_dir)
+def _(out_dir: str) -> None:
+    collector = ModuleCollector(sample_package, out_dir, fold_below=1)
+    collector.write()
+
+    package_dir = pathlib.Path(out_dir, "sample_package")
+    assert isfile(package_dir / "alpha-py.md")
+    assert "## Module" not in (package_dir / "index.md").read_text()
+
+
+@test("`rebuild_modules` should rebuild the package page of folded modules.")
+@using(out_dir=_temp_dir)
+def _(out_dir: str) -> None:
+    collector = ModuleCollector(sample_package, out_dir, fold_below=2)
+    collector.write()
+    index = SymbolIndex()
+    index.update(collector, out_dir)
+    index.dump(index_path(out_dir))
+    page = pathlib.Path(out_dir, "sample_package", "index.md")
+    page.unlink()
+
+    gamma = f"{_name}.gamma"
+    rebuilt = rebuild_modules([sample_package], out_dir, {gamma}, fold_below=2)
+
+    assert sorted(c.mod.__name__ for c in rebuilt) == [_name, gamma]
+    assert "[**gamma**](#gamma.gamma)" in page.read_text()
+    assert not isfile(page.parent / "gamma-py.md")
+
+    rebuild_modules([sample_package], out_dir, {gamma}, deleted={gamma}, fold_below=2)
+    assert isfile(page)
+    assert gamma not in SymbolIndex.load(index_path(out_dir)).modules
@@ -0,0 +1,55 @@
+import pathlib
+from os.path import isfile
+
+from inari.collectors import ModuleCollector
+from ward import each, test, using
+
+from . import fixtures as target_module
+
+
+@test("Classes should be written on their own pages if `{option}` is exceeded.")
+@using(
+    out_dir=target_module._temp_dir,
+    option=each("split_classes", "max_symbols", "max_bytes"),
+    value=each(True, 1, 100),
+)
+def _(out_dir: str, option: str, value: object) -> None:
+    collector = ModuleCollector(target_module, out_dir, {}, **{option: value})
+    collector.write()
+    class_page = pathlib.Path(out_dir, "fixtures-py", "TargetClass-cls.md")
+    assert isfile(class_page)
+
+    module_doc = pathlib.Path(out_dir, "fixtures-py.md").read_text()
+    link = "* [`TargetClass `](fixtures-py/TargetClass-cls.md#TargetClass)"
+    assert link in module_doc
+    assert "#### Methods" not in module_doc
+
+    class_doc = class_page.read_text()
+    assert class_doc.startswith("# Class tests.collectors.fixtures.TargetClass")
+    assert "[**method1**](#TargetClass.method1)" in class_doc
+    assert (
+        collector.name_to_path["tests.collectors.fixtures.TargetClass.method1"]
+        == "/tests/collectors/fixtures-py/TargetClass-cls#TargetClass.method1"
+    )
+
+
+@test("Classes should stay on the module page under the thresholds.")
+@using(out_dir=target_module._temp_dir)
+def _(out_dir: str) -> None:
+    collector = ModuleCollector(target_module, out_dir, {}, max_symbols=10)
+    collector.write()
+    assert not collector.class_pages
+    assert not isfile(pathlib.Path(out_dir, "fixtures-py", "TargetClass-cls.md"))
+
+
+@test("Class pages should link back to the module page.")
+@using(out_dir=target_module._temp_dir)
+def _(out_dir: str) -> None:
+    collector = ModuleCollector(target_module, out_dir, {}, split_classes=True)
+    collector.write()
+    class_collector = collector.class_pages["fixtures-py/TargetClass-cls.md"]
+    relpaths = collector._make_relpaths(class_collector.abs_path.split("#")[0])
+    assert relpaths["tests.collectors.fixtures.target_function"] == (
+        "../fixtures-py.md",
+        "#target_function",
+    )
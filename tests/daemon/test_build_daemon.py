@@ -0,0 +1,48 @@
+import pathlib
+import threading
+
+from inari.daemon import BuildDaemon, request, socket_path
+from ward import test, using
+
+from ..collectors.fixtures import _temp_dir
+
+SAMPLE = "tests.rebuild.sample_package"
+
+
+@test("`BuildDaemon` should rebuild given modules and their dependents.")
+@using(out_dir=_temp_dir)
+def _(out_dir: str) -> None:
+    daemon = BuildDaemon([SAMPLE], out_dir)
+    assert f"{SAMPLE}.alpha" in daemon.build()
+    assert daemon.build() == []
+
+    package_dir = pathlib.Path(out_dir, "sample_package")
+    (package_dir / "beta-py.md").unlink()
+    assert daemon.rebuild([f"{SAMPLE}.alpha"]) == [f"{SAMPLE}.alpha", f"{SAMPLE}.beta"]
+    assert "[`Alpha `](alpha-py.md#Alpha)" in (package_dir / "beta-py.md").read_text()
+
+    page = daemon.render("sample_package/beta-py.md")
+    assert page == (package_dir / "beta-py.md").read_text()
+    assert daemon.render("sample_package/missing-py.md") is None
+
+
+@test("`BuildDaemon` should answer requests on the socket until `stop` .")
+@using(out_dir=_temp_dir)
+def _(out_dir: str) -> None:
+    daemon = BuildDaemon([SAMPLE], out_dir)
+    path = socket_path(out_dir)
+    ready = threading.Event()
+    thread = threading.Thread(target=lambda: daemon.serve_forever(path, ready))
+    thread.start()
+    assert ready.wait(10)
+
+    assert request(path, command="ping") == {"ok": True}
+    response = request(path, command="render", page="sample_package/alpha-py.md")
+    assert response["page"].startswith(f"# Module {SAMPLE}.alpha")
+    response = request(path, command="rebuild", modules=["missing"])
+    assert response == {"ok": False, "error": "ValueError: Unknown modules: missing"}
+    assert request(path, command="stop") == {"ok": True}
+
+    thread.join(10)
+    assert not thread.is_alive()
+    assert not path.exists()
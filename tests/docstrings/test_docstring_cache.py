@@ -0,0 +1,85 @@
+import inspect
+import os
+import pathlib
+
+from inari._internal._format import modify_attrs
+from inari.docstrings import DocstringCache
+from ward import test, using
+
+from ..collectors.fixtures import _temp_dir
+
+
+class Sample:
+    """
+    Sample class.
+
+    **Attributes**
+
+    * name (`str`): Name.
+
+    """
+
+    def method(self) -> None:
+        """
+        First line.
+            Indented line.
+        """
+
+
+@test("`DocstringCache.getdoc` should be same as `modify_attrs` of `getdoc` .")
+def _() -> None:
+    cache = DocstringCache()
+    for obj in [Sample, Sample.method, Sample.__init__]:
+        expected = modify_attrs(inspect.getdoc(obj) or "", "{: #x }")
+        assert cache.getdoc(obj, "{: #x }") == expected
+    assert cache.getdoc(Sample) == cache.getdoc(Sample)
+    assert (cache.hits, cache.misses) == (1, 4)
+
+
+@test("`DocstringCache` should drop the least recently used entry.")
+def _() -> None:
+    cache = DocstringCache(maxsize=2)
+    cache.normalize("a")
+    cache.normalize("b")
+    cache.normalize("a")
+    cache.normalize("c")
+    assert len(cache) == 2
+    cache.normalize("a")
+    cache.normalize("b")
+    assert (cache.hits, cache.misses) == (2, 4)
+
+
+@test("`DocstringCache` should reuse saved entries.")
+@using(tmp=_temp_dir)
+def _(tmp: str) -> None:
+    path = pathlib.Path(tmp, "docstrings.json")
+    cache = DocstringCache()
+    cache.normalize("* name (`str`): Name.", "{: #name }")
+    cache.dump(path)
+
+    warm = DocstringCache()
+    warm.load(path)
+    normalized = warm.normalize("* name (`str`): Name.", "{: #name }")
+    assert normalized == "- **name**{: #name } (`str`): Name."
+    assert (warm.hits, warm.misses) == (1, 0)
+
+
+@test("`DocstringCache.dump` should not rewrite unchanged entries.")
+@using(tmp=_temp_dir)
+def _(tmp: str) -> None:
+    path = pathlib.Path(tmp, "docstrings.json")
+    cache = DocstringCache()
+    cache.normalize("a")
+    cache.dump(path)
+    os.utime(path, ns=(0, 0))
+
+    warm = DocstringCache()
+    warm.load(path)
+    warm.normalize("a")
+    warm.dump(path)
+    cache.dump(path)
+    assert path.stat().st_mtime_ns == 0
+
+    warm.normalize("b")
+    warm.dump(path)
+    assert path.stat().st_mtime_ns != 0
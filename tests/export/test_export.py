@@ -0,0 +1,43 @@
+import io
+import json
+
+from inari.export import export, iter_modules
+from inari.selectors import Selector
+from ward import test
+
+from ..rebuild import sample_package
+
+
+@test("`export` should write a line of JSON for each collected object.")
+def _() -> None:
+    out = io.StringIO()
+    count = export([sample_package], out)
+
+    records = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert len(records) == count
+    assert [(r["name"], r["kind"]) for r in records] == [
+        ("tests.rebuild.sample_package", "module"),
+        ("tests.rebuild.sample_package.alpha", "module"),
+        ("tests.rebuild.sample_package.alpha.Alpha", "class"),
+        ("tests.rebuild.sample_package.alpha.Alpha.run", "method"),
+        ("tests.rebuild.sample_package.beta", "module"),
+        ("tests.rebuild.sample_package.beta.Beta", "class"),
+        ("tests.rebuild.sample_package.gamma", "module"),
+        ("tests.rebuild.sample_package.gamma.gamma", "function"),
+    ]
+    beta = records[5]
+    assert beta["bases"] == ["tests.rebuild.sample_package.alpha.Alpha"]
+    assert beta["docstring"] == "Derived class."
+    assert beta["path"] == "/tests/rebuild/sample_package/beta-py#Beta"
+    assert records[-1]["signature"] == "() -> None"
+
+
+@test("`iter_modules` should skip excluded modules.")
+def _() -> None:
+    selector = Selector(exclude=["*.beta"])
+    names = [c.mod.__name__ for c in iter_modules(sample_package, selector)]
+    assert names == [
+        "tests.rebuild.sample_package",
+        "tests.rebuild.sample_package.alpha",
+        "tests.rebuild.sample_package.gamma",
+    ]
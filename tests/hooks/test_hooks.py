@@ -0,0 +1,61 @@
+import pathlib
+from typing import Optional
+
+from inari.build import make_roots, write_roots
+from inari.collectors import FunctionCollector
+from inari.hooks import EVENTS, Event, Hooks, hooks
+from ward import raises, test, using
+
+from ..collectors.fixtures import _temp_dir
+from ..rebuild import sample_package
+
+
+@test("`Hooks` should register callbacks only for known events.")
+def _() -> None:
+    local = Hooks()
+    assert not local
+    with raises(ValueError):
+        local.register("unknown", print)
+
+    @local.on("page_written")
+    def callback(event: Event) -> None:
+        pass
+
+    assert local.wants("page_written")
+    assert not local.wants("build_finished")
+    local.unregister("page_written", callback)
+    assert not local
+
+
+@test("Builds should emit events with timing, and apply returned content.")
+@using(out_dir=_temp_dir)
+def _(out_dir: str) -> None:
+    events: list[Event] = []
+
+    def record(event: Event) -> Optional[str]:
+        events.append(event)
+        if event.name == "symbol_rendered" and isinstance(
+            event.collector, FunctionCollector
+        ):
+            return event.content + "\n\nPost-processed."
+        return None
+
+    for name in EVENTS:
+        hooks.register(name, record)
+    try:
+        roots = make_roots([sample_package], out_dir)
+        write_roots(roots)
+    finally:
+        hooks.clear()
+
+    names = [e.name for e in events]
+    assert set(names) == set(EVENTS)
+    assert names[0] == "module_discovered"
+    assert names[-1] == "build_finished"
+    assert events[-1].collector == roots
+    assert all(e.seconds >= 0 for e in events)
+
+    written = {e.path: e.content for e in events if e.name == "page_written"}
+    gamma = pathlib.Path(out_dir, "sample_package", "gamma-py.md")
+    assert written[gamma] == gamma.read_text()
+    assert "Post-processed." in gamma.read_text()
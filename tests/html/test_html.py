@@ -0,0 +1,86 @@
+import pathlib
+import zipfile
+
+from inari.build import make_roots
+from inari.html import HtmlConverter, cache_path, write_html_roots
+from inari.sinks import ZipSink
+from ward import test, using
+
+from ..collectors.fixtures import _temp_dir
+from ..rebuild import sample_package
+
+
+@test("`write_html_roots` should write HTML pages linking to each other.")
+@using(out_dir=_temp_dir)
+def _(out_dir: str) -> None:
+    roots = make_roots([sample_package], out_dir, split_classes=True)
+    write_html_roots(roots, out_dir)
+
+    package_dir = pathlib.Path(out_dir, "sample_package")
+    index = (package_dir / "index.html").read_text()
+    assert '<a href="beta-py.html">' in index
+    beta = (package_dir / "beta-py.html").read_text()
+    assert "<title>tests.rebuild.sample_package.beta</title>" in beta
+    beta_cls = (package_dir / "beta-py" / "Beta-cls.html").read_text()
+    assert '<h3 id="Beta">' in beta_cls
+    assert 'href="../alpha-py/Alpha-cls.html#Alpha"' in beta_cls
+    alpha_cls = (package_dir / "alpha-py" / "Alpha-cls.html").read_text()
+    assert 'href="#Alpha.run"' in alpha_cls
+    assert 'href="Alpha-cls.html#Alpha.run"' not in alpha_cls
+    assert cache_path(out_dir).is_file()
+
+
+@test("`write_html_roots` should reuse converted fragments of the previous build.")
+@using(out_dir=_temp_dir)
+def _(out_dir: str) -> None:
+    roots = make_roots([sample_package], out_dir)
+    first = write_html_roots(roots, out_dir)
+    assert first.misses > 0
+
+    roots = make_roots([sample_package], out_dir)
+    second = write_html_roots(roots, out_dir)
+    assert second.misses == 0
+    assert second.hits == first.hits + first.misses
+
+
+@test("`write_html_roots` should remove pages of deleted modules and classes.")
+@using(out_dir=_temp_dir)
+def _(out_dir: str) -> None:
+    package_dir = pathlib.Path(out_dir, "sample_package")
+    write_html_roots(make_roots([sample_package], out_dir, split_classes=True), out_dir)
+    stale = [
+        package_dir / "deleted-py.html",
+        package_dir / "alpha-py" / "Gone-cls.html",
+    ]
+    for page in stale:
+        page.write_text("stale")
+
+    write_html_roots(make_roots([sample_package], out_dir, split_classes=True), out_dir)
+    assert not any(page.exists() for page in stale)
+    assert (package_dir / "index.html").is_file()
+    assert (package_dir / "alpha-py" / "Alpha-cls.html").is_file()
+
+
+@test("`write_html_roots` should write pages through sinks of collectors.")
+@using(tmp=_temp_dir)
+def _(tmp: str) -> None:
+    out_dir = pathlib.Path(tmp, "docs")
+    archive = pathlib.Path(tmp, "docs.zip")
+    sink = ZipSink(archive, out_dir)
+    write_html_roots(make_roots([sample_package], out_dir, sink=sink), out_dir)
+    sink.close()
+
+    assert not any(out_dir.glob("**/*.html"))
+    with zipfile.ZipFile(archive) as z:
+        assert "sample_package/beta-py.html" in z.namelist()
+        index = z.read("sample_package/index.html").decode("utf-8")
+    assert '<a href="beta-py.html">' in index
+
+
+@test("`HtmlConverter` should convert attr-list anchors.")
+def _() -> None:
+    converter = HtmlConverter()
+    converted = converter.convert("### Foo {: #Foo }")
+    assert converted == '<h3 id="Foo">Foo</h3>'
+    assert converter.convert("### Foo {: #Foo }") == converted
+    assert (converter.hits, converter.misses) == (1, 1)
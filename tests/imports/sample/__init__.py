@@ -0,0 +1,3 @@
+"""A package importing its dependency on import."""
+
+from . import dependency  # noqa: F401
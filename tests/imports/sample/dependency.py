@@ -0,0 +1 @@
+"""Imported by the package."""
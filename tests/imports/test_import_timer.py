@@ -0,0 +1,75 @@
+import importlib
+import os
+import pathlib
+import sys
+
+from inari.collectors import ModuleCollector
+from inari.imports import ImportTimer
+from ward import test
+
+from ..collectors.fixtures import _temp_dir
+
+SAMPLE = "tests.imports.sample"
+
+
+@test("`ImportTimer` should record first imports with transitive modules.")
+def _() -> None:
+    for name in [SAMPLE, f"{SAMPLE}.dependency"]:
+        sys.modules.pop(name, None)
+    timer = ImportTimer()
+    mod = timer.import_module(SAMPLE)
+    timer.import_module(f"{SAMPLE}.dependency")
+    timer.reload(mod)
+
+    assert list(timer.imports) == [SAMPLE]
+    assert f"{SAMPLE}.dependency" in timer.transitive[SAMPLE]
+    assert timer.ranking() == [SAMPLE]
+    assert timer.total(SAMPLE) == timer.imports[SAMPLE] + timer.reloads[SAMPLE]
+
+
+@test("`ImportTimer` should find modules slower than the threshold.")
+def _() -> None:
+    timer = ImportTimer()
+    timer.imports.update({"a": 0.5, "b": 0.1})
+    timer.reloads.update({"b": 0.6, "c": 0.01})
+    assert timer.ranking() == ["b", "a", "c"]
+    assert timer.slow_modules(0.2) == ["b", "a"]
+    lines = timer.report(top=2).splitlines()
+    assert lines[2] == "  100.0ms   600.0ms  b"
+    assert len(lines) == 4
+
+
+@test("`ImportTimer.refresh` should reload modules only if sources are changed.")
+def _(temp_dir: str = _temp_dir) -> None:
+    path = pathlib.Path(temp_dir, "refreshed_module.py")
+    path.write_text("VALUE = 1\n", encoding="utf-8")
+    sys.path.insert(0, temp_dir)
+    try:
+        timer = ImportTimer()
+        mod = timer.import_module("refreshed_module")
+        assert not timer.refresh(mod)
+        assert not timer.refresh(mod)
+
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        # touched, but not changed.
+        assert not timer.refresh(mod)
+
+        path.write_text("VALUE = 22\n", encoding="utf-8")
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2 * 10**9))
+        assert timer.refresh(mod)
+        assert mod.VALUE == 22
+        assert list(timer.reloads) == ["refreshed_module"]
+    finally:
+        sys.path.remove(temp_dir)
+        sys.modules.pop("refreshed_module", None)
+
+
+@test("`ModuleCollector` should keep members of unchanged modules.")
+def _(temp_dir: str = _temp_dir) -> None:
+    mod = importlib.import_module(SAMPLE)
+    collector = ModuleCollector(mod, temp_dir)
+    collector._prepare_docs()
+    variables = collector.variables
+    collector._prepare_docs()
+    assert collector.variables is variables
@@ -0,0 +1,99 @@
+import os
+from os.path import isfile
+
+from inari.collectors import ModuleCollector
+from inari.index import SymbolIndex, index_path
+from inari.selectors import Selector
+from ward import test, using
+
+from ..collectors import fixtures as target_module
+from ..rebuild import sample_package
+
+
+@test("`update` should index the module and its members.")
+@using(out_dir=target_module._temp_dir)
+def _(out_dir: str) -> None:
+    collector = ModuleCollector(target_module, out_dir, {})
+    collector.write()
+    index = SymbolIndex()
+    index.update(collector, out_dir)
+    symbols = {s.name: s for s in index.symbols()}
+
+    module = symbols["tests.collectors.fixtures"]
+    assert module.kind == "module"
+    assert module.summary == "This module itself is also a test fixture."
+    assert module.page == "fixtures-py.md"
+    cls = symbols["tests.collectors.fixtures.TargetClass"]
+    assert cls.kind == "class"
+    assert cls.anchor == "TargetClass"
+    assert symbols["tests.collectors.fixtures.TargetClass.method1"].kind == "method"
+    assert symbols["tests.collectors.fixtures.target_function"].kind == "function"
+    assert symbols["tests.collectors.fixtures.target_variable"].kind == "variable"
+    assert index.name_to_path() == collector.name_to_path
+
+
+@test("`dump` and `load` should keep symbols, and unchanged modules are reused.")
+@using(out_dir=target_module._temp_dir)
+def _(out_dir: str) -> None:
+    collector = ModuleCollector(target_module, out_dir, {})
+    collector.write()
+    path = index_path(out_dir)
+    index = SymbolIndex()
+    index.update(collector, out_dir)
+    index.dump(path)
+    assert isfile(path)
+
+    loaded = SymbolIndex.load(path)
+    assert loaded.modules == index.modules
+    cached = loaded.modules["tests.collectors.fixtures"]
+    loaded.update(collector, out_dir)
+    assert loaded.modules["tests.collectors.fixtures"] is cached
+
+
+@test("`dump` should not rewrite the file if symbols are unchanged.")
+@using(out_dir=target_module._temp_dir)
+def _(out_dir: str) -> None:
+    collector = ModuleCollector(target_module, out_dir, {})
+    collector.write()
+    path = index_path(out_dir)
+    index = SymbolIndex()
+    index.update(collector, out_dir)
+    index.dump(path)
+    os.utime(path, ns=(0, 0))
+
+    SymbolIndex.load(path).dump(path)
+    assert os.stat(path).st_mtime_ns == 0
+    SymbolIndex().dump(path)
+    assert os.stat(path).st_mtime_ns != 0
+
+
+@test("`load` should return an empty index if the file is missing.")
+@using(out_dir=target_module._temp_dir)
+def _(out_dir: str) -> None:
+    assert SymbolIndex.load(index_path(out_dir)).modules == {}
+
+
+@test("`update` should refresh symbols if options of collectors are changed.")
+@using(out_dir=target_module._temp_dir)
+def _(out_dir: str) -> None:
+    index = SymbolIndex()
+    collector = ModuleCollector(sample_package, out_dir, {})
+    collector.write()
+    index.update(collector, out_dir)
+    alpha = "tests.rebuild.sample_package.alpha.Alpha"
+    symbols = {s.name: s for s in index.symbols()}
+    assert symbols[alpha].page == "sample_package/alpha-py.md"
+    assert f"{alpha}.run" in symbols
+
+    collector = ModuleCollector(
+        sample_package,
+        out_dir,
+        {},
+        split_classes=True,
+        symbol_selector=Selector(exclude=["*.run"]),
+    )
+    collector.write()
+    index.update(collector, out_dir)
+    symbols = {s.name: s for s in index.symbols()}
+    assert symbols[alpha].page == "sample_package/alpha-py/Alpha-cls.md"
+    assert f"{alpha}.run" not in symbols
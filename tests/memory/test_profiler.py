@@ -0,0 +1,33 @@
+import sys
+
+from inari.build import make_roots, write_roots
+from inari.memory import MemoryProfiler
+from ward import test, using
+
+from ..collectors.fixtures import _temp_dir
+from ..rebuild import sample_package
+
+
+@test("Reports should have phases, and growth since the previous build.")
+@using(out_dir=_temp_dir)
+def _(out_dir: str) -> None:
+    profiler = MemoryProfiler(top=3)
+    try:
+        for _ in range(2):
+            profiler.start()
+            profiler.phase("import")
+            write_roots(make_roots([sample_package], out_dir), profiler)
+            report = profiler.finish()
+    finally:
+        profiler.stop()
+
+    for phase in ["import", "collect", "write"]:
+        assert f"\n{phase} " in report
+    assert "top allocation sites:" in report
+    assert "retained by module:" in report
+    section = report.split("retained by module:\n")[1].split("growth")[0]
+    for line in section.splitlines():
+        name = line.split()[0]
+        assert name in sys.modules or name.startswith("<")
+    assert "growth since the previous build:" in report
+    assert profiler.growth is not None
@@ -0,0 +1,50 @@
+import pathlib
+
+from inari.build import make_roots, update_index, write_roots
+from inari.nav import pages_from_collectors, pages_from_index, render_nav, write_nav
+from ward import test, using
+
+from ..collectors.fixtures import _temp_dir
+from ..rebuild import sample_package
+
+
+@test("`render_nav` should nest submodules and classes under their parents.")
+def _() -> None:
+    pages = {
+        "pkg": "pkg/index.md",
+        "pkg.mod": "pkg/mod-py.md",
+        "pkg.mod.Cls": "pkg/mod-py/Cls-cls.md",
+        "pkg.sub": "pkg/sub/index.md",
+        "pkg.sub.leaf": "pkg/sub/leaf-py.md",
+        "pkg.mod_b": "pkg/mod_b-py.md",
+    }
+    assert render_nav(pages, "pkg") == "\n".join(
+        [
+            "- [pkg](index.md)",
+            "    - [mod](mod-py.md)",
+            "        - [Cls](mod-py/Cls-cls.md)",
+            "    - [mod_b](mod_b-py.md)",
+            "    - [sub](sub/index.md)",
+            "        - [leaf](sub/leaf-py.md)",
+            "",
+        ]
+    )
+
+
+@test("`write_nav` should write the same entries from collectors and the index.")
+@using(out_dir=_temp_dir)
+def _(out_dir: str) -> None:
+    roots = make_roots([sample_package], out_dir, split_classes=True)
+    write_roots(roots)
+    index = update_index(roots, out_dir)
+    pages = pages_from_collectors(roots, out_dir)
+    assert pages == pages_from_index(index)
+    assert pages["tests.rebuild.sample_package.alpha.Alpha"] == (
+        "sample_package/alpha-py/Alpha-cls.md"
+    )
+
+    assert write_nav(pages, out_dir, "sample_package/SUMMARY.md")
+    assert not write_nav(pages, out_dir, "sample_package/SUMMARY.md")
+    nav = pathlib.Path(out_dir, "sample_package", "SUMMARY.md").read_text()
+    assert nav.startswith("- [tests.rebuild.sample_package](index.md)\n")
+    assert "        - [Alpha](alpha-py/Alpha-cls.md)\n" in nav
@@ -0,0 +1 @@
+"""A package for testing targeted rebuilds."""
@@ -0,0 +1,8 @@
+"""Linked from `tests.rebuild.sample_package.beta` ."""
+
+
+class Alpha:
+    """Base class, running `tests.rebuild.sample_package.alpha.Alpha.run` ."""
+
+    def run(self) -> None:
+        """Linked from `tests.build.other_package` ."""
@@ -0,0 +1,7 @@
+"""Refers to `tests.rebuild.sample_package.alpha.Alpha` ."""
+
+from .alpha import Alpha
+
+
+class Beta(Alpha):
+    """Derived class."""
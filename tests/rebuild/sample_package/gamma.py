@@ -0,0 +1,5 @@
+"""Independent module."""
+
+
+def gamma() -> None:
+    """Does nothing."""
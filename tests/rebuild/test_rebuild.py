@@ -0,0 +1,106 @@
+import importlib
+import os
+import pathlib
+import subprocess
+import sys
+from os.path import isfile
+
+from inari.collectors import ModuleCollector
+from inari.index import SymbolIndex, index_path
+from inari.rebuild import rebuild_modules, rebuild_since
+from ward import test, using
+
+from ..collectors.fixtures import _temp_dir
+from . import sample_package
+
+
+def _full_build(out_dir: str) -> pathlib.Path:
+    collector = ModuleCollector(sample_package, out_dir)
+    collector.write()
+    index = SymbolIndex()
+    index.update(collector, out_dir)
+    index.dump(index_path(out_dir))
+    return pathlib.Path(out_dir, "sample_package")
+
+
+@test("`rebuild_modules` should rebuild changed modules and their dependents.")
+@using(out_dir=_temp_dir)
+def _(out_dir: str) -> None:
+    package_dir = _full_build(out_dir)
+    for page in ["alpha-py.md", "beta-py.md", "gamma-py.md"]:
+        (package_dir / page).unlink()
+
+    rebuilt = rebuild_modules(
+        [sample_package], out_dir, {"tests.rebuild.sample_package.alpha"}
+    )
+
+    assert sorted(c.mod.__name__ for c in rebuilt) == [
+        "tests.rebuild.sample_package.alpha",
+        "tests.rebuild.sample_package.beta",
+    ]
+    assert isfile(package_dir / "alpha-py.md")
+    assert isfile(package_dir / "beta-py.md")
+    assert not isfile(package_dir / "gamma-py.md")
+    beta = (package_dir / "beta-py.md").read_text()
+    assert "[`Alpha `](alpha-py.md#Alpha)" in beta
+
+
+@test("`rebuild_modules` should remove pages of deleted modules.")
+@using(out_dir=_temp_dir)
+def _(out_dir: str) -> None:
+    package_dir = _full_build(out_dir)
+    name = "tests.rebuild.sample_package.gamma"
+    rebuild_modules([sample_package], out_dir, {name}, deleted={name})
+
+    assert not isfile(package_dir / "gamma-py.md")
+    assert name not in SymbolIndex.load(index_path(out_dir)).modules
+
+
+@test("`rebuild_since` should relink dependents of renamed modules.")
+@using(temp_dir=_temp_dir)
+def _(temp_dir: str) -> None:
+    def git(*args: str) -> None:
+        subprocess.run(
+            ["git", "-c", "user.name=inari", "-c", "user.email=inari@example.com"]
+            + list(args),
+            cwd=temp_dir,
+            check=True,
+            capture_output=True,
+        )
+
+    package = pathlib.Path(temp_dir, "renamed_package")
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "old.py").write_text('def f() -> None:\n    """Renamed."""\n')
+    (package / "user.py").write_text('"""Uses `renamed_package.old.f` ."""\n')
+    git("init", "-q")
+    git("add", ".")
+    git("commit", "-q", "-m", "init")
+    cwd = os.getcwd()
+    sys.path.insert(0, temp_dir)
+    try:
+        out_dir = pathlib.Path(temp_dir, "out")
+        collector = ModuleCollector(importlib.import_module("renamed_package"), out_dir)
+        collector.write()
+        index = SymbolIndex()
+        index.update(collector, out_dir)
+        index.dump(index_path(out_dir))
+        user_page = out_dir / "renamed_package" / "user-py.md"
+        assert "(old-py.md#f)" in user_page.read_text()
+
+        git("mv", "renamed_package/old.py", "renamed_package/new.py")
+        git("commit", "-q", "-m", "rename")
+        importlib.invalidate_caches()
+        os.chdir(temp_dir)
+        root = importlib.import_module("renamed_package")
+        rebuild_since([root], out_dir, "HEAD~1")
+    finally:
+        os.chdir(cwd)
+        sys.path.remove(temp_dir)
+        for name in list(sys.modules):
+            if name.split(".")[0] == "renamed_package":
+                del sys.modules[name]
+
+    assert "renamed_package.old" not in SymbolIndex.load(index_path(out_dir)).modules
+    assert "old-py.md" not in user_page.read_text()
+    assert isfile(out_dir / "renamed_package" / "new-py.md")
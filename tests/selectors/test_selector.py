@@ -0,0 +1,47 @@
+from inari.collectors import ModuleCollector
+from inari.selectors import Selector
+from ward import each, test, using
+
+from ..collectors import fixtures as target_module
+from ..rebuild import sample_package
+
+
+@test("`{name}` should match `{include}` excluding `{exclude}` : `{result}` .")
+@using(
+    include=each(["pkg.*"], [], ["re:pkg\\.(foo|bar)"], ["pkg.*"]),
+    exclude=each([], ["pkg.foo"], [], ["*.legacy*"]),
+    name=each("pkg.foo.Bar", "pkg.foo", "pkg.bar", "pkg.legacy.Bar"),
+    result=each(True, False, True, False),
+)
+def _(include: list[str], exclude: list[str], name: str, result: bool) -> None:
+    assert Selector(include, exclude).match(name) is result
+
+
+@test("Packages on the way to `{include}` should be visited: `{name}` , `{result}`")
+@using(
+    include=each(["pkg.team.*"], ["pkg.team.*"], ["re:pkg\\.team\\..*"], ["*.models"]),
+    name=each("pkg", "pkg.other", "pkg", "pkg.other"),
+    result=each(True, False, True, True),
+)
+def _(include: list[str], name: str, result: bool) -> None:
+    assert Selector(include).may_contain(name) is result
+
+
+@test("Modules and symbols should be filtered by selectors.")
+@using(out_dir=target_module._temp_dir)
+def _(out_dir: str) -> None:
+    collector = ModuleCollector(
+        sample_package,
+        out_dir,
+        {},
+        module_selector=Selector(exclude=["*.gamma"]),
+        symbol_selector=Selector(exclude=["*.Beta"]),
+    )
+    collector.write()
+    submodules = [x.mod.__name__ for x in collector.submodules.values()]
+    assert "tests.rebuild.sample_package.gamma" not in submodules
+    assert "tests.rebuild.sample_package.alpha" in submodules
+    beta = next(
+        x for x in collector.submodules.values() if x.mod.__name__.endswith("beta")
+    )
+    assert beta.classes == []
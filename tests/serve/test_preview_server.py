@@ -0,0 +1,91 @@
+import importlib
+import pathlib
+import sys
+
+from inari.serve import PreviewServer, find_modules
+from ward import fixture, test, using
+
+from ..collectors.fixtures import _temp_dir
+
+PACKAGE = "tests.rebuild.sample_package"
+
+
+@fixture
+def _server() -> PreviewServer:
+    return PreviewServer([PACKAGE])
+
+
+@test("`find_modules` should list submodules without importing them.")
+def _() -> None:
+    modules = find_modules(PACKAGE)
+    assert modules == {
+        PACKAGE: "/tests/rebuild/sample_package",
+        f"{PACKAGE}.alpha": "/tests/rebuild/sample_package/alpha-py",
+        f"{PACKAGE}.beta": "/tests/rebuild/sample_package/beta-py",
+        f"{PACKAGE}.gamma": "/tests/rebuild/sample_package/gamma-py",
+    }
+
+
+@test("`PreviewServer` should render a requested page with links.")
+@using(server=_server)
+def _(server: PreviewServer) -> None:
+    assert "tests/rebuild/sample_package/index.md" in server.pages
+    doc = server.render("tests/rebuild/sample_package/beta-py.md")
+    assert doc is not None
+    assert "(alpha-py.md#Alpha)" in doc
+    assert list(server.cache) == ["tests/rebuild/sample_package/beta-py.md"]
+
+
+@test("`PreviewServer` should reuse rendered pages.")
+@using(server=_server)
+def _(server: PreviewServer) -> None:
+    page = "tests/rebuild/sample_package/gamma-py.md"
+    doc = server.render(page)
+    assert doc is not None
+    stamp, _ = server.cache[page]
+    server.cache[page] = (stamp, "cached")
+    assert server.render(page) == "cached"
+    server.cache[page] = ((0, 0), "stale")
+    assert server.render(page) == doc
+
+
+@test("`PreviewServer` should resolve names from module names.")
+@using(server=_server)
+def _(server: PreviewServer) -> None:
+    assert (
+        server.resolve(f"{PACKAGE}.alpha.Alpha")
+        == "/tests/rebuild/sample_package/alpha-py#Alpha"
+    )
+    assert server.resolve(PACKAGE) == "/tests/rebuild/sample_package"
+    assert server.resolve("unknown.name") is None
+    assert server.render("unknown-py.md") is None
+
+
+@test("`PreviewServer` should find modules added or removed while serving.")
+@using(temp_dir=_temp_dir)
+def _(temp_dir: str) -> None:
+    package = pathlib.Path(temp_dir, "previewed_package")
+    package.mkdir()
+    (package / "__init__.py").write_text('"""Previewed."""\n')
+    (package / "old.py").write_text('"""Old."""\n')
+    sys.path.insert(0, temp_dir)
+    try:
+        server = PreviewServer(["previewed_package"])
+        index = server.render("previewed_package/index.md")
+        assert index is not None and "old-py.md" in index
+        assert server.render("previewed_package/old-py.md") is not None
+
+        (package / "old.py").unlink()
+        (package / "new.py").write_text('"""New."""\n')
+        assert server.render("previewed_package/new-py.md") is not None
+        assert server.render("previewed_package/old-py.md") is None
+        assert "previewed_package/old-py.md" not in server.cache
+        index = server.render("previewed_package/index.md")
+        assert index is not None
+        assert "new-py.md" in index and "old-py.md" not in index
+    finally:
+        sys.path.remove(temp_dir)
+        for name in list(sys.modules):
+            if name.split(".")[0] == "previewed_package":
+                del sys.modules[name]
+        importlib.invalidate_caches()
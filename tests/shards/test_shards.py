@@ -0,0 +1,49 @@
+import pathlib
+
+from inari.build import make_roots, update_index, write_roots
+from inari.index import SymbolIndex, index_path
+from inari.shards import merge_shards, parse_shard, shard_of, write_shard
+from ward import raises, test, using
+
+from ..collectors.fixtures import _temp_dir
+from ..rebuild import sample_package
+
+
+def _pages(out_dir: str) -> dict[str, str]:
+    return {
+        p.relative_to(out_dir).as_posix(): p.read_text()
+        for p in pathlib.Path(out_dir).rglob("*.md")
+    }
+
+
+@test("`parse_shard` should accept shards from 1 to N.")
+def _() -> None:
+    assert parse_shard("2/4") == (2, 4)
+    for value in ["0/4", "5/4", "2"]:
+        with raises(ValueError):
+            parse_shard(value)
+    assert {shard_of("pkg.mod", 4) for _ in range(3)} == {shard_of("pkg.mod", 4)}
+
+
+@test("Merged shards should be the same as a full build.")
+@using(temp_dir=_temp_dir)
+def _(temp_dir: str) -> None:
+    full_dir = f"{temp_dir}/full"
+    out_dir = f"{temp_dir}/shards"
+    roots = make_roots([sample_package], full_dir)
+    write_roots(roots)
+    full_index = update_index(roots, full_dir)
+
+    written = []
+    for number in [1, 2, 3]:
+        written.extend(write_shard([sample_package], out_dir, (number, 3)))
+    assert sorted(c.mod.__name__ for c in written) == sorted(full_index.modules)
+
+    with raises(ValueError):
+        # `full_dir` has no partial index.
+        merge_shards(full_dir)
+    merge_shards(out_dir)
+    assert _pages(out_dir) == _pages(full_dir)
+    merged = SymbolIndex.load(index_path(out_dir))
+    assert merged.modules == full_index.modules
+    assert merged.references == full_index.references
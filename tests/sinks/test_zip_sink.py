@@ -0,0 +1,45 @@
+import pathlib
+import zipfile
+
+from inari.build import make_roots, write_roots
+from inari.sinks import ZipSink
+from ward import test, using
+
+from ..collectors.fixtures import _temp_dir
+from ..rebuild import sample_package
+
+
+@test("`ZipSink` should keep the layout of pages relative to `out_dir` .")
+@using(tmp=_temp_dir)
+def _(tmp: str) -> None:
+    out_dir = pathlib.Path(tmp, "docs")
+    archive = pathlib.Path(tmp, "docs.zip")
+    sink = ZipSink(archive, out_dir)
+    roots = make_roots([sample_package], out_dir, split_classes=True, sink=sink)
+    write_roots(roots)
+    sink.close()
+
+    assert not out_dir.exists()
+    with zipfile.ZipFile(archive) as z:
+        assert sorted(z.namelist()) == [
+            "sample_package/alpha-py.md",
+            "sample_package/alpha-py/Alpha-cls.md",
+            "sample_package/beta-py.md",
+            "sample_package/beta-py/Beta-cls.md",
+            "sample_package/gamma-py.md",
+            "sample_package/index.md",
+        ]
+        beta = z.read("sample_package/beta-py/Beta-cls.md").decode("utf-8")
+    assert "(../alpha-py/Alpha-cls.md#Alpha)" in beta
+
+
+@test("`ZipSink` should track written pages without reading the previous build.")
+@using(tmp=_temp_dir)
+def _(tmp: str) -> None:
+    sink = ZipSink(pathlib.Path(tmp, "docs.zip"), tmp)
+    page = pathlib.Path(tmp, "pkg", "index.md")
+    assert sink.read(page) is None
+    assert not sink.exists(page)
+    sink.write(page, "# Module pkg")
+    assert sink.exists(page)
+    sink.close()
@@ -0,0 +1,51 @@
+import pathlib
+
+from inari.build import make_roots
+from inari.store import DocStore, write_store
+from ward import test, using
+
+from ..collectors.fixtures import _temp_dir
+from ..rebuild import sample_package
+
+
+@test("`write_store` should store symbols with rendered fragments.")
+@using(out_dir=_temp_dir)
+def _(out_dir: str) -> None:
+    path = pathlib.Path(out_dir, "inari.sqlite3")
+    updated = write_store(make_roots([sample_package], out_dir), path)
+    assert len(updated) == 4
+
+    store = DocStore(path)
+    beta = store.get("tests.rebuild.sample_package.beta.Beta")
+    assert beta is not None
+    assert beta.kind == "class"
+    assert beta.module == "tests.rebuild.sample_package.beta"
+    assert beta.bases == ["tests.rebuild.sample_package.alpha.Alpha"]
+    assert "(alpha-py.md#Alpha)" in beta.fragment
+    assert store.get("unknown") is None
+    assert [s.name for s in store.by_module("tests.rebuild.sample_package.gamma")] == [
+        "tests.rebuild.sample_package.gamma",
+        "tests.rebuild.sample_package.gamma.gamma",
+    ]
+    assert [s.name for s in store.by_kind("class")] == [
+        "tests.rebuild.sample_package.alpha.Alpha",
+        "tests.rebuild.sample_package.beta.Beta",
+    ]
+    store.close()
+
+
+@test("`write_store` should skip modules with the same digest.")
+@using(out_dir=_temp_dir)
+def _(out_dir: str) -> None:
+    path = pathlib.Path(out_dir, "inari.sqlite3")
+    write_store(make_roots([sample_package], out_dir), path)
+    store = DocStore(path)
+    with store.connection:
+        store.connection.execute(
+            "UPDATE modules SET digest = '' WHERE name = ?",
+            ("tests.rebuild.sample_package.gamma",),
+        )
+    store.close()
+
+    updated = write_store(make_roots([sample_package], out_dir), path)
+    assert updated == ["tests.rebuild.sample_package.gamma"]